@@ -6,6 +6,9 @@
 # The full license is in the file LICENSE, distributed with this software.
 # ----------------------------------------------------------------------------
 
+import csv
+from io import StringIO
+
 from . import base
 from . import sql_connection
 from . import process
@@ -559,113 +562,21 @@ class SampleComposition(Composition):
         ----------
         content: str
             The new contents of the SampleComposition
+
+        Returns
+        -------
+        str, bool
+            The new contents of the SampleComposition and whether they are
+            a known sample or control
+
+        See Also
+        --------
+        labman.db.process.SamplePlatingProcess.update_wells
         """
-        with sql_connection.TRN as TRN:
-            # First check if the previous content matches the new one. If the
-            # previous content is a experimental sample, then to be the same
-            # content the sample_id mush match. If it is not an experimental
-            # sample, then the sample composition type must match
-            sc_type = self.sample_composition_type
-            contents_ok = True
-            if not ((sc_type == 'experimental sample' and
-                     self.content == content) or (sc_type == content)):
-                # The contents are different, we need to update
-                # Identify if the content is a control or experimental sample
-                sql = """SELECT sample_composition_type_id
-                         FROM labman.sample_composition_type
-                         WHERE external_id = %s"""
-                TRN.add(sql, [content])
-                res = TRN.execute_fetchindex()
-                well = self.container
-                if res:
-                    # The content is a control
-                    # res[0][0] -> Only 1 row and 1 column as result from the
-                    # previous SQL query
-                    sc_type_id = res[0][0]
-                    content = '%s.%s.%s' % (content, well.plate.id,
-                                            well.well_id)
-                    sql_args = [sc_type_id, None, content, self.id]
-                else:
-                    # The content is a sample
-                    es_sci = self._get_sample_composition_type_id(
-                        'experimental sample')
-                    # Check if the sample exists in the DB
-                    sql = """SELECT EXISTS(SELECT *
-                                           FROM qiita.study_sample
-                                           WHERE sample_id = %s)"""
-                    TRN.add(sql, [content])
-                    if TRN.execute_fetchlast():
-                        # Check if the sample has been plated in the same
-                        # plate before or not
-                        sql = """SELECT well_id, sample_composition_id,
-                                        sample_id
-                                 FROM labman.well
-                                    JOIN labman.composition
-                                        USING (container_id)
-                                    JOIN labman.sample_composition
-                                        USING (composition_id)
-                                 WHERE plate_id = %s AND sample_id = %s"""
-                        TRN.add(sql, [well.plate.id, content])
-                        res = TRN.execute_fetchindex()
-                        if res:
-                            # Update the content values to include the
-                            # plate and well id
-                            sql = """UPDATE labman.sample_composition
-                                        SET content = %s
-                                        WHERE sample_composition_id = %s"""
-                            for well_id, sc_id, s_id in res:
-                                w = container_mod.Well(well_id)
-                                TRN.add(sql, ['%s.%s.%s' % (
-                                    s_id, w.plate.id, w.well_id), sc_id])
-                            orig_content = content
-                            content = '%s.%s.%s' % (content, well.plate.id,
-                                                    well.well_id)
-                            sql_args = [es_sci, orig_content, content, self.id]
-                        else:
-                            # There is no need to update the content value
-                            sql_args = [es_sci, content, content, self.id]
-                    else:
-                        # If it doesn't exist put the sample in the content
-                        # but do not put it on the sample_id
-                        contents_ok = False
-                        sql_args = [es_sci, None, content, self.id]
-
-                old_sample = self.sample_id
-
-                sql = """UPDATE labman.sample_composition
-                         SET sample_composition_type_id = %s,
-                             sample_id = %s,
-                             content = %s
-                         WHERE sample_composition_id = %s"""
-                TRN.add(sql, sql_args)
-                TRN.execute()
-
-                if old_sample is not None:
-                    # This means that we had another experimental sample
-                    # in this plate before, check if the sample appears in
-                    # any other well
-                    sql = """SELECT sample_composition_id
-                             FROM labman.well
-                                JOIN labman.composition USING (container_id)
-                                JOIN labman.sample_composition
-                                    USING (composition_id)
-                                WHERE plate_id = %s AND sample_id = %s"""
-                    TRN.add(sql, [well.plate.id, old_sample])
-                    res = TRN.execute_fetchflatten()
-                    if len(res) == 1:
-                        # The sample is present in another well AND only in
-                        # a single other other well (hence the check == 1)
-                        # This means that we can revert the content of the
-                        # other well to match the sample_id
-                        sql = """UPDATE labman.sample_composition
-                                    SET content = sample_id
-                                    WHERE sample_composition_id = %s"""
-                        TRN.add(sql, [res[0]])
-                        TRN.execute()
-            else:
-                # cover the case in which the first thing plate is a blank
-                content = self.content
-        return content, contents_ok
+        with sql_connection.TRN:
+            well = self.container
+            return self.upstream_process.update_wells(
+                [(well.row, well.column, content)])[0]
 
 
 class GDNAComposition(Composition):
@@ -1047,6 +958,48 @@ class PoolComposition(Composition):
                 result.append(PoolComposition(res['pool_composition_id']))
         return result
 
+    @staticmethod
+    def list_pools():
+        """Generates a list of pools with some information about them
+
+        Returns
+        -------
+        list of dicts
+            The list of pool information with the structure:
+            [{'pool_composition_id': int, 'external_id': str,
+              'is_plate_pool': bool, 'upstream_process_id': int,
+              'leaf_composition_type': str}]
+            Ordered by pool_composition_id
+        """
+        with sql_connection.TRN as TRN:
+            sql = """SELECT pc.pool_composition_id, t.external_id,
+                            COALESCE(fct.description != 'pool', TRUE)
+                                AS is_plate_pool,
+                            c.upstream_process_id,
+                            lct.description AS leaf_composition_type
+                     FROM labman.pool_composition pc
+                        JOIN labman.composition c USING (composition_id)
+                        JOIN labman.tube t USING (container_id)
+                        LEFT JOIN labman.composition_type lct
+                            ON lct.composition_type_id =
+                                pc.leaf_composition_type_id
+                        LEFT JOIN LATERAL (
+                            SELECT ic.composition_type_id
+                            FROM labman.pool_composition_components pcc
+                                JOIN labman.composition ic
+                                    ON ic.composition_id =
+                                        pcc.input_composition_id
+                            WHERE pcc.output_pool_composition_id =
+                                pc.pool_composition_id
+                            ORDER BY pcc.pool_composition_components_id
+                            LIMIT 1) fc ON TRUE
+                        LEFT JOIN labman.composition_type fct
+                            ON fct.composition_type_id =
+                                fc.composition_type_id
+                     ORDER BY pc.pool_composition_id"""
+            TRN.add(sql)
+            return [dict(r) for r in TRN.execute_fetchindex()]
+
     @classmethod
     def create(cls, process, container, volume):
         """Creates a new pool composition
@@ -1118,10 +1071,89 @@ class PoolComposition(Composition):
         -------
         True if pool components are PoolCompositions, else False
         """
-        composition_components = [x["composition"] for x in self.components]
-        component_type = self.get_components_type(composition_components)
-        result = component_type != PoolComposition
-        return result
+        with sql_connection.TRN as TRN:
+            # Only the type of the first component is checked, as all the
+            # components of a pool have the same type
+            sql = """SELECT ct.description
+                     FROM labman.pool_composition_components pcc
+                        JOIN labman.composition c
+                            ON c.composition_id = pcc.input_composition_id
+                        JOIN labman.composition_type ct
+                            USING (composition_type_id)
+                     WHERE pcc.output_pool_composition_id = %s
+                     ORDER BY pcc.pool_composition_components_id
+                     LIMIT 1"""
+            TRN.add(sql, [self.id])
+            return TRN.execute_fetchlast() != 'pool'
+
+    @property
+    def leaf_composition_type(self):
+        """The composition type of the compositions at the leaves of the pool
+
+        The leaves are the compositions reached by descending through the
+        pools nested in this pool, e.g. '16S library prep' or 'shotgun library
+        prep'
+
+        Returns
+        -------
+        str or None
+            The description of the composition type, None if the pool has no
+            components yet
+        """
+        with sql_connection.TRN as TRN:
+            sql = """SELECT ct.description
+                     FROM labman.pool_composition pc
+                        LEFT JOIN labman.composition_type ct
+                            ON ct.composition_type_id =
+                                pc.leaf_composition_type_id
+                     WHERE pc.pool_composition_id = %s"""
+            TRN.add(sql, [self.id])
+            return TRN.execute_fetchlast()
+
+    def get_tree(self):
+        """Returns all the components of the pool, descending into the pools
+        nested in it
+
+        Returns
+        -------
+        list of dicts
+            The components of the pool with the structure:
+            [{'depth': int, 'output_pool_composition_id': int,
+              'composition_id': int, 'composition_type': str,
+              'input_volume': float, 'percentage_of_output': float,
+              'is_leaf': bool}]
+            where depth is 1 for the components of this pool, 2 for the
+            components of the pools in it, etc. Ordered by depth and by the
+            order in which the components were added to their pools
+        """
+        with sql_connection.TRN as TRN:
+            sql = """WITH RECURSIVE tree AS (
+                        SELECT 1 AS depth, pcc.*
+                        FROM labman.pool_composition_components pcc
+                        WHERE pcc.output_pool_composition_id = %s
+                        UNION ALL
+                        SELECT t.depth + 1, pcc.*
+                        FROM tree t
+                            JOIN labman.pool_composition pc
+                                ON pc.composition_id = t.input_composition_id
+                            JOIN labman.pool_composition_components pcc
+                                ON pcc.output_pool_composition_id =
+                                    pc.pool_composition_id)
+                     SELECT t.depth, t.output_pool_composition_id,
+                            t.input_composition_id AS composition_id,
+                            ct.description AS composition_type,
+                            t.input_volume, t.percentage_of_output,
+                            ipc.pool_composition_id IS NULL AS is_leaf
+                     FROM tree t
+                        JOIN labman.composition c
+                            ON c.composition_id = t.input_composition_id
+                        JOIN labman.composition_type ct
+                            USING (composition_type_id)
+                        LEFT JOIN labman.pool_composition ipc
+                            ON ipc.composition_id = t.input_composition_id
+                     ORDER BY t.depth, t.pool_composition_components_id"""
+            TRN.add(sql, [self.id])
+            return [dict(r) for r in TRN.execute_fetchindex()]
 
 
 class PrimerSet(base.LabmanObject):
@@ -1154,6 +1186,252 @@ class PrimerSet(base.LabmanObject):
             TRN.add(sql)
             return [dict(r) for r in TRN.execute_fetchindex()]
 
+    # Accepted headers of the barcode files, in lower case
+    _BARCODE_COLUMNS = {
+        'barcode': ('barcode', 'barcodesequence', 'barcode_seq'),
+        'plate': ('primer_plate', 'plate'),
+        'well': ('well_id', 'well'),
+        'external_id': ('external_id', 'name')}
+
+    @staticmethod
+    def parse_barcodes(contents):
+        """Parses a primer set barcode file
+
+        Parameters
+        ----------
+        contents : str
+            The contents of the file, as a comma or tab separated file with a
+            header row. The barcode (or BarcodeSequence), primer_plate (or
+            plate) and well_id (or well) columns are required and the
+            external_id (or name) column is optional
+
+        Returns
+        -------
+        list of dict
+            The line number, plate, well, row, column, barcode and external
+            id of each row of the file
+
+        Raises
+        ------
+        ValueError
+            If the file doesn't have the required columns or any of its rows
+            is not valid
+        """
+        lines = contents.splitlines()
+        header = lines[0] if lines else ''
+        reader = csv.reader(lines, delimiter='\t' if '\t' in header else ',')
+        columns = [c.strip().lower() for c in next(reader, [])]
+        indices = {}
+        for key, names in PrimerSet._BARCODE_COLUMNS.items():
+            for name in names:
+                if name in columns:
+                    indices[key] = columns.index(name)
+                    break
+        missing = [k for k in ('barcode', 'plate', 'well') if k not in indices]
+        if missing:
+            raise ValueError('The barcode file is missing the required '
+                             'columns: %s' % ', '.join(missing))
+
+        records = []
+        errors = []
+        seen = {}
+        for line_num, values in enumerate(reader, start=2):
+            if not any(v.strip() for v in values):
+                continue
+            record = {'line': line_num}
+            for key, idx in indices.items():
+                value = values[idx].strip() if len(values) > idx else ''
+                record[key] = value if value else None
+            record.setdefault('external_id', None)
+            if record['plate'] is None or record['well'] is None:
+                errors.append('Line %d: missing plate or well' % line_num)
+                continue
+            if record['barcode'] is None or len(record['barcode']) > 20:
+                errors.append('Line %d: the barcode must have between 1 and '
+                              '20 characters' % line_num)
+                continue
+            try:
+                record['row'], record['column'] = \
+                    container_mod.Well.parse_well_id(record['well'])
+            except ValueError as e:
+                errors.append('Line %d: %s' % (line_num, e))
+                continue
+            key = (record['plate'], record['row'], record['column'])
+            if key in seen:
+                errors.append('Line %d: well %s of plate %s is already '
+                              'listed in line %d' % (
+                                  line_num, record['well'], record['plate'],
+                                  seen[key]))
+                continue
+            seen[key] = line_num
+            records.append(record)
+
+        if errors:
+            raise ValueError('\n'.join(errors))
+        return records
+
+    @classmethod
+    def load(cls, external_id, target_name, records, plate_name_prefix,
+             plate_configuration):
+        """Loads the template plates of a primer set
+
+        The load is idempotent: the primer set, plates and wells that
+        already exist are kept and only the missing ones are created. The
+        records are copied to a staging table and all the plates and wells
+        are created with set-based statements
+
+        Parameters
+        ----------
+        external_id : str
+            The external id of the primer set. It is created if it doesn't
+            exist
+        target_name : str
+            The target name of the primer set, e.g. 'Amplicon' or 'Shotgun'
+        records : list of dict
+            The barcodes, as returned by `parse_barcodes`. They can be
+            gathered from several files
+        plate_name_prefix : str
+            The prefix of the plate names. The plate of each record is named
+            "<plate_name_prefix> <plate>"
+        plate_configuration : labman.db.plate.PlateConfiguration
+            The configuration of the template plates
+
+        Returns
+        -------
+        PrimerSet, dict
+            The primer set and the number of primer sets, plates and wells
+            created, keyed by 'primer_sets', 'plates' and 'wells'
+
+        Raises
+        ------
+        LabmanError
+            If a well is outside of the plate, if an existing plate holds
+            compositions from other primer sets or if the barcode of an
+            existing well differs from the loaded one
+        """
+        seen = set()
+        for r in records:
+            if (r['row'] > plate_configuration.num_rows or
+                    r['column'] > plate_configuration.num_columns):
+                raise exceptions_mod.LabmanError(
+                    'Line %d: well %s is outside of the plate'
+                    % (r['line'], r['well']))
+            key = (r['plate'], r['row'], r['column'])
+            if key in seen:
+                raise exceptions_mod.LabmanError(
+                    'Well %s of plate %s is listed more than once'
+                    % (r['well'], r['plate']))
+            seen.add(key)
+
+        changes = {'primer_sets': 0, 'plates': 0, 'wells': 0}
+        with sql_connection.TRN as TRN:
+            sql = """SELECT primer_set_id
+                     FROM labman.primer_set
+                     WHERE external_id = %s"""
+            TRN.add(sql, [external_id])
+            primer_set_id = TRN.execute_fetchlast()
+            if primer_set_id is None:
+                sql = """INSERT INTO labman.primer_set
+                            (external_id, target_name)
+                         VALUES (%s, %s)
+                         RETURNING primer_set_id"""
+                TRN.add(sql, [external_id, target_name])
+                primer_set_id = TRN.execute_fetchlast()
+                changes['primer_sets'] = 1
+
+            sql = """DROP TABLE IF EXISTS pg_temp.primer_set_staging;
+                     CREATE TEMP TABLE primer_set_staging (
+                        plate_name varchar(250) NOT NULL,
+                        row_num integer NOT NULL,
+                        col_num integer NOT NULL,
+                        barcode_seq varchar(20) NOT NULL,
+                        external_id varchar) ON COMMIT DROP"""
+            TRN.add(sql)
+            data = StringIO()
+            writer = csv.writer(data)
+            for r in records:
+                writer.writerow(['%s %s' % (plate_name_prefix, r['plate']),
+                                 r['row'], r['column'], r['barcode'],
+                                 r['external_id']])
+            data.seek(0)
+            TRN.copy_expert(
+                "COPY primer_set_staging (plate_name, row_num, col_num, "
+                "barcode_seq, external_id) FROM STDIN WITH (FORMAT csv)",
+                data)
+
+            # The existing plates can only hold wells of this primer set,
+            # with the same barcodes
+            sql = """SELECT DISTINCT p.external_id
+                     FROM labman.plate p
+                        JOIN labman.well w USING (plate_id)
+                        LEFT JOIN labman.composition c USING (container_id)
+                        LEFT JOIN labman.primer_set_composition psc
+                            USING (composition_id)
+                        LEFT JOIN primer_set_staging s
+                            ON s.plate_name = p.external_id
+                                AND s.row_num = w.row_num
+                                AND s.col_num = w.col_num
+                     WHERE p.external_id IN (
+                            SELECT plate_name FROM primer_set_staging)
+                        AND (psc.primer_set_id IS DISTINCT FROM %s
+                             OR psc.barcode_seq != s.barcode_seq)
+                     ORDER BY p.external_id"""
+            TRN.add(sql, [primer_set_id])
+            conflicts = TRN.execute_fetchflatten()
+            if conflicts:
+                raise exceptions_mod.LabmanError(
+                    'The following plates already exist and do not match '
+                    'the primer set: %s' % ', '.join(conflicts))
+
+            sql = """INSERT INTO labman.plate
+                        (external_id, plate_configuration_id)
+                     SELECT DISTINCT plate_name, %s
+                     FROM primer_set_staging s
+                     WHERE NOT EXISTS (SELECT 1
+                                       FROM labman.plate p
+                                       WHERE p.external_id = s.plate_name)
+                     RETURNING plate_id"""
+            TRN.add(sql, [plate_configuration.id])
+            changes['plates'] = len(TRN.execute_fetchindex())
+
+            missing_sql = """FROM primer_set_staging s
+                                JOIN labman.plate p
+                                    ON p.external_id = s.plate_name
+                             WHERE NOT EXISTS (
+                                SELECT 1
+                                FROM labman.well w
+                                WHERE w.plate_id = p.plate_id
+                                    AND w.row_num = s.row_num
+                                    AND w.col_num = s.col_num)"""
+            TRN.add("SELECT count(*) %s" % missing_sql)
+            changes['wells'] = TRN.execute_fetchlast()
+            if changes['wells']:
+                # Template wells are recorded as created by a primer plate
+                # map creation process run by the system user. Their volume
+                # doesn't make sense, as they are templates
+                sql = """INSERT INTO labman.process
+                            (process_type_id, run_date, run_personnel_id)
+                         SELECT process_type_id, now(),
+                                'LabmanSystem@labman.com'
+                         FROM labman.process_type
+                         WHERE description = 'primer plate map creation'
+                         RETURNING process_id"""
+                TRN.add(sql)
+                process_id = TRN.execute_fetchlast()
+                sql = """SELECT p.plate_id, s.row_num, s.col_num,
+                                0 AS volume,
+                                %(primer_set_id)s AS primer_set_id,
+                                s.barcode_seq, s.external_id
+                         {}
+                         ORDER BY p.plate_id, s.row_num, s.col_num""".format(
+                    missing_sql)
+                process.Process._create_plate_wells(
+                    process_id, None, PrimerSetComposition,
+                    ['primer_set_id', 'barcode_seq', 'external_id'], sql,
+                    {'primer_set_id': primer_set_id})
+
+        return cls(primer_set_id), changes
+
     @property
     def external_id(self):
         return self._get_attr('external_id')
@@ -1192,6 +1470,7 @@ class ShotgunPrimerSet(base.LabmanObject):
 
     Methods
     -------
+    get_next_combo_ids
     get_next_combos
     """
     _table = 'labman.shotgun_primer_set'
@@ -1205,8 +1484,13 @@ class ShotgunPrimerSet(base.LabmanObject):
     def current_combo_index(self):
         return self._get_attr('current_combo_index')
 
-    def get_next_combos(self, n):
-        """Get the next n i5-i7 primer combo to use
+    def get_next_combo_ids(self, n):
+        """Allocates the next n i5-i7 primer combos to use
+
+        The combos are allocated atomically: the combo index of the primer
+        set is advanced with a single UPDATE, which locks the primer set row
+        until the end of the transaction, so concurrent library preps never
+        receive the same combos
 
         Parameters
         ----------
@@ -1215,7 +1499,8 @@ class ShotgunPrimerSet(base.LabmanObject):
 
         Returns
         -------
-        list of (PrimerSetComposition, PrimerSetComposition)
+        list of (int, int)
+            The i5 and i7 primer set composition ids of each combo
 
         Raises
         ------
@@ -1237,38 +1522,48 @@ class ShotgunPrimerSet(base.LabmanObject):
                     'provide a number between 1 and %s'
                     % (n, self.external_id, total_combos))
 
-            # Retrieve the number of combos that we need
-            # We are not going to execute more than 2 iterations of the loop
-            # below. A loop is required to cover the case in which we need
-            # to start the combo list from the top. The if statement above
-            # ensures that we are not going to reach the end of the list twice
-            # and hence only execute, at most, 2 iterations of the for loop
-            result = []
-            while n > 0:
-                idx = self.current_combo_index
-                # Retrieve the combos
-                sql = """SELECT i5_primer_set_composition_id,
-                                i7_primer_set_composition_id
-                         FROM labman.shotgun_combo_primer_set
-                         WHERE shotgun_primer_set_id = %s
-                         ORDER BY shotgun_primer_set_id
-                         OFFSET %s LIMIT %s"""
-                TRN.add(sql, [self.id, idx, n])
-                records = TRN.execute_fetchindex()
-
-                # Add the objects to the result list
-                result.extend([
-                    (PrimerSetComposition(r[0]), PrimerSetComposition(r[1]))
-                    for r in records])
-
-                # Compute the new index and update the database
-                new_idx = (idx + len(records)) % total_combos
-                sql = """UPDATE labman.shotgun_primer_set
-                         SET current_combo_index = %s
-                         WHERE shotgun_primer_set_id = %s"""
-                TRN.add(sql, [new_idx, self.id])
-
-                # Update n (loop invariant)
-                n = n - len(records)
+            # Advance the index and retrieve the combos in between, wrapping
+            # around at the end of the list. As n <= total, the previous
+            # index is (new index - n) mod total
+            sql = """WITH counter AS (
+                        UPDATE labman.shotgun_primer_set
+                        SET current_combo_index = mod(
+                            current_combo_index + %(n)s, %(total)s)
+                        WHERE shotgun_primer_set_id = %(id)s
+                        RETURNING mod(current_combo_index - %(n)s + %(total)s,
+                                      %(total)s) AS first_index)
+                     SELECT i5_primer_set_composition_id,
+                            i7_primer_set_composition_id
+                     FROM counter,
+                        generate_series(0, %(n)s - 1) AS offsets (k)
+                        JOIN labman.shotgun_combo_primer_set c
+                            ON c.shotgun_primer_set_id = %(id)s
+                     WHERE c.combo_index = mod(first_index + k, %(total)s)
+                     ORDER BY k"""
+            TRN.add(sql, {'id': self.id, 'n': n, 'total': total_combos})
+            return [tuple(r) for r in TRN.execute_fetchindex()]
 
-        return result
+    def get_next_combos(self, n):
+        """Get the next n i5-i7 primer combo to use
+
+        Parameters
+        ----------
+        n: int
+            The number of combos to return
+
+        Returns
+        -------
+        list of (PrimerSetComposition, PrimerSetComposition)
+
+        Raises
+        ------
+        ValueError
+            If n is not between 1 and the total number of combos available
+            for the primer set (both ends included)
+
+        See Also
+        --------
+        get_next_combo_ids
+        """
+        return [(PrimerSetComposition(i5), PrimerSetComposition(i7))
+                for i5, i7 in self.get_next_combo_ids(n)]
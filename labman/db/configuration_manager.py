@@ -41,6 +41,8 @@ class ConfigurationManager(object):
         The port used to connect to the postgres database in the previous host
     qiita_server_cert : str
         If qiita enabled, the qiita server certificate
+    cookie_secret : str or None
+        The secret used to sign the session cookies, None if not set
 
     Raises
     ------
@@ -50,7 +52,8 @@ class ConfigurationManager(object):
     @staticmethod
     def create(config_fp, test_env, certificate_filepath, key_filepath,
                db_host, db_port, db_name, db_user, db_password, db_admin_user,
-               db_admin_password, log_dir, qiita_server_cert):
+               db_admin_password, log_dir, qiita_server_cert,
+               cookie_secret=''):
         """Creates a new labman configuration file
 
         Parameters
@@ -83,6 +86,10 @@ class ConfigurationManager(object):
             Path to the log directory
         qiita_server_cert : str
             The qiita server certificate (for testing)
+        cookie_secret : str, optional
+            The secret used to sign the session cookies. It needs to be set
+            to keep the sessions across restarts and to run several webserver
+            processes
         """
         with open(config_fp, 'w') as f:
             f.write(CONFIG_TEMPLATE % {
@@ -98,6 +105,7 @@ class ConfigurationManager(object):
                 'host': db_host,
                 'port': db_port,
                 'logdir': log_dir,
+                'cookie_secret': cookie_secret,
                 'qiita_cert': qiita_server_cert})
 
     def __init__(self):
@@ -143,6 +151,11 @@ class ConfigurationManager(object):
         if not self.key_filepath:
             self.key_filepath = join(self.support_files, 'server.key')
 
+        # Configuration files created before the option existed don't have it
+        self.cookie_secret = config.get('main', 'COOKIE_SECRET', fallback='')
+        if not self.cookie_secret:
+            self.cookie_secret = None
+
     def _get_postgres(self, config):
         """Get the configuration of the postgres section"""
         self.user = config.get('postgres', 'USER')
@@ -172,6 +185,7 @@ TEST_ENVIRONMENT=%(test)s
 LOG_DIR=%(logdir)s
 CERTIFICATE_FILEPATH=%(certificate_filepath)s
 KEY_FILEPATH=%(key_filepath)s
+COOKIE_SECRET=%(cookie_secret)s
 
 # ----------------------- POSTGRES SETTINGS --------------------------------
 [postgres]
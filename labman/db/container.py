@@ -6,6 +6,8 @@
 # The full license is in the file LICENSE, distributed with this software.
 # ----------------------------------------------------------------------------
 
+import re
+
 from . import base
 from . import sql_connection
 from . import plate as plate_module
@@ -266,14 +268,57 @@ class Well(Container):
         """The well column"""
         return self._get_attr('col_num')
 
-    @property
-    def well_id(self):
-        """The well id in the "A1","H12" form"""
-        row = self.row
-        col = self.column
+    @staticmethod
+    def format_well_id(row, col):
+        """Formats the given coordinates in the "A1","H12" form
+
+        Parameters
+        ----------
+        row : int
+            The row number of the well, starting at 1
+        col : int
+            The column number of the well, starting at 1
+
+        Returns
+        -------
+        str
+        """
         # Adapted from https://stackoverflow.com/a/19169180/3746629
         result = []
         while row:
             row, rem = divmod(row-1, 26)
             result[:0] = LETTERS[rem]
         return ''.join(result) + str(col)
+
+    @staticmethod
+    def parse_well_id(well_id):
+        """Parses a well id in the "A1","H12" form into its coordinates
+
+        Parameters
+        ----------
+        well_id : str
+            The well id. Column numbers may be zero-padded (e.g. "A01")
+
+        Returns
+        -------
+        (int, int)
+            The row and column numbers of the well, starting at 1
+
+        Raises
+        ------
+        ValueError
+            If `well_id` is not a well id
+        """
+        match = re.match(r'^([A-Za-z]+)0*([1-9][0-9]*)$', well_id.strip())
+        if match is None:
+            raise ValueError('"%s" is not a valid well id' % well_id)
+        letters, col = match.groups()
+        row = 0
+        for letter in letters.upper():
+            row = row * 26 + LETTERS.index(letter) + 1
+        return row, int(col)
+
+    @property
+    def well_id(self):
+        """The well id in the "A1","H12" form"""
+        return self.format_well_id(self.row, self.column)
@@ -0,0 +1,253 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2017-, labman development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+# ----------------------------------------------------------------------------
+
+"""Metrics of the labman processes in the Prometheus text format
+
+The metrics are kept in memory by each process, so when the webserver runs
+several processes each one reports its own metrics.
+"""
+
+from bisect import bisect_left
+from functools import wraps
+from inspect import isgeneratorfunction
+from time import monotonic
+
+
+_REGISTRY = []
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10,
+                    30, 60)
+SIZE_BUCKETS = (100, 1000, 10000, 100000, 1000000, 10000000, 100000000)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _format_labels(names, values):
+    if not names:
+        return ''
+    escaped = (str(v).replace('\\', '\\\\').replace('"', '\\"')
+               .replace('\n', '\\n') for v in values)
+    return '{%s}' % ','.join('%s="%s"' % (n, v)
+                             for n, v in zip(names, escaped))
+
+
+class _Metric(object):
+    """Base class for the metrics
+
+    Parameters
+    ----------
+    name : str
+        The name of the metric
+    documentation : str
+        The description of the metric
+    labels : tuple of str, optional
+        The names of the labels of the metric
+    registry : list of _Metric, optional
+        The registry where the metric is added. Default: the registry of the
+        process, which is exposed by the webserver
+    """
+    _type = None
+
+    def __init__(self, name, documentation, labels=(), registry=None):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values = {}
+        (_REGISTRY if registry is None else registry).append(self)
+
+    def _key(self, labels):
+        if set(labels) != set(self.labels):
+            raise ValueError('Metric %s takes the labels %s, found %s'
+                             % (self.name, self.labels, sorted(labels)))
+        return tuple(labels[n] for n in self.labels)
+
+    def _samples(self):
+        """Yields the (name suffix, label names, label values, value) of
+        the samples of the metric"""
+        raise NotImplementedError()
+
+    def render(self):
+        """Returns the metric in the Prometheus text format"""
+        lines = ['# HELP %s %s' % (self.name, self.documentation),
+                 '# TYPE %s %s' % (self.name, self._type)]
+        for suffix, names, values, value in self._samples():
+            lines.append('%s%s%s %s' % (self.name, suffix,
+                                        _format_labels(names, values),
+                                        _format_value(value)))
+        return '\n'.join(lines)
+
+
+class Counter(_Metric):
+    """A value that only increases"""
+    _type = 'counter'
+
+    def inc(self, amount=1, **labels):
+        """Increases the counter
+
+        Parameters
+        ----------
+        amount : int or float, optional
+            The amount to increase. Default: 1
+        labels : str
+            The values of the labels of the metric
+        """
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def _samples(self):
+        for key in sorted(self._values):
+            yield '', self.labels, key, self._values[key]
+
+
+class Histogram(_Metric):
+    """The distribution of the observed values over a set of buckets
+
+    Parameters
+    ----------
+    buckets : tuple of float, optional
+        The upper bounds of the buckets. Default: DURATION_BUCKETS
+
+    See Also
+    --------
+    _Metric
+    """
+    _type = 'histogram'
+
+    def __init__(self, name, documentation, labels=(),
+                 buckets=DURATION_BUCKETS, registry=None):
+        super(Histogram, self).__init__(name, documentation, labels,
+                                        registry=registry)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        """Records an observed value
+
+        Parameters
+        ----------
+        value : int or float
+            The observed value
+        labels : str
+            The values of the labels of the metric
+        """
+        key = self._key(labels)
+        if key not in self._values:
+            # [count of each bucket + the +Inf bucket, sum]
+            self._values[key] = [[0] * (len(self.buckets) + 1), 0]
+        counts, _ = self._values[key]
+        counts[bisect_left(self.buckets, value)] += 1
+        self._values[key][1] += value
+
+    def _samples(self):
+        names = self.labels + ('le', )
+        for key in sorted(self._values):
+            counts, total = self._values[key]
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'), ), counts):
+                cumulative += count
+                yield ('_bucket', names, key + (_format_value(bound), ),
+                       cumulative)
+            yield '_sum', self.labels, key, total
+            yield '_count', self.labels, key, cumulative
+
+
+class CallbackGauge(_Metric):
+    """A value read from a function when the metrics are rendered
+
+    Parameters
+    ----------
+    func : callable
+        The function returning the value of the gauge
+
+    See Also
+    --------
+    _Metric
+    """
+    _type = 'gauge'
+
+    def __init__(self, name, documentation, func, registry=None):
+        super(CallbackGauge, self).__init__(name, documentation,
+                                            registry=registry)
+        self._func = func
+
+    def _samples(self):
+        yield '', (), (), self._func()
+
+
+class CallbackCounter(CallbackGauge):
+    """A counter read from a function when the metrics are rendered
+
+    See Also
+    --------
+    CallbackGauge
+    """
+    _type = 'counter'
+
+
+def render(registry=None):
+    """Returns all the metrics of a registry in the Prometheus text format
+
+    Parameters
+    ----------
+    registry : list of _Metric, optional
+        The registry to render. Default: the registry of the process
+
+    Returns
+    -------
+    str
+    """
+    registry = _REGISTRY if registry is None else registry
+    return '\n'.join(m.render() for m in registry) + '\n'
+
+
+ARTIFACT_DURATION = Histogram(
+    'labman_artifact_generation_seconds',
+    'Time spent generating the files downloaded by the users, e.g. pick '
+    'lists or sample sheets. For the files streamed to the users it is the '
+    'time from the first line until the last one',
+    labels=('artifact', ))
+
+
+def timed_artifact(artifact):
+    """Decorator recording the duration of the generation of an artifact
+
+    Parameters
+    ----------
+    artifact : str
+        The name of the artifact, e.g. 'sample_sheet'
+
+    Notes
+    -----
+    It also supports generator functions, in which case the duration is
+    recorded when the generator is exhausted or closed
+    """
+    def decorator(func):
+        if isgeneratorfunction(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                start = monotonic()
+                try:
+                    yield from func(*args, **kwargs)
+                finally:
+                    ARTIFACT_DURATION.observe(monotonic() - start,
+                                              artifact=artifact)
+        else:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                start = monotonic()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    ARTIFACT_DURATION.observe(monotonic() - start,
+                                              artifact=artifact)
+        return wrapper
+    return decorator
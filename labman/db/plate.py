@@ -6,13 +6,12 @@
 # The full license is in the file LICENSE, distributed with this software.
 # ----------------------------------------------------------------------------
 
-from collections import defaultdict
-
 from . import base
 from . import sql_connection
 from . import container as container_module
 from . import exceptions as exceptions_module
 from . import process as process_module
+from . import study as study_module
 
 
 class PlateConfiguration(base.LabmanObject):
@@ -124,6 +123,58 @@ class Plate(base.LabmanObject):
         query_type : {INTERSECT, UNION}
             Whether to return the results that fullfill all of the search
             restrictions or just one of them. Defaul: INTERSECT
+
+        Returns
+        -------
+        list of Plate
+            The plates matching the search, sorted by plate id
+
+        See Also
+        --------
+        ranked_search
+        """
+        res = Plate.ranked_search(samples=samples, plate_notes=plate_notes,
+                                  well_notes=well_notes,
+                                  query_type=query_type)
+        # explicitly sorting to ensure a deterministic result
+        return [Plate(pid) for pid in sorted(r['plate_id'] for r in res)]
+
+    @staticmethod
+    def ranked_search(samples=None, plate_notes=None, well_notes=None,
+                      query_type='INTERSECT', limit=None, offset=0):
+        """Search plates, ranking the results by how well they match
+
+        Parameters
+        ----------
+        samples: list of str, optional
+            The samples to find in the plates
+        plate_notes : str, optional
+            The plate notes string to search for. Default: None
+        well_notes : str, optional
+            The well notes string to search for. Default: None
+        query_type : {INTERSECT, UNION}
+            Whether to return the results that fullfill all of the search
+            restrictions or just one of them. Defaul: INTERSECT
+        limit : int, optional
+            The maximum number of results to return. Default: all of them
+        offset : int, optional
+            The number of results to skip. Default: 0
+
+        Returns
+        -------
+        list of dict
+            The plate id, external id and rank of the matching plates, with
+            the structure [{'plate_id': int, 'external_id': str,
+            'rank': float}], sorted by decreasing rank and then plate id.
+            The rank is the sum of the fraction of the samples found in the
+            plate and the text search ranks of the plate and well notes
+
+        Raises
+        ------
+        ValueError
+            If none of samples, plate_notes or well_notes is provided
+            If query_type is not INTERSECT or UNION
+            If limit or offset are negative
         """
         if samples is None and plate_notes is None and well_notes is None:
             raise ValueError(
@@ -134,46 +185,74 @@ class Plate(base.LabmanObject):
             raise ValueError('query_type should be INTERSECT or UNION. Found:'
                              ' %s' % query_type)
 
+        if (limit is not None and limit < 0) or offset < 0:
+            raise ValueError('limit and offset should be non-negative')
+
         with sql_connection.TRN as TRN:
             sql_queries = []
             sql_args = []
             if samples:
+                samples = set(samples)
                 sql_queries.append(
-                    """SELECT DISTINCT plate_id
+                    """SELECT plate_id,
+                              count(DISTINCT sample_id)::real / %s AS rank
                        FROM labman.well
                             JOIN labman.composition USING (container_id)
                             JOIN labman.sample_composition
                                 USING (composition_id)
-                       WHERE sample_id IN %s""")
-                sql_args.append(tuple(samples))
+                       WHERE sample_id IN %s
+                       GROUP BY plate_id""")
+                sql_args.extend([len(samples), tuple(samples)])
+            # The notes are matched with to_tsvector('english', notes) so the
+            # GIN indexes on those expressions are used
             if plate_notes:
                 sql_queries.append(
-                    """SELECT plate_id
+                    """SELECT plate_id,
+                              ts_rank(to_tsvector('english', notes),
+                                      query) AS rank
                        FROM labman.plate
-                       WHERE notes @@ to_tsquery(%s)""")
-                sql_args.append(
-                    ' & '.join([w for w in plate_notes.split()]))
+                            CROSS JOIN plainto_tsquery('english', %s) query
+                       WHERE to_tsvector('english', notes) @@ query""")
+                sql_args.append(plate_notes)
             if well_notes:
                 sql_queries.append(
-                    """SELECT plate_id
+                    """SELECT plate_id,
+                              max(ts_rank(to_tsvector('english', notes),
+                                          query)) AS rank
                        FROM labman.well
                             JOIN labman.composition USING (container_id)
-                       WHERE notes @@ to_tsquery(%s)""")
-                sql_args.append(
-                    ' & '.join([w for w in well_notes.split()]))
-
-            if len(sql_queries) > 1:
-                sql = (" %s " % query_type).join(sql_queries)
-            else:
-                sql = sql_queries[0]
+                            CROSS JOIN plainto_tsquery('english', %s) query
+                       WHERE to_tsvector('english', notes) @@ query
+                       GROUP BY plate_id""")
+                sql_args.append(well_notes)
+
+            if not sql_queries:
+                return []
+
+            # Each of the queries returns a plate at most once, so a plate
+            # matches all of them if it is returned by all of them
+            sql_having = ''
+            if query_type == 'INTERSECT':
+                sql_having = 'HAVING count(*) = %s'
+                sql_args.append(len(sql_queries))
+
+            sql_limit = 'OFFSET %s'
+            if limit is not None:
+                sql_limit = 'LIMIT %s OFFSET %s'
+                sql_args.append(limit)
+            sql_args.append(offset)
+
+            sql = """SELECT plate_id, external_id, rank
+                     FROM (SELECT plate_id, sum(rank)::real AS rank
+                           FROM ({}) matches
+                           GROUP BY plate_id
+                           {}) ranked
+                        JOIN labman.plate USING (plate_id)
+                     ORDER BY rank DESC, plate_id
+                     {}""".format(' UNION ALL '.join(sql_queries),
+                                  sql_having, sql_limit)
             TRN.add(sql, sql_args)
-
-            # explicitly sorting to ensure a deterministic result.
-            # sorting ids in python rather than with a SQL ORDER BY since
-            # there are several different SQL queries potentially being run.
-            sorted_pids = sorted(TRN.execute_fetchflatten())
-            res = [Plate(pid) for pid in sorted_pids]
-        return res
+            return [dict(r) for r in TRN.execute_fetchindex()]
 
     @staticmethod
     def list_plates(plate_types=None, only_quantified=False,
@@ -201,50 +280,40 @@ class Plate(base.LabmanObject):
             [{'plate_id': int, 'external_id': string}]
         """
         with sql_connection.TRN as TRN:
-            sql_where, sql_discard, sql_plate_types = '', '', ''
+            sql_columns = ''
+            # Plates without wells don't have a type
+            sql_where = ["plate_types <> '{}'"]
             sql_args = []
-            sql_join = ''
+
+            if include_study_titles:
+                sql_columns = """, (SELECT array_agg(DISTINCT study_title
+                                                    ORDER BY study_title)
+                                   FROM qiita.study
+                                   WHERE study_id = ANY(study_ids))
+                                  AS studies"""
 
             # do not include discarded plates
             if not include_discarded:
-                sql_discard = 'discarded = FALSE '
+                sql_where.append('ps.discarded = FALSE')
 
             # Not using if plate_type is not None cause I also want to cover
             # the case in which the list is empty
-            sql_studies = ''
             if plate_types:
-                sql_plate_types = 'description IN %s'
-                sql_args.append(tuple(plate_types))
-
-            # The WHERE clause is only needed if we have to filter plates
-            # (which may depend on multiple conditions)
-            if sql_discard != '' or sql_plate_types != '':
-                sql_where = 'WHERE '
-                if sql_discard != '' and sql_plate_types != '':
-                    sql_where += sql_discard + ' AND ' + sql_plate_types
-                else:
-                    sql_where += sql_discard + ' ' + sql_plate_types
+                sql_where.append('plate_types && %s::varchar[]')
+                sql_args.append(list(plate_types))
 
             if only_quantified:
-                sql_join = ("JOIN labman.concentration_calculation "
-                            "ON quantitated_composition_id = composition_id")
-            if include_study_titles:
-                sql_studies = (', labman.get_plate_studies(p.plate_id) '
-                               'AS studies')
-
-            sql = """SELECT p.plate_id, p.external_id {}
-                        FROM (SELECT DISTINCT plate_id, external_id
-                              FROM labman.plate
-                                JOIN labman.well USING (plate_id)
-                                JOIN labman.composition USING (container_id)
-                                JOIN labman.composition_type USING
-                                    (composition_type_id)
-                                {}
-                             {}) AS p
-                     ORDER BY plate_id""".format(sql_studies, sql_join,
-                                                 sql_where)
+                sql_where.append('quantified = TRUE')
+
+            sql = """SELECT plate_id, external_id{}
+                     FROM labman.plate_summary ps
+                        JOIN labman.plate USING (plate_id)
+                     WHERE {}
+                     ORDER BY plate_id""".format(sql_columns,
+                                                 ' AND '.join(sql_where))
             TRN.add(sql, sql_args)
-            return [dict(r) for r in TRN.execute_fetchindex()]
+            res = [dict(r) for r in TRN.execute_fetchindex()]
+        return res
 
     @staticmethod
     def external_id_exists(external_id):
@@ -356,14 +425,47 @@ class Plate(base.LabmanObject):
         -------
         set of labman.db.study.Study
         """
+        studies = self._get_plate_studies([self.id])
+        return {study_module.Study(study_id)
+                for plate_studies in studies.values()
+                for study_id, _ in plate_studies}
+
+    @staticmethod
+    def _get_plate_studies(plate_ids):
+        """Returns the studies of the samples held in the given plates
+
+        The samples are resolved for every kind of composition derived from
+        them, using a single query for all the plates
+
+        Parameters
+        ----------
+        plate_ids : list of int
+            The plate ids
+
+        Returns
+        -------
+        dict of {int: list of (int, str)}
+            The id and title of the studies present in each plate, sorted by
+            study id
+        """
+        res = {int(plate_id): [] for plate_id in plate_ids}
+        if not res:
+            return res
         with sql_connection.TRN as TRN:
-            sql = "SELECT well_id FROM labman.well WHERE plate_id = %s"
-            TRN.add(sql, [self.id])
-            res = set(container_module.Well(well_id).composition.study
-                      for well_id in TRN.execute_fetchflatten())
-            # If there are controls, those return None as the study, remove it
-            # from the list
-            res.discard(None)
+            sql = """SELECT DISTINCT plate_id, study_id, study_title
+                     FROM labman.well
+                        JOIN labman.composition USING (container_id)
+                        JOIN labman.composition_sample_lineage
+                            USING (composition_id)
+                        JOIN labman.sample_composition
+                            USING (sample_composition_id)
+                        JOIN qiita.study_sample USING (sample_id)
+                        JOIN qiita.study USING (study_id)
+                     WHERE plate_id IN %s
+                     ORDER BY plate_id, study_id"""
+            TRN.add(sql, [tuple(res)])
+            for plate_id, study_id, title in TRN.execute_fetchindex():
+                res[plate_id].append((study_id, title))
         return res
 
     @property
@@ -513,6 +615,36 @@ class Plate(base.LabmanObject):
                    for well in TRN.execute_fetchflatten()]
         return res
 
+    @staticmethod
+    def get_plates_by_samples(sample_ids):
+        """Returns the plates in which each of the given samples is plated
+
+        Parameters
+        ----------
+        sample_ids : iterable of str
+            The sample ids
+
+        Returns
+        -------
+        dict of {str: list of Plate}
+            The plates in which each sample has been plated, sorted by plate
+            id. Samples that haven't been plated are not included
+        """
+        sample_ids = tuple(set(sample_ids))
+        if not sample_ids:
+            return {}
+        with sql_connection.TRN as TRN:
+            sql = """SELECT sample_id,
+                            array_agg(DISTINCT plate_id ORDER BY plate_id)
+                     FROM labman.sample_composition
+                        JOIN labman.composition USING (composition_id)
+                        JOIN labman.well USING (container_id)
+                     WHERE sample_id IN %s
+                     GROUP BY sample_id"""
+            TRN.add(sql, [sample_ids])
+            return {sample_id: [Plate(p) for p in plate_ids]
+                    for sample_id, plate_ids in TRN.execute_fetchindex()}
+
     def get_previously_plated_wells(self):
         """Get wells with samples that have been previously plated
 
@@ -523,24 +655,195 @@ class Plate(base.LabmanObject):
             and the plates in which they're found
         """
         with sql_connection.TRN as TRN:
-            sql = """SELECT plate_id, array_agg(sample_id)
-                     FROM labman.sample_composition
-                        JOIN labman.composition USING (composition_id)
-                        JOIN labman.well USING (container_id)
-                     WHERE plate_id <> %s AND sample_id IN (
-                        SELECT sample_id
-                        FROM labman.sample_composition
-                            JOIN labman.composition USING (composition_id)
-                            JOIN labman.well USING (container_id)
-                            WHERE plate_id = %s)
-                     GROUP BY plate_id"""
+            sql = """SELECT w.well_id,
+                            array_agg(DISTINCT ow.plate_id
+                                      ORDER BY ow.plate_id)
+                     FROM labman.well w
+                        JOIN labman.composition c USING (container_id)
+                        JOIN labman.sample_composition sc
+                            USING (composition_id)
+                        JOIN labman.sample_composition osc
+                            ON osc.sample_id = sc.sample_id
+                        JOIN labman.composition oc
+                            ON oc.composition_id = osc.composition_id
+                        JOIN labman.well ow
+                            ON ow.container_id = oc.container_id
+                     WHERE w.plate_id = %s AND ow.plate_id <> %s
+                     GROUP BY w.well_id"""
             TRN.add(sql, [self.id, self.id])
-            prev_plated = TRN.execute_fetchindex()
-            res = defaultdict(list)
-            for plate_id, samples in prev_plated:
-                for sample in samples:
-                    for well in self.get_wells_by_sample(sample):
-                        res[well].append(plate_id)
-            res = {well: [Plate(x) for x in sorted(list(set(plate_ids)))]
-                   for well, plate_ids in res.items()}
+            res = {container_module.Well(well_id): [Plate(x) for x in plates]
+                   for well_id, plates in TRN.execute_fetchindex()}
         return res
+
+    def get_summary(self):
+        """Returns the information shown in the plate page
+
+        All the information is retrieved with a single query
+
+        Returns
+        -------
+        dict
+            The plate information, with the structure:
+            {'plate_id': int, 'external_id': str, 'discarded': bool,
+             'notes': str, 'process_notes': str,
+             'plate_configuration': [int, str, int, int],
+             'studies': list of int,
+             'duplicates': list of [int, int, str],
+             'previous_plates': list of [[int, int], list of dict],
+             'unknowns': list of [int, int],
+             'quantification_processes': list of [int, str, datetime, str]}
+            The studies are the sorted ids of the studies of the samples in
+            the plate. The duplicates hold the row, column and contents of
+            the wells with duplicated samples, sorted by sample id and well.
+            The previous plates hold the row and column of the wells with
+            samples that have been plated in other plates and the id and name
+            ({'plate_id': int, 'plate_name': str}) of those plates, sorted by
+            well and plate id. The unknowns hold the row and column of the
+            wells with unknown samples, sorted by well. The quantification
+            processes hold the id, personnel name, date and notes of the
+            quantification processes, in order from least to most recent
+        """
+        with sql_connection.TRN as TRN:
+            sql = """WITH wells AS (
+                        SELECT well_id, row_num, col_num, container_id,
+                               composition_id, sample_id, content,
+                               sct.external_id AS sample_composition_type
+                        FROM labman.well
+                            JOIN labman.composition USING (container_id)
+                            LEFT JOIN labman.sample_composition
+                                USING (composition_id)
+                            LEFT JOIN labman.sample_composition_type sct
+                                USING (sample_composition_type_id)
+                        WHERE plate_id = %(plate_id)s),
+                     dups AS (
+                        SELECT well_id, row_num, col_num, content, sample_id
+                        FROM wells
+                        WHERE sample_id IN (SELECT sample_id
+                                            FROM wells
+                                            GROUP BY sample_id
+                                            HAVING count(*) > 1)),
+                     prev AS (
+                        -- json_agg of the op rows builds the
+                        -- {plate_id, plate_name} objects
+                        SELECT w.well_id, w.row_num, w.col_num,
+                               json_agg(op ORDER BY op.plate_id) AS plates
+                        FROM (SELECT DISTINCT w.well_id, w.row_num,
+                                              w.col_num, ow.plate_id
+                              FROM wells w
+                                JOIN labman.sample_composition osc
+                                    ON osc.sample_id = w.sample_id
+                                JOIN labman.composition oc
+                                    ON oc.composition_id = osc.composition_id
+                                JOIN labman.well ow
+                                    ON ow.container_id = oc.container_id
+                              WHERE ow.plate_id <> %(plate_id)s) w
+                            JOIN (SELECT plate_id, external_id AS plate_name
+                                  FROM labman.plate) op USING (plate_id)
+                        GROUP BY w.well_id, w.row_num, w.col_num),
+                     quants AS (
+                        SELECT DISTINCT qp.quantification_process_id,
+                               coalesce(u.name, u.email) AS personnel,
+                               p.run_date, p.notes
+                        FROM wells
+                            JOIN labman.composition c USING (container_id)
+                            JOIN labman.concentration_calculation cc
+                                ON cc.quantitated_composition_id =
+                                    c.composition_id
+                            JOIN labman.quantification_process qp
+                                ON qp.quantification_process_id =
+                                    cc.upstream_process_id
+                            JOIN labman.process p USING (process_id)
+                            JOIN qiita.qiita_user u
+                                ON u.email = p.run_personnel_id)
+                     SELECT pl.plate_id, pl.external_id, pl.discarded,
+                            pl.notes, pc.plate_configuration_id,
+                            pc.description, pc.num_rows, pc.num_columns,
+                            (SELECT notes
+                             FROM labman.process
+                             WHERE process_id = (
+                                SELECT latest_upstream_process_id
+                                FROM labman.container
+                                WHERE container_id IN (
+                                    SELECT container_id FROM wells)
+                                LIMIT 1)) AS process_notes,
+                            (SELECT array_agg(row_num
+                                              ORDER BY sample_id, well_id)
+                             FROM dups) AS dup_rows,
+                            (SELECT array_agg(col_num
+                                              ORDER BY sample_id, well_id)
+                             FROM dups) AS dup_cols,
+                            (SELECT array_agg(content
+                                              ORDER BY sample_id, well_id)
+                             FROM dups) AS dup_contents,
+                            (SELECT array_agg(row_num ORDER BY well_id)
+                             FROM prev) AS prev_rows,
+                            (SELECT array_agg(col_num ORDER BY well_id)
+                             FROM prev) AS prev_cols,
+                            (SELECT json_agg(plates ORDER BY well_id)
+                             FROM prev) AS prev_plates,
+                            (SELECT array_agg(row_num ORDER BY well_id)
+                             FROM wells
+                             WHERE sample_composition_type =
+                                    'experimental sample'
+                                AND sample_id IS NULL) AS unknown_rows,
+                            (SELECT array_agg(col_num ORDER BY well_id)
+                             FROM wells
+                             WHERE sample_composition_type =
+                                    'experimental sample'
+                                AND sample_id IS NULL) AS unknown_cols,
+                            (SELECT array_agg(DISTINCT study_id
+                                              ORDER BY study_id)
+                             FROM wells
+                                JOIN labman.composition_sample_lineage
+                                    lineage USING (composition_id)
+                                JOIN labman.sample_composition sc
+                                    ON sc.sample_composition_id =
+                                        lineage.sample_composition_id
+                                JOIN qiita.study_sample ss
+                                    ON ss.sample_id = sc.sample_id
+                            ) AS studies,
+                            (SELECT array_agg(quantification_process_id
+                                    ORDER BY run_date,
+                                             quantification_process_id)
+                             FROM quants) AS quant_ids,
+                            (SELECT array_agg(personnel
+                                    ORDER BY run_date,
+                                             quantification_process_id)
+                             FROM quants) AS quant_personnel,
+                            (SELECT array_agg(run_date
+                                    ORDER BY run_date,
+                                             quantification_process_id)
+                             FROM quants) AS quant_dates,
+                            (SELECT array_agg(notes
+                                    ORDER BY run_date,
+                                             quantification_process_id)
+                             FROM quants) AS quant_notes
+                     FROM labman.plate pl
+                        JOIN labman.plate_configuration pc
+                            USING (plate_configuration_id)
+                     WHERE pl.plate_id = %(plate_id)s"""
+            TRN.add(sql, {'plate_id': self.id})
+            row = TRN.execute_fetchindex()[0]
+
+        # The lists are aggregated in parallel arrays, one per field
+        def _zip(*keys):
+            return [list(v) for v in zip(*[row[k] or [] for k in keys])]
+
+        return {'plate_id': row['plate_id'],
+                'external_id': row['external_id'],
+                'discarded': row['discarded'],
+                'notes': row['notes'],
+                'process_notes': row['process_notes'],
+                'plate_configuration': [
+                    row['plate_configuration_id'], row['description'],
+                    row['num_rows'], row['num_columns']],
+                'studies': row['studies'] or [],
+                'duplicates': _zip('dup_rows', 'dup_cols', 'dup_contents'),
+                'previous_plates': [
+                    [[r, c], plates]
+                    for r, c, plates in _zip('prev_rows', 'prev_cols',
+                                             'prev_plates')],
+                'unknowns': _zip('unknown_rows', 'unknown_cols'),
+                'quantification_processes': _zip(
+                    'quant_ids', 'quant_personnel', 'quant_dates',
+                    'quant_notes')}
@@ -6,23 +6,26 @@
 # The full license is in the file LICENSE, distributed with this software.
 # ----------------------------------------------------------------------------
 
+import csv
+from collections import defaultdict
 from datetime import datetime
+import heapq
 from io import StringIO
-from itertools import chain
+from itertools import chain, groupby
+from operator import itemgetter
 from random import randrange
 import re
 from json import dumps
 
-import numpy as np
-import pandas as pd
-
 from . import base
 from . import sql_connection
+from . import exceptions as exceptions_module
 from . import user as user_module
 from . import plate as plate_module
 from . import container as container_module
 from . import composition as composition_module
 from . import equipment as equipment_module
+from . import metrics
 from .study import Study
 
 
@@ -108,6 +111,83 @@ class Process(base.LabmanObject):
             p_id = TRN.execute_fetchlast()
         return p_id
 
+    @staticmethod
+    def _create_plate_wells(process_id, plate, composition_cls, columns,
+                            source_sql, source_args):
+        """Creates the wells of a plate and their compositions in bulk
+
+        All the containers, wells, compositions and composition subtype rows
+        are inserted with a single statement, instead of running
+        `Well.create` and `<Composition>.create` once per well
+
+        Parameters
+        ----------
+        process_id : int
+            The id of the process creating the wells
+        plate : labman.db.plate.Plate or None
+            The plate in which the wells are created. If None, `source_sql`
+            must also return the plate_id column with the plate of each well
+        composition_cls : subclass of labman.db.composition.Composition
+            The class of the compositions held in the new wells
+        columns : list of str
+            The columns of the composition subtype table to fill, other than
+            composition_id
+        source_sql : str
+            A SELECT statement returning one row per well with the columns
+            row_num, col_num, volume and the given `columns`. It must use
+            named placeholders
+        source_args : dict
+            The arguments of `source_sql`
+        """
+        with sql_connection.TRN as TRN:
+            # The ids are drawn from the sequences up front so the rows of
+            # the different tables can be linked to each other
+            sql = """WITH src AS (
+                        SELECT nextval(pg_get_serial_sequence(
+                                    'labman.container', 'container_id'))
+                                    AS container_id,
+                               nextval(pg_get_serial_sequence(
+                                    'labman.composition', 'composition_id'))
+                                    AS composition_id,
+                               s.*
+                        FROM ({source}) s),
+                     containers AS (
+                        INSERT INTO labman.container
+                            (container_id, container_type_id,
+                             latest_upstream_process_id, remaining_volume)
+                        SELECT container_id, container_type_id,
+                               %(process_id)s, volume
+                        FROM src, labman.container_type
+                        WHERE description = %(container_type)s),
+                     wells AS (
+                        INSERT INTO labman.well
+                            (container_id, plate_id, row_num, col_num)
+                        SELECT container_id, {plate_id}, row_num, col_num
+                        FROM src),
+                     compositions AS (
+                        INSERT INTO labman.composition
+                            (composition_id, composition_type_id,
+                             upstream_process_id, container_id, total_volume)
+                        SELECT composition_id, composition_type_id,
+                               %(process_id)s, container_id, volume
+                        FROM src, labman.composition_type
+                        WHERE description = %(composition_type)s)
+                     INSERT INTO {table} (composition_id, {columns})
+                     SELECT composition_id, {columns}
+                     FROM src""".format(
+                source=source_sql, table=composition_cls._table,
+                columns=', '.join(columns),
+                plate_id='plate_id' if plate is None else '%(plate_id)s')
+            args = dict(source_args)
+            args.update({
+                'process_id': process_id,
+                'container_type': container_module.Well._container_type,
+                'composition_type': composition_cls._composition_type})
+            if plate is not None:
+                args['plate_id'] = plate.id
+            TRN.add(sql, args)
+            TRN.execute()
+
     def _get_process_attr(self, attr):
         """Returns the value of the given process attribute
 
@@ -314,7 +394,7 @@ class SamplePlatingProcess(_Process):
         str
             The new contents of the well
         """
-        return self.plate.get_well(row, col).composition.update(content)
+        return self.update_wells([(row, col, content)])[0]
 
     def comment_well(self, row, col, comment):
         """Updates the comment of a well
@@ -330,6 +410,366 @@ class SamplePlatingProcess(_Process):
         """
         self.plate.get_well(row, col).composition.notes = comment
 
+    def _get_well_compositions(self):
+        """Returns the sample composition of each well of the plate
+
+        Returns
+        -------
+        dict of {(int, int): dict}
+            The sample composition id, composition id, sample composition
+            type, sample id and content of each well, keyed by well
+            (row, column)
+        """
+        with sql_connection.TRN as TRN:
+            sql = """SELECT row_num, col_num, sample_composition_id,
+                            composition_id,
+                            sct.external_id AS sample_composition_type,
+                            sample_id, content
+                     FROM labman.sample_composition
+                        JOIN labman.sample_composition_type sct
+                            USING (sample_composition_type_id)
+                        JOIN labman.composition USING (composition_id)
+                        JOIN labman.well USING (container_id)
+                     WHERE plate_id = %s"""
+            TRN.add(sql, [self.plate.id])
+            return {(row['row_num'], row['col_num']): dict(row)
+                    for row in TRN.execute_fetchindex()}
+
+    @staticmethod
+    def _plan_well_updates(plate_id, wells, assignments, sample_types,
+                           known_samples):
+        """Computes the new state of the wells after the given assignments
+
+        The assignments are applied in order, with the same semantics as
+        SampleComposition.update:
+
+        - Controls are stored as "control.plate_id.well_id".
+        - Samples plated more than once in the plate are stored as
+          "sample_id.plate_id.well_id" in all the wells they are plated in.
+        - Samples that are not known are stored in the content, without a
+          sample id.
+        - If the sample previously held by a well is left in a single other
+          well, the content of that well reverts to the sample id.
+
+        Parameters
+        ----------
+        plate_id : int
+            The plate id
+        wells : dict of {(int, int): dict}
+            The current state of the wells, as returned by
+            `_get_well_compositions`. It is updated in place
+        assignments : list of (int, int, str)
+            The row, column and new contents of each well
+        sample_types : dict of {str: int}
+            The sample composition type ids keyed by external id
+        known_samples : set of str
+            The assigned contents that are samples known to Qiita
+
+        Returns
+        -------
+        list of (str, bool), set of (int, int)
+            The new contents of each assigned well and whether the contents
+            are a known sample or control, and the wells that changed
+        """
+        well_ids = {pos: container_module.Well.format_well_id(*pos)
+                    for pos in wells}
+        plated = defaultdict(set)
+        for pos, well in wells.items():
+            if well['sample_id'] is not None:
+                plated[well['sample_id']].add(pos)
+
+        def set_content(pos, content):
+            wells[pos]['content'] = content
+            changed.add(pos)
+
+        es_type = 'experimental sample'
+        changed = set()
+        result = []
+        for pos, content in assignments:
+            well = wells[pos]
+            if ((well['sample_composition_type'] == es_type and
+                    well['content'] == content) or
+                    well['sample_composition_type'] == content):
+                # The contents haven't changed
+                result.append((well['content'], True))
+                continue
+
+            contents_ok = True
+            if content in sample_types:
+                sc_type = content
+                sample_id = None
+                content = '%s.%s.%s' % (content, plate_id, well_ids[pos])
+            elif content in known_samples:
+                sc_type = es_type
+                sample_id = content
+                if plated[sample_id]:
+                    # The sample has been plated in this plate already,
+                    # all its wells hold the plate and well id
+                    for other in plated[sample_id]:
+                        set_content(other, '%s.%s.%s' % (
+                            sample_id, plate_id, well_ids[other]))
+                    content = '%s.%s.%s' % (content, plate_id, well_ids[pos])
+            else:
+                sc_type = es_type
+                sample_id = None
+                contents_ok = False
+
+            old_sample = well['sample_id']
+            if old_sample is not None:
+                plated[old_sample].discard(pos)
+            if sample_id is not None:
+                plated[sample_id].add(pos)
+            well['sample_composition_type'] = sc_type
+            well['sample_id'] = sample_id
+            set_content(pos, content)
+
+            if old_sample is not None and len(plated[old_sample]) == 1:
+                # The previous sample is left in a single other well, so
+                # the content of that well can revert to the sample id
+                other = next(iter(plated[old_sample]))
+                set_content(other, old_sample)
+
+            result.append((content, contents_ok))
+
+        return result, changed
+
+    def update_wells(self, assignments, comments=None):
+        """Updates the content and comments of multiple wells at once
+
+        All the changes are applied in a single transaction, so either all
+        the wells are updated or none of them.
+
+        Parameters
+        ----------
+        assignments: list of (int, int, str)
+            The row, column and new contents of each well to update. The
+            assignments are applied in order
+        comments: list of (int, int, str), optional
+            The row, column and new comment of each well to comment
+
+        Returns
+        -------
+        list of (str, bool)
+            The new contents of each assigned well and whether the contents
+            are a known sample or control, in the order of `assignments`
+
+        Raises
+        ------
+        LabmanError
+            If the plate doesn't have a well at any of the given positions
+        """
+        assignments = [((int(row), int(col)), content)
+                       for row, col, content in assignments]
+        comments = [((int(row), int(col)), comment)
+                    for row, col, comment in (comments or [])]
+        with sql_connection.TRN as TRN:
+            plate_id = self.plate.id
+            wells = self._get_well_compositions()
+            missing = [pos for pos, _ in chain(assignments, comments)
+                       if pos not in wells]
+            if missing:
+                raise exceptions_module.LabmanError(
+                    "Well (%s, %s) doesn't exist in plate %s"
+                    % (missing[0][0], missing[0][1], plate_id))
+
+            sql = """SELECT external_id, sample_composition_type_id
+                     FROM labman.sample_composition_type"""
+            TRN.add(sql)
+            sample_types = dict(TRN.execute_fetchindex())
+
+            known_samples = set()
+            candidates = tuple({content for _, content in assignments
+                                if content not in sample_types})
+            if candidates:
+                sql = """SELECT DISTINCT sample_id
+                         FROM qiita.study_sample
+                         WHERE sample_id IN %s"""
+                TRN.add(sql, [candidates])
+                known_samples = set(TRN.execute_fetchflatten())
+
+            result, changed = self._plan_well_updates(
+                plate_id, wells, assignments, sample_types, known_samples)
+
+            if changed:
+                values = [(wells[pos]['sample_composition_id'],
+                           sample_types[wells[pos]['sample_composition_type']],
+                           wells[pos]['sample_id'], wells[pos]['content'])
+                          for pos in sorted(changed)]
+                sql = """UPDATE labman.sample_composition sc
+                         SET sample_composition_type_id = v.sct_id,
+                             sample_id = v.sample_id,
+                             content = v.content
+                         FROM (VALUES {}) AS v (sc_id, sct_id, sample_id,
+                                                content)
+                         WHERE sc.sample_composition_id = v.sc_id""".format(
+                    ', '.join(['%s'] * len(values)))
+                TRN.add(sql, values)
+
+            if comments:
+                # Only the last comment of each well is kept
+                notes = {wells[pos]['composition_id']: comment
+                         for pos, comment in comments}
+                values = sorted(notes.items())
+                sql = """UPDATE labman.composition c
+                         SET notes = v.notes
+                         FROM (VALUES {}) AS v (composition_id, notes)
+                         WHERE c.composition_id = v.composition_id""".format(
+                    ', '.join(['%s'] * len(values)))
+                TRN.add(sql, values)
+
+            TRN.execute()
+
+        return result
+
+    @staticmethod
+    def parse_plate_map(contents):
+        """Parses a plate map file
+
+        Parameters
+        ----------
+        contents : str
+            The contents of the plate map, as a comma or tab separated file
+            with a header row. The "well" and "sample" columns are required
+            and the "notes" column is optional
+
+        Returns
+        -------
+        list of dict
+            The line number, well, sample and notes of each row of the plate
+            map. Empty samples and notes are returned as None
+
+        Raises
+        ------
+        ValueError
+            If the plate map doesn't have the required columns
+        """
+        lines = contents.splitlines()
+        header = lines[0] if lines else ''
+        reader = csv.reader(lines, delimiter='\t' if '\t' in header else ',')
+        columns = [c.strip().lower() for c in next(reader, [])]
+        missing = [c for c in ('well', 'sample') if c not in columns]
+        if missing:
+            raise ValueError('The plate map is missing the required columns: '
+                             '%s' % ', '.join(missing))
+        indices = {c: columns.index(c) for c in ('well', 'sample', 'notes')
+                   if c in columns}
+
+        plate_map = []
+        for line_num, values in enumerate(reader, start=2):
+            if not any(v.strip() for v in values):
+                continue
+            record = {'line': line_num}
+            for column in ('well', 'sample', 'notes'):
+                value = (values[indices[column]].strip()
+                         if column in indices and len(values) > indices[column]
+                         else '')
+                record[column] = value if value else None
+            plate_map.append(record)
+        return plate_map
+
+    def iter_plate_map_errors(self, plate_map):
+        """Validates a plate map against the plate
+
+        All the samples in the plate map are validated with a single query
+
+        Parameters
+        ----------
+        plate_map : list of dict
+            The plate map, as returned by `parse_plate_map`
+
+        Yields
+        ------
+        str
+            The errors found in the plate map
+        """
+        pc = self.plate.plate_configuration
+        seen = {}
+        samples = defaultdict(list)
+        for record in plate_map:
+            line = record['line']
+            if record['well'] is None:
+                yield 'Line %d: missing well' % line
+                continue
+            try:
+                pos = container_module.Well.parse_well_id(record['well'])
+            except ValueError as e:
+                yield 'Line %d: %s' % (line, e)
+                continue
+            if pos[0] > pc.num_rows or pos[1] > pc.num_columns:
+                yield 'Line %d: well %s is outside of the plate' % (
+                    line, record['well'])
+                continue
+            if pos in seen:
+                yield 'Line %d: well %s is already in line %d' % (
+                    line, record['well'], seen[pos])
+                continue
+            seen[pos] = line
+            if record['sample'] is not None:
+                samples[record['sample']].append(line)
+
+        if samples:
+            with sql_connection.TRN as TRN:
+                sql = """SELECT sample_id
+                         FROM qiita.study_sample
+                         WHERE sample_id IN %s
+                         UNION
+                         SELECT external_id
+                         FROM labman.sample_composition_type
+                         WHERE external_id IN %s
+                            AND external_id != 'experimental sample'"""
+                TRN.add(sql, [tuple(samples), tuple(samples)])
+                known = set(TRN.execute_fetchflatten())
+            unknown = sorted((line, sample)
+                             for sample, lines in samples.items()
+                             if sample not in known for line in lines)
+            for line, sample in unknown:
+                yield 'Line %d: sample %s is not a known sample or control' % (
+                    line, sample)
+
+    def import_plate_map(self, plate_map):
+        """Applies a plate map to the plate
+
+        The plate map is validated before applying any change, and all the
+        wells are updated in a single transaction
+
+        Parameters
+        ----------
+        plate_map : list of dict
+            The plate map, as returned by `parse_plate_map`
+
+        Returns
+        -------
+        list of (str, str, bool)
+            The well id, the new contents of the well and whether the
+            contents are a known sample or control, for each plated well
+
+        Raises
+        ------
+        LabmanError
+            If the plate map is not valid
+        """
+        with sql_connection.TRN:
+            errors = list(self.iter_plate_map_errors(plate_map))
+            if errors:
+                raise exceptions_module.LabmanError(
+                    'The plate map is not valid:\n%s' % '\n'.join(errors))
+
+            assignments = []
+            comments = []
+            wells = []
+            for record in plate_map:
+                row, col = container_module.Well.parse_well_id(record['well'])
+                if record['sample'] is not None:
+                    assignments.append((row, col, record['sample']))
+                    wells.append(
+                        container_module.Well.format_well_id(row, col))
+                if record['notes'] is not None:
+                    comments.append((row, col, record['notes']))
+            result = self.update_wells(assignments, comments)
+
+        return [(well, content, ok)
+                for well, (content, ok) in zip(wells, result)]
+
 
 class ReagentCreationProcess(_Process):
     """Reagent creation process"""
@@ -426,8 +866,19 @@ class PrimerWorkingPlateCreationProcess(Process):
             creation_date = instance.date
             plate_name_suffix = creation_date.strftime(
                 Process.get_date_format())
-            primer_set_plates = primer_set.plates
-            check_name = '%s %s' % (primer_set_plates[0].external_id,
+            sql = """SELECT plate_id, external_id
+                     FROM labman.plate
+                     WHERE plate_id IN (
+                        SELECT plate_id
+                        FROM labman.well
+                            JOIN labman.composition USING (container_id)
+                            JOIN labman.primer_set_composition
+                                USING (composition_id)
+                        WHERE primer_set_id = %s)
+                     ORDER BY plate_id"""
+            TRN.add(sql, [primer_set.id])
+            primer_set_plates = TRN.execute_fetchindex()
+            check_name = '%s %s' % (primer_set_plates[0]['external_id'],
                                     plate_name_suffix)
             if plate_module.Plate.external_id_exists(check_name):
                 # The likelihood of this happening in the real system is really
@@ -435,21 +886,35 @@ class PrimerWorkingPlateCreationProcess(Process):
                 plate_name_suffix = "{0} {1}".format(plate_name_suffix,
                                                      randrange(1000, 9999))
 
-            for ps_plate in primer_set_plates:
-                # Create a new working primer plate
-                plate_name = '%s %s' % (ps_plate.external_id,
-                                        plate_name_suffix)
-                plate_config = ps_plate.plate_configuration
-                work_plate = plate_module.Plate.create(
-                    plate_name, plate_config)
-                # Add the wells to the new plate
-                for row in ps_plate.layout:
-                    for ps_well in row:
-                        w_well = container_module.Well.create(
-                            work_plate, instance, 10, ps_well.row,
-                            ps_well.column)
-                        composition_module.PrimerComposition.create(
-                            instance, w_well, 10, ps_well.composition)
+            # Create a new working primer plate per template plate
+            sql = """INSERT INTO labman.plate
+                        (external_id, plate_configuration_id)
+                     SELECT external_id || ' ' || %s, plate_configuration_id
+                     FROM labman.plate
+                     WHERE plate_id IN %s
+                     ORDER BY plate_id"""
+            TRN.add(sql, [plate_name_suffix,
+                          tuple(p['plate_id'] for p in primer_set_plates)])
+
+            # Add the wells of all the template plates to their working
+            # plates. The plate external ids are unique, so each working
+            # plate is found by its name
+            sql = """SELECT wp.plate_id, tw.row_num, tw.col_num,
+                            %(volume)s AS volume, primer_set_composition_id
+                     FROM labman.primer_set_composition
+                        JOIN labman.composition USING (composition_id)
+                        JOIN labman.well tw USING (container_id)
+                        JOIN labman.plate tp ON tp.plate_id = tw.plate_id
+                        JOIN labman.plate wp
+                            ON wp.external_id =
+                                tp.external_id || ' ' || %(suffix)s
+                     WHERE primer_set_id = %(primer_set_id)s
+                     ORDER BY tw.plate_id, tw.row_num, tw.col_num"""
+            cls._create_plate_wells(
+                process_id, None, composition_module.PrimerComposition,
+                ['primer_set_composition_id'], sql,
+                {'volume': 10, 'suffix': plate_name_suffix,
+                 'primer_set_id': primer_set.id})
 
         return instance
 
@@ -643,16 +1108,21 @@ class GDNAExtractionProcess(Process):
             plate_config = plate.plate_configuration
             gdna_plate = plate_module.Plate.create(
                 gdna_plate_name, plate_config)
-            plate_layout = plate.layout
-            # Add the wells to the new plate
-            for i in range(plate_config.num_rows):
-                for j in range(plate_config.num_columns):
-                    plated_sample = plate_layout[i][j].composition
-                    if plated_sample.sample_composition_type != 'empty':
-                        well = container_module.Well.create(
-                            gdna_plate, instance, volume, i + 1, j + 1)
-                        composition_module.GDNAComposition.create(
-                            instance, well, volume, plated_sample)
+            # Add the wells to the new plate, skipping the empty wells
+            sql = """SELECT row_num, col_num, %(volume)s AS volume,
+                            sample_composition_id
+                     FROM labman.well
+                        JOIN labman.composition USING (container_id)
+                        JOIN labman.sample_composition USING (composition_id)
+                        JOIN labman.sample_composition_type
+                            USING (sample_composition_type_id)
+                     WHERE plate_id = %(plate_id)s
+                        AND external_id != 'empty'
+                     ORDER BY row_num, col_num"""
+            cls._create_plate_wells(
+                process_id, gdna_plate, composition_module.GDNAComposition,
+                ['sample_composition_id'], sql,
+                {'volume': volume, 'plate_id': plate.id})
 
         return instance
 
@@ -671,24 +1141,6 @@ class GDNAPlateCompressionProcess(Process):
     _id_column = 'compression_process_id'
     _process_type = "compressed gDNA plates"
 
-    def _compress_plate(self, out_plate, in_plate, row_pad, col_pad, volume=1):
-        """Compresses the 96-well in_plate into the 384-well out_plate"""
-        with sql_connection.TRN:
-            layout = in_plate.layout
-            for row in layout:
-                for well in row:
-                    if well is not None:
-                        # The row/col pair is stored in the DB starting at 1
-                        # subtract 1 to make it start at 0 so the math works
-                        # and re-add 1 at the end
-                        out_well_row = (((well.row - 1) * 2) + row_pad) + 1
-                        out_well_col = (((well.column - 1) * 2) + col_pad) + 1
-                        out_well = container_module.Well.create(
-                            out_plate, self, volume, out_well_row,
-                            out_well_col)
-                        composition_module.CompressedGDNAComposition.create(
-                            self, out_well, volume, well.composition)
-
     @classmethod
     def create(cls, user, plates, plate_ext_id, robot):
         """Creates a new gDNA compression process
@@ -733,12 +1185,30 @@ class GDNAPlateCompressionProcess(Process):
             plate = plate_module.Plate.create(
                 plate_ext_id, plate_module.PlateConfiguration(3))
 
-            # Compress the plates
-            for i, in_plate in enumerate(plates):
-                row_pad = int(np.floor(i / 2))
-                col_pad = i % 2
-
-                instance._compress_plate(plate, in_plate, row_pad, col_pad)
+            # Compress the plates. The i-th input plate (starting at 0) fills
+            # the wells of the 384-well plate with a row offset of i // 2 and
+            # a column offset of i % 2. The row/col pairs are stored in the DB
+            # starting at 1, hence subtracting 1 before interleaving them and
+            # re-adding 1 at the end
+            sql = """SELECT (w.row_num - 1) * 2 + (inp.idx - 1) / 2 + 1
+                                AS row_num,
+                            (w.col_num - 1) * 2 + mod(inp.idx - 1, 2) + 1
+                                AS col_num,
+                            %(volume)s AS volume,
+                            gdna_composition_id
+                     FROM (SELECT (%(plate_ids)s::bigint[])[i] AS plate_id,
+                                  i AS idx
+                           FROM generate_subscripts(%(plate_ids)s::bigint[],
+                                                    1) i) inp
+                        JOIN labman.well w USING (plate_id)
+                        JOIN labman.composition USING (container_id)
+                        JOIN labman.gdna_composition USING (composition_id)
+                     ORDER BY inp.idx, w.row_num, w.col_num"""
+            cls._create_plate_wells(
+                process_id, plate,
+                composition_module.CompressedGDNAComposition,
+                ['gdna_composition_id'], sql,
+                {'volume': 1, 'plate_ids': [p.id for p in plates]})
 
         return instance
 
@@ -826,8 +1296,46 @@ class LibraryPrep16SProcess(Process):
         Returns
         -------
         LibraryPrep16SProcess
+
+        Raises
+        ------
+        LabmanError
+            If the primer plate doesn't have a primer in the position of any
+            of the gDNA wells
         """
         with sql_connection.TRN as TRN:
+            sql_args = {'volume': volume, 'plate_id': plate.id,
+                        'primer_plate_id': primer_plate.id}
+            primer_join = """labman.well gw
+                        JOIN labman.composition gcomp
+                            ON gcomp.container_id = gw.container_id
+                        JOIN labman.gdna_composition gc
+                            ON gc.composition_id = gcomp.composition_id
+                        {} (labman.well pw
+                            JOIN labman.composition pcomp
+                                ON pcomp.container_id = pw.container_id
+                            JOIN labman.primer_composition pc
+                                ON pc.composition_id = pcomp.composition_id)
+                            ON pw.plate_id = %(primer_plate_id)s
+                                AND pw.row_num = gw.row_num
+                                AND pw.col_num = gw.col_num"""
+            # Fail before creating anything if a gDNA well doesn't have a
+            # primer in the same position of the primer plate
+            sql = """SELECT gw.row_num, gw.col_num
+                     FROM {}
+                     WHERE gw.plate_id = %(plate_id)s
+                        AND pc.primer_composition_id IS NULL
+                     ORDER BY gw.row_num, gw.col_num""".format(
+                primer_join.format('LEFT JOIN'))
+            TRN.add(sql, sql_args)
+            missing = TRN.execute_fetchindex()
+            if missing:
+                raise exceptions_module.LabmanError(
+                    'The primer plate %s does not have a primer in the wells '
+                    '%s' % (primer_plate.external_id,
+                            ', '.join(container_module.Well.format_well_id(
+                                row, col) for row, col in missing)))
+
             # Add the row to the process table
             process_id = cls._common_creation_steps(
                 user, process_date=preparation_date)
@@ -847,17 +1355,19 @@ class LibraryPrep16SProcess(Process):
             plate_config = plate.plate_configuration
             library_plate = plate_module.Plate.create(lib_plate_name,
                                                       plate_config)
-            gdna_layout = plate.layout
-            primer_layout = primer_plate.layout
-            for i in range(plate_config.num_rows):
-                for j in range(plate_config.num_columns):
-                    if gdna_layout[i][j] is not None:
-                        well = container_module.Well.create(
-                            library_plate, instance, volume, i + 1, j + 1)
-                        composition_module.LibraryPrep16SComposition.create(
-                            instance, well, volume,
-                            gdna_layout[i][j].composition,
-                            primer_layout[i][j].composition)
+            # Each gDNA well is combined with the primer in the same position
+            # of the primer plate
+            sql = """SELECT gw.row_num, gw.col_num, %(volume)s AS volume,
+                            gc.gdna_composition_id, pc.primer_composition_id
+                     FROM {}
+                     WHERE gw.plate_id = %(plate_id)s
+                     ORDER BY gw.row_num, gw.col_num""".format(
+                primer_join.format('JOIN'))
+            cls._create_plate_wells(
+                process_id, library_plate,
+                composition_module.LibraryPrep16SComposition,
+                ['gdna_composition_id', 'primer_composition_id'], sql,
+                sql_args)
 
         return instance
 
@@ -992,6 +1502,31 @@ class NormalizationProcess(Process):
     _id_column = 'normalization_process_id'
     _process_type = 'gDNA normalization'
 
+    @staticmethod
+    def _build_reformat_map(num_rows=16, num_columns=24):
+        """Maps the wells of an interleaved plate to the column format
+
+        Parameters
+        ----------
+        num_rows : int, optional
+            The number of rows of the plate. Default: 16
+        num_columns : int, optional
+            The number of columns of the plate. Default: 24
+
+        Returns
+        -------
+        numpy array of int
+            A (num_rows, num_columns, 2) array in which the entry [i][j]
+            holds the row and column, starting at 1, in which the well at
+            row i and column j, starting at 0, is placed when reformatting
+        """
+        import numpy as np
+
+        rows, cols = np.indices((num_rows, num_columns))
+        new_rows = rows - rows % 2 + cols // 12 + 1
+        new_cols = (cols % 2 + (new_rows % 2) * 2) * 6 + (cols // 2) % 6 + 1
+        return np.stack([new_rows, new_cols], axis=-1)
+
     @staticmethod
     def _calculate_norm_vol(dna_concs, ng=5, min_vol=2.5, max_vol=3500,
                             resolution=2.5):
@@ -1015,6 +1550,8 @@ class NormalizationProcess(Process):
         sample_vols : numpy array of float
             The volumes to pool (nL)
         """
+        import numpy as np
+
         sample_vols = ng / np.nan_to_num(dna_concs) * 1000
         sample_vols = np.clip(sample_vols, min_vol, max_vol)
         sample_vols = np.round(sample_vols / resolution) * resolution
@@ -1055,6 +1592,8 @@ class NormalizationProcess(Process):
         -------
         NormalizationProcess
         """
+        import numpy as np
+
         with sql_connection.TRN as TRN:
             # Add the row to the process table
             process_id = cls._common_creation_steps(user)
@@ -1074,36 +1613,57 @@ class NormalizationProcess(Process):
                           dumps(func_data)])
             instance = cls(TRN.execute_fetchlast())
 
-            # Retrieve all the concentration values
-            concs = quant_process.concentrations
+            # Retrieve all the concentration values and the wells of the
+            # quantified compositions
+            sql = """SELECT raw_concentration, row_num, col_num,
+                            compressed_gdna_composition_id
+                     FROM labman.concentration_calculation cc
+                        JOIN labman.composition c
+                            ON cc.quantitated_composition_id =
+                                c.composition_id
+                        JOIN labman.well USING (container_id)
+                        JOIN labman.compressed_gdna_composition cgc
+                            ON cgc.composition_id = c.composition_id
+                     WHERE cc.upstream_process_id = %s
+                     ORDER BY concentration_calculation_id"""
+            TRN.add(sql, [quant_process.id])
+            concs = TRN.execute_fetchindex()
             # Transform the concentrations to a numpy array
-            np_conc = np.asarray([raw_con for _, raw_con, _ in concs])
+            np_conc = np.asarray([c['raw_concentration'] for c in concs],
+                                 dtype=float)
             dna_v = NormalizationProcess._calculate_norm_vol(
                 np_conc, ng, min_vol, max_vol, resolution)
             water_v = total_vol - dna_v
 
+            rows = np.asarray([c['row_num'] for c in concs], dtype=int)
+            cols = np.asarray([c['col_num'] for c in concs], dtype=int)
+            if reformat and len(concs):
+                positions = NormalizationProcess._build_reformat_map()[
+                    rows - 1, cols - 1]
+                rows, cols = positions[:, 0], positions[:, 1]
+
             # Create the plate. 3 -> 384-well plate
             plate_config = plate_module.PlateConfiguration(3)
             plate = plate_module.Plate.create(plate_name, plate_config)
-            for (comp, _, _), dna_vol, water_vol in zip(concs, dna_v, water_v):
-                comp_well = comp.container
-                row = comp_well.row
-                column = comp_well.column
-
-                if reformat:
-                    row = row - 1
-                    column = column - 1
-
-                    roffset = row % 2
-                    row = int(row - roffset + np.floor(column / 12)) + 1
-
-                    coffset = column % 2 + (row % 2) * 2
-                    column = int(coffset * 6 + (column / 2) % 6) + 1
-
-                well = container_module.Well.create(
-                    plate, instance, total_vol, row, column)
-                composition_module.NormalizedGDNAComposition.create(
-                    instance, well, total_vol, comp, dna_vol, water_vol)
+            sql = """SELECT row_num, col_num, %(volume)s AS volume,
+                            compressed_gdna_composition_id, dna_volume,
+                            water_volume
+                     FROM unnest(%(rows)s::integer[], %(cols)s::integer[],
+                                 %(comp_ids)s::bigint[], %(dna)s::real[],
+                                 %(water)s::real[])
+                        AS v (row_num, col_num,
+                              compressed_gdna_composition_id, dna_volume,
+                              water_volume)"""
+            cls._create_plate_wells(
+                process_id, plate,
+                composition_module.NormalizedGDNAComposition,
+                ['compressed_gdna_composition_id', 'dna_volume',
+                 'water_volume'], sql,
+                {'volume': total_vol, 'rows': rows.tolist(),
+                 'cols': cols.tolist(),
+                 'comp_ids': [c['compressed_gdna_composition_id']
+                              for c in concs],
+                 'dna': dna_v.tolist(), 'water': water_v.tolist()})
 
         return instance
 
@@ -1191,6 +1751,8 @@ class NormalizationProcess(Process):
         picklist : str
             The Echo formatted pick list
         """
+        import numpy as np
+
         # check that arrays are the right size
         if dna_vols.shape != wells.shape != water_vols.shape:
             raise ValueError(
@@ -1235,6 +1797,7 @@ class NormalizationProcess(Process):
 
         return '\n'.join(picklist)
 
+    @metrics.timed_artifact('normalization_picklist')
     def generate_echo_picklist(self):
         """Generates Echo pick list to achieve a normalized input DNA pool
 
@@ -1243,6 +1806,8 @@ class NormalizationProcess(Process):
         str
             The echo-formatted pick list
         """
+        import pandas as pd
+
         concentrations = {
             comp: conc
             for comp, conc, _ in self.quantification_process.concentrations}
@@ -1572,35 +2137,161 @@ class LibraryPrepShotgunProcess(Process):
         str
             The Echo formatted pick list
         """
+        return '\n'.join(LibraryPrepShotgunProcess._iter_picklist(
+            sample_names, sample_wells, indices, i5_vol=i5_vol, i7_vol=i7_vol,
+            i5_plate_type=i5_plate_type, i7_plate_type=i7_plate_type,
+            dest_plate_name=dest_plate_name))
+
+    @staticmethod
+    def _iter_picklist(sample_names, sample_wells, indices, i5_vol=250,
+                       i7_vol=250, i5_plate_type='384LDV_AQ_B2_HT',
+                       i7_plate_type='384LDV_AQ_B2_HT',
+                       dest_plate_name='IndexPCRPlate'):
+        """Generates the lines of the Echo-format pick list
+
+        The lines are built column-wise with vectorized string operations
+
+        Parameters
+        ----------
+        See `_format_picklist`. `indices` can be a pandas DataFrame or a dict
+        of array-likes
+
+        Yields
+        ------
+        str
+            The lines of the pick list, without the line terminator
+        """
+        import numpy as np
+
         # check that arrays are the right size
-        if len(sample_names) != len(sample_wells) != len(indices):
+        num_indices = len(np.asarray(indices['i5 name']))
+        if len(sample_names) != len(sample_wells) != num_indices:
             raise ValueError(
                 'sample_names (%s) has a size different from sample_wells '
                 '(%s) or index list (%s)'
-                % (len(sample_names), len(sample_wells), len(indices)))
+                % (len(sample_names), len(sample_wells), num_indices))
 
         # header
-        picklist = [
-            'Sample\tSource Plate Name\tSource Plate Type\tSource Well\t'
-            'Transfer Volume\tIndex Name\tIndex Sequence\t'
-            'Destination Plate Name\tDestination Well']
-
-        # i5 additions
-        for i, (sample, well) in enumerate(zip(sample_names, sample_wells)):
-            picklist.append('\t'.join([
-                str(sample), indices.iloc[i]['i5 plate'], i5_plate_type,
-                indices.iloc[i]['i5 well'], str(i5_vol),
-                indices.iloc[i]['i5 name'], indices.iloc[i]['i5 sequence'],
-                dest_plate_name, well]))
-        # i7 additions
-        for i, (sample, well) in enumerate(zip(sample_names, sample_wells)):
-            picklist.append('\t'.join([
-                str(sample), indices.iloc[i]['i7 plate'], i7_plate_type,
-                indices.iloc[i]['i7 well'], str(i7_vol),
-                indices.iloc[i]['i7 name'], indices.iloc[i]['i7 sequence'],
-                dest_plate_name, well]))
+        yield ('Sample\tSource Plate Name\tSource Plate Type\tSource Well\t'
+               'Transfer Volume\tIndex Name\tIndex Sequence\t'
+               'Destination Plate Name\tDestination Well')
+
+        def join_columns(*columns):
+            lines = np.asarray(columns[0], dtype=str)
+            for column in columns[1:]:
+                lines = np.char.add(np.char.add(lines, '\t'),
+                                    np.asarray(column, dtype=str))
+            return lines
+
+        sample_names = np.asarray(sample_names, dtype=str)
+        sample_wells = np.asarray(sample_wells, dtype=str)
+        for prefix, vol, plate_type in (('i5', i5_vol, i5_plate_type),
+                                        ('i7', i7_vol, i7_plate_type)):
+            lines = join_columns(
+                sample_names, indices['%s plate' % prefix],
+                np.full(len(sample_names), plate_type),
+                indices['%s well' % prefix],
+                np.full(len(sample_names), str(vol)),
+                indices['%s name' % prefix],
+                indices['%s sequence' % prefix],
+                np.full(len(sample_names), dest_plate_name), sample_wells)
+            for line in lines.tolist():
+                yield line
 
-        return '\n'.join(picklist)
+    @staticmethod
+    def _format_well_ids(rows, cols):
+        """Vectorized version of Well.format_well_id for rows up to 26"""
+        import numpy as np
+
+        letters = np.asarray(list(container_module.LETTERS))
+        return np.char.add(letters[np.asarray(rows, dtype=int) - 1],
+                           np.asarray(cols, dtype=int).astype(str))
+
+    @metrics.timed_artifact('shotgun_library_picklist')
+    def iter_echo_picklist(self):
+        """Generates the lines of the Echo pick list for preparing the
+        shotgun library
+
+        The sample names and the information of the indices of all the wells
+        are retrieved with a single query
+
+        Yields
+        ------
+        str
+            The lines of the echo-formatted pick list, without the line
+            terminator
+        """
+        import numpy as np
+
+        with sql_connection.TRN as TRN:
+            sql = """SELECT lw.row_num, lw.col_num, sc.content,
+                            i5psc.external_id AS i5_name,
+                            i5p.external_id AS i5_plate,
+                            i5psc.barcode_seq AS i5_sequence,
+                            i5w.row_num AS i5_row, i5w.col_num AS i5_col,
+                            i7psc.external_id AS i7_name,
+                            i7p.external_id AS i7_plate,
+                            i7psc.barcode_seq AS i7_sequence,
+                            i7w.row_num AS i7_row, i7w.col_num AS i7_col
+                     FROM labman.composition lc
+                        JOIN labman.well lw
+                            ON lw.container_id = lc.container_id
+                        JOIN labman.library_prep_shotgun_composition lps
+                            ON lps.composition_id = lc.composition_id
+                        JOIN labman.normalized_gdna_composition
+                            USING (normalized_gdna_composition_id)
+                        JOIN labman.compressed_gdna_composition
+                            USING (compressed_gdna_composition_id)
+                        JOIN labman.gdna_composition
+                            USING (gdna_composition_id)
+                        JOIN labman.sample_composition sc
+                            USING (sample_composition_id)
+                        JOIN labman.primer_composition i5pc
+                            ON i5pc.primer_composition_id =
+                                lps.i5_primer_composition_id
+                        JOIN labman.primer_set_composition i5psc
+                            ON i5psc.primer_set_composition_id =
+                                i5pc.primer_set_composition_id
+                        JOIN labman.composition i5c
+                            ON i5c.composition_id = i5psc.composition_id
+                        JOIN labman.well i5w
+                            ON i5w.container_id = i5c.container_id
+                        JOIN labman.plate i5p ON i5p.plate_id = i5w.plate_id
+                        JOIN labman.primer_composition i7pc
+                            ON i7pc.primer_composition_id =
+                                lps.i7_primer_composition_id
+                        JOIN labman.primer_set_composition i7psc
+                            ON i7psc.primer_set_composition_id =
+                                i7pc.primer_set_composition_id
+                        JOIN labman.composition i7c
+                            ON i7c.composition_id = i7psc.composition_id
+                        JOIN labman.well i7w
+                            ON i7w.container_id = i7c.container_id
+                        JOIN labman.plate i7p ON i7p.plate_id = i7w.plate_id
+                     WHERE lc.upstream_process_id = %s
+                     ORDER BY lw.row_num, lw.col_num"""
+            TRN.add(sql, [self.process_id])
+            records = TRN.execute_fetchindex()
+
+        columns = {key: np.asarray([r[key] for r in records], dtype=object)
+                   for key in ('row_num', 'col_num', 'content', 'i5_name',
+                               'i5_plate', 'i5_sequence', 'i5_row', 'i5_col',
+                               'i7_name', 'i7_plate', 'i7_sequence', 'i7_row',
+                               'i7_col')}
+        indices = {}
+        for prefix in ('i5', 'i7'):
+            for key in ('name', 'plate', 'sequence'):
+                indices['%s %s' % (prefix, key)] = columns[
+                    '%s_%s' % (prefix, key)]
+            indices['%s well' % prefix] = \
+                LibraryPrepShotgunProcess._format_well_ids(
+                    columns['%s_row' % prefix], columns['%s_col' % prefix])
+        sample_wells = LibraryPrepShotgunProcess._format_well_ids(
+            columns['row_num'], columns['col_num'])
+
+        for line in LibraryPrepShotgunProcess._iter_picklist(
+                columns['content'], sample_wells, indices):
+            yield line
 
     def generate_echo_picklist(self):
         """Generates Echo pick list for preparing the shotgun library
@@ -1610,48 +2301,7 @@ class LibraryPrepShotgunProcess(Process):
         str
             The echo-formatted pick list
         """
-        sample_names = []
-        sample_wells = []
-        indices = {'i5 name': {}, 'i5 plate': {}, 'i5 sequence': {},
-                   'i5 well': {}, 'i7 name': {}, 'i7 plate': {},
-                   'i7 sequence': {}, 'i7 well': {}, 'index combo': {},
-                   'index combo seq': {}}
-
-        for idx, well in enumerate(chain.from_iterable(self.plates[0].layout)):
-            if well is None:
-                continue
-            # Add the sample well
-            sample_wells.append(well.well_id)
-            # Get the sample name - we need to go back to the SampleComposition
-            lib_comp = well.composition
-            sample_comp = lib_comp.normalized_gdna_composition\
-                .compressed_gdna_composition.gdna_composition\
-                .sample_composition
-            sample_names.append(sample_comp.content)
-            # Retrieve all the information about the indices
-            i5_comp = lib_comp.i5_composition.primer_set_composition
-            i5_well = i5_comp.container
-            indices['i5 name'][idx] = i5_comp.external_id
-            indices['i5 plate'][idx] = i5_well.plate.external_id
-            indices['i5 sequence'][idx] = i5_comp.barcode
-            indices['i5 well'][idx] = i5_well.well_id
-
-            i7_comp = lib_comp.i7_composition.primer_set_composition
-            i7_well = i7_comp.container
-            indices['i7 name'][idx] = i7_comp.external_id
-            indices['i7 plate'][idx] = i7_well.plate.external_id
-            indices['i7 sequence'][idx] = i7_comp.barcode
-            indices['i7 well'][idx] = i7_well.well_id
-
-            indices['index combo seq'][idx] = '%s%s' % (
-                indices['i5 sequence'][idx], indices['i7 sequence'][idx])
-
-        sample_names = np.asarray(sample_names)
-        sample_wells = np.asarray(sample_wells)
-        indices = pd.DataFrame(indices)
-
-        return LibraryPrepShotgunProcess._format_picklist(
-            sample_names, sample_wells, indices)
+        return '\n'.join(self.iter_echo_picklist())
 
 
 class QuantificationProcess(Process):
@@ -1713,6 +2363,8 @@ class QuantificationProcess(Process):
         -------
         numpy 2D array
         """
+        import numpy as np
+
         # initialize empty Cp array
         cp_array = np.empty((rows, cols), dtype=object)
 
@@ -1744,6 +2396,7 @@ class QuantificationProcess(Process):
         pico_df: pandas DataFrame object
             DataFrame relating well location and DNA concentration
         """
+        import pandas as pd
 
         cleaned_contents = QuantificationProcess._rationalize_pico_csv_string(
             contents)
@@ -1980,6 +2633,8 @@ class QuantificationProcess(Process):
         size: int, optional
             The average library molecule size, in bp.
         """
+        import numpy as np
+
         concentrations = self.concentrations
         layout = concentrations[0][0].container.plate.layout
 
@@ -2028,6 +2683,25 @@ class PoolingProcess(Process):
     _id_column = 'pooling_process_id'
     _process_type = 'pooling'
 
+    @staticmethod
+    def _plate_axes(values):
+        """Returns the axes of `values` that span a single plate
+
+        Pooling arrays are either a single plate (rows x cols) or a stack of
+        plates (..., rows x cols); any leading axes are treated as batch axes.
+
+        Parameters
+        ----------
+        values : numpy array
+            The per-well values
+
+        Returns
+        -------
+        tuple of int
+            The axes spanning the wells of a single plate
+        """
+        return tuple(range(max(values.ndim - 2, 0), values.ndim))
+
     @staticmethod
     def estimate_pool_conc_vol(sample_vols, sample_concs):
         """Estimates the molarity and volume of a pool.
@@ -2041,20 +2715,25 @@ class PoolingProcess(Process):
 
         Returns
         -------
-        pool_conc : float
-            The estimated actual concentration of the pool, in nM
-        total_vol : float
-            The total volume of the pool, in nL
+        pool_conc : float or numpy array of float
+            The estimated actual concentration of the pool, in nM. If the
+            inputs are stacks of plates, one value per plate is returned
+        total_vol : float or numpy array of float
+            The total volume of the pool, in nL. If the inputs are stacks of
+            plates, one value per plate is returned
         """
+        import numpy as np
+
+        axes = PoolingProcess._plate_axes(np.asarray(sample_vols))
         # scalar to adjust nL to L for molarity calculations
         nl_scalar = 1e-9
         # calc total pool pmols
         total_pmols = np.multiply(sample_concs, sample_vols) * nl_scalar
         # calc total pool vol in nanoliters
-        total_vol = sample_vols.sum()
+        total_vol = sample_vols.sum(axis=axes)
         # pool pM is total pmols divided by total liters
         # (total vol in nL * 1 L / 10^9 nL)
-        pool_conc = total_pmols.sum() / (total_vol * nl_scalar)
+        pool_conc = total_pmols.sum(axis=axes) / (total_vol * nl_scalar)
         return (pool_conc, total_vol)
 
     @staticmethod
@@ -2065,16 +2744,22 @@ class PoolingProcess(Process):
         Parameters
         ----------
         sample_concs : numpy array of float
-            The concentrations calculated via PicoGreen (nM)
-        total_vol : float, optional
-            The total volume to pool (uL). Default: 60
+            The concentrations calculated via PicoGreen (nM). Either a single
+            plate (rows x cols) or a stack of plates (plates x rows x cols)
+        total_vol : float or numpy array of float, optional
+            The total volume to pool per plate (uL). Default: 60
 
         Returns
         -------
         np.array of floats
-            A 2D array of floats
+            An array of floats with the same shape as `sample_concs`
         """
-        per_sample_vol = (total_vol / sample_concs.size) * 1000.0
+        import numpy as np
+
+        num_wells = np.prod(
+            [sample_concs.shape[ax]
+             for ax in PoolingProcess._plate_axes(sample_concs)])
+        per_sample_vol = (np.asarray(total_vol) / num_wells) * 1000.0
         sample_vols = np.zeros(sample_concs.shape) + per_sample_vol
         return sample_vols
 
@@ -2106,11 +2791,16 @@ class PoolingProcess(Process):
         due to exclusion of primer dimers (1/2), figure we need 4 times that or
         0.0024.
 
+        All the numeric parameters can also be arrays that broadcast against
+        `sample_concs`, which allows computing several parameter values in a
+        single call (see `compute_pooling_values_sweep`).
+
         Parameters
         ----------
-        sample_concs: 2D array of float
-            sample concentrations, with numerator same units as `total`.
-        sample_fracs: 2D of float, optional
+        sample_concs: 2D or 3D array of float
+            sample concentrations, with numerator same units as `total`. A
+            3D array is interpreted as a stack of plates (plates x rows x cols)
+        sample_fracs: 2D or 3D array of float, optional
             fractional value for each sample (default 1/N)
         floor_vol: float, optional
             volume at which samples below floor_conc will be pooled.
@@ -2135,24 +2825,84 @@ class PoolingProcess(Process):
         sample_vols: np.array of floats
             the volumes in nL per each sample pooled
         """
+        import numpy as np
 
         if sample_fracs is None:
             sample_fracs = np.ones(sample_concs.shape)
 
         if not total_each:
-            sample_fracs = sample_fracs / sample_concs.size
+            # the total quantity is split among the wells of each plate
+            num_wells = np.prod(
+                [sample_concs.shape[ax]
+                 for ax in PoolingProcess._plate_axes(sample_concs)])
+            sample_fracs = sample_fracs / num_wells
 
         with np.errstate(divide='ignore'):
             # calculate volumetric fractions including floor val
             sample_vols = (total * sample_fracs) / sample_concs
 
         # convert volume from concentration units to pooling units
-        sample_vols *= vol_constant
+        sample_vols = sample_vols * vol_constant
         # drop volumes for samples below floor concentration to floor_vol
-        sample_vols[sample_concs < floor_conc] = floor_vol
+        sample_vols = np.where(sample_concs < floor_conc, floor_vol,
+                               sample_vols).astype(float)
 
         return sample_vols
 
+    @staticmethod
+    def compute_pooling_values_sweep(function, sample_concs, parameter,
+                                     values, **kwargs):
+        """Computes pooling volumes for a range of values of one parameter
+
+        Parameters
+        ----------
+        function : callable
+            The pooling function, e.g. `compute_pooling_values_minvol`
+        sample_concs : 2D or 3D array of float
+            The sample concentrations, either a single plate or a stack of
+            plates (plates x rows x cols)
+        parameter : str
+            The name of the `function` parameter to sweep, e.g. 'floor_conc'
+        values : list of float
+            The values of `parameter` to try
+        kwargs : dict
+            Any other parameter to pass to `function`
+
+        Returns
+        -------
+        sample_vols : np.array of float
+            The pooling volumes, with shape (len(values),) +
+            sample_concs.shape
+        pool_concs : np.array of float
+            The estimated pool concentration for each value (and plate)
+        pool_vols : np.array of float
+            The estimated pool volume for each value (and plate)
+
+        Raises
+        ------
+        ValueError
+            If `parameter` is also provided in kwargs or `values` is empty
+        """
+        import numpy as np
+
+        if parameter in kwargs:
+            raise ValueError("Parameter %s can't be both swept and fixed"
+                             % parameter)
+        values = np.asarray(values, dtype=float)
+        if values.ndim != 1 or values.size == 0:
+            raise ValueError("values must be a non-empty list of values")
+
+        # Put the swept values on a new leading axis so the whole sweep is
+        # computed with a single broadcasted call
+        kwargs[parameter] = values.reshape((-1,) + (1,) * sample_concs.ndim)
+        sample_vols = np.broadcast_to(
+            function(sample_concs, **kwargs),
+            values.shape + sample_concs.shape).copy()
+        pool_concs, pool_vols = PoolingProcess.estimate_pool_conc_vol(
+            sample_vols, sample_concs)
+
+        return sample_vols, pool_concs, pool_vols
+
     @staticmethod
     def adjust_blank_vols(pool_vols, comp_blanks, blank_vol):
         """Specifically adjust blanks to a value specified volume
@@ -2183,43 +2933,57 @@ class PoolingProcess(Process):
         Parameters
         ----------
         pool_vols: np.array
-            The per-well pool volumes
+            The per-well pool volumes. Either a single plate (rows x cols) or
+            a stack of plates (plates x rows x cols)
         raw_concs: np.array of float
             The per-well concentrations
         comp_blanks: np.array of bool
             Boolean array indicating which wells are blanks
         blank_num: int
-            The number of blanks N to pool (in order of highest concentration)
+            The number of blanks N to pool per plate (in order of highest
+            concentration)
 
         Returns
         -------
         np.array
             The adjusted per-well pool volumes
         """
+        import numpy as np
 
         if blank_num < 0:
             raise ValueError("blank_num cannot be negative (passed: %s)" %
                              blank_num)
 
-        if comp_blanks.shape != pool_vols.shape != raw_concs.shape:
+        if not (comp_blanks.shape == pool_vols.shape == raw_concs.shape):
             raise ValueError("all input arrays must be same shape")
 
-        blanks = []
-
         adjusted_vols = pool_vols.copy()
-
-        for index, x in np.ndenumerate(comp_blanks):
-            if x:
-                blanks.append((raw_concs[index], index))
-
-        sorted_blanks = sorted(blanks, key=lambda tup: tup[0], reverse=True)
-
-        reject_blanks = sorted_blanks[blank_num:]
-
-        for _, idx in reject_blanks:
-            adjusted_vols[idx] = 0
-
-        return(adjusted_vols)
+        if adjusted_vols.ndim == 0 or not comp_blanks.any():
+            return adjusted_vols
+
+        # Flatten each plate so the blanks can be ranked per plate. A single
+        # plate is treated as a stack of one plate.
+        num_wells = np.prod(
+            [pool_vols.shape[ax]
+             for ax in PoolingProcess._plate_axes(pool_vols)])
+        blanks = comp_blanks.reshape(-1, num_wells)
+        vols = adjusted_vols.reshape(-1, num_wells)
+
+        if blank_num == 0:
+            vols[blanks] = 0
+        elif blank_num < num_wells:
+            # Non-blank wells sort after every blank so they are never picked
+            # over a blank; the N most concentrated blanks end up in the
+            # first N columns. The sort is stable so, among blanks with the
+            # same concentration, the first ones in the plate are kept
+            keys = np.where(blanks, -raw_concs.reshape(-1, num_wells), np.inf)
+            keep_idx = np.argsort(keys, axis=1, kind='mergesort')[
+                :, :blank_num]
+            keep = np.zeros_like(blanks)
+            np.put_along_axis(keep, keep_idx, True, axis=1)
+            vols[blanks & ~keep] = 0
+
+        return adjusted_vols.reshape(pool_vols.shape)
 
     @classmethod
     def create(cls, user, quantification_process, pool_name, volume,
@@ -2372,9 +3136,49 @@ class PoolingProcess(Process):
         return self._get_attr('pooling_function_data')
 
     @staticmethod
-    def _format_picklist(vol_sample, max_vol_per_well=60000,
-                         dest_plate_shape=None):
-        """Format the contents of an echo pooling pick list
+    def _picklist_destinations(vols, max_vol_per_well):
+        """Assigns a destination well index to each transfer volume
+
+        Transfers are added to the current destination well until adding the
+        next one would exceed `max_vol_per_well`, at which point the transfer
+        rolls over to the next destination well.
+
+        Parameters
+        ----------
+        vols : 1d numpy array of floats
+            The transfer volumes, in picking order
+        max_vol_per_well : float
+            Maximum destination well volume
+
+        Returns
+        -------
+        1d numpy array of int
+            The destination well index (starting at 1) of each transfer
+        """
+        import numpy as np
+
+        dests = np.empty(vols.size, dtype=int)
+        start = 0
+        d = 1
+        while start < vols.size:
+            # The cumulative sum tells how many of the remaining transfers fit
+            # in the current destination well, so we only iterate once per
+            # destination well rather than once per transfer
+            fit = start + np.searchsorted(
+                np.cumsum(vols[start:]), max_vol_per_well, side='right')
+            if d > 1:
+                # The transfer that triggered the rollover always goes into
+                # the new destination well, even if it exceeds the maximum
+                fit = max(fit, start + 1)
+            dests[start:fit] = d
+            start = fit
+            d += 1
+        return dests
+
+    @staticmethod
+    def _iter_picklist(vol_sample, max_vol_per_well=60000,
+                       dest_plate_shape=None):
+        """Generates the lines of an echo pooling pick list
 
         Parameters
         ----------
@@ -2384,38 +3188,98 @@ class PoolingProcess(Process):
             Maximum destination well volume, in nL. Default: 60000
         dest_plate_shape: list of 2 elements
             The destination plate shape
+
+        Yields
+        ------
+        str
+            The lines of the pick list, without the line terminator
         """
+        import numpy as np
+
         if dest_plate_shape is None:
             dest_plate_shape = [16, 24]
 
-        contents = ['Source Plate Name,Source Plate Type,Source Well,'
-                    'Concentration,Transfer Volume,Destination Plate Name,'
-                    'Destination Well']
-        # Write the sample transfer volumes
+        yield ('Source Plate Name,Source Plate Type,Source Well,'
+               'Concentration,Transfer Volume,Destination Plate Name,'
+               'Destination Well')
+
         rows, cols = vol_sample.shape
         # replace NaN values with 0s to leave a trail of unpooled wells
-        pool_vols = np.nan_to_num(vol_sample)
-        running_tot = 0
-        d = 1
-        for i in range(rows):
-            for j in range(cols):
-                well_name = "%s%d" % (chr(ord('A') + i), j+1)
-                # Machine will round, so just give it enough info to do the
-                # correct rounding.
-                val = "%.2f" % pool_vols[i][j]
-                # test to see if we will exceed total vol per well
-                if running_tot + pool_vols[i][j] > max_vol_per_well:
-                    d += 1
-                    running_tot = pool_vols[i][j]
-                else:
-                    running_tot += pool_vols[i][j]
-                dest = "%s%d" % (chr(ord('A') +
-                                 int(np.floor(d/dest_plate_shape[0]))),
-                                 (d % dest_plate_shape[1]))
-                contents.append(",".join(['1', '384LDV_AQ_B2_HT', well_name,
-                                          "", val, 'NormalizedDNA', dest]))
+        pool_vols = np.nan_to_num(vol_sample).ravel()
+        well_names = np.char.add(
+            np.repeat(np.array(list(container_module.LETTERS[:rows]),
+                               dtype=str), cols),
+            np.tile(np.arange(1, cols + 1).astype(str), rows))
+        # Machine will round, so just give it enough info to do the
+        # correct rounding.
+        vals = np.char.mod('%.2f', pool_vols)
+        d_idx = PoolingProcess._picklist_destinations(
+            pool_vols, max_vol_per_well)
+        # Only a handful of destination wells are used, so format each of
+        # them once
+        dest_names = {d: "%s%d" % (chr(ord('A') + d // dest_plate_shape[0]),
+                                   d % dest_plate_shape[1])
+                      for d in np.unique(d_idx).tolist()}
+
+        for well_name, val, d in zip(well_names.tolist(), vals.tolist(),
+                                     d_idx.tolist()):
+            yield "1,384LDV_AQ_B2_HT,%s,,%s,NormalizedDNA,%s" % (
+                well_name, val, dest_names[d])
 
-        return "\n".join(contents)
+    @staticmethod
+    def _format_picklist(vol_sample, max_vol_per_well=60000,
+                         dest_plate_shape=None):
+        """Format the contents of an echo pooling pick list
+
+        Parameters
+        ----------
+        vol_sample : 2d numpy array of floats
+            The per well sample volume, in nL
+        max_vol_per_well : floats, optional
+            Maximum destination well volume, in nL. Default: 60000
+        dest_plate_shape: list of 2 elements
+            The destination plate shape
+        """
+        return "\n".join(PoolingProcess._iter_picklist(
+            vol_sample, max_vol_per_well=max_vol_per_well,
+            dest_plate_shape=dest_plate_shape))
+
+    def _component_wells(self):
+        """The well coordinates and pooled volume of the pool components
+
+        Returns
+        -------
+        list of (int, int, float)
+            The row, column and input volume of each component, in the same
+            order as `components`
+        """
+        with sql_connection.TRN as TRN:
+            sql = """SELECT w.row_num, w.col_num, pcc.input_volume
+                     FROM labman.pool_composition_components pcc
+                        JOIN labman.pool_composition pc
+                            ON pcc.output_pool_composition_id =
+                                pc.pool_composition_id
+                        JOIN labman.composition c
+                            ON pc.composition_id = c.composition_id
+                        JOIN labman.composition ic
+                            ON pcc.input_composition_id = ic.composition_id
+                        JOIN labman.well w
+                            ON ic.container_id = w.container_id
+                     WHERE c.upstream_process_id = %s
+                     ORDER BY pcc.pool_composition_components_id"""
+            TRN.add(sql, [self.process_id])
+            return [tuple(r) for r in TRN.execute_fetchindex()]
+
+    def _iter_echo_picklist(self):
+        """Generates the lines of the Echo pick list of the pool"""
+        import numpy as np
+
+        vol_sample = np.zeros((16, 24))
+        wells = self._component_wells()
+        if wells:
+            rows, cols, vols = zip(*wells)
+            vol_sample[np.array(rows) - 1, np.array(cols) - 1] = vols
+        return PoolingProcess._iter_picklist(vol_sample)
 
     def generate_echo_picklist(self, max_vol_per_well=30000):
         """Generates Echo pick list for pooling the shotgun library
@@ -2430,11 +3294,7 @@ class PoolingProcess(Process):
         str
             The echo-formatted pick list
         """
-        vol_sample = np.zeros((16, 24))
-        for comp, vol in self.components:
-            well = comp.container
-            vol_sample[well.row - 1][well.column - 1] = vol
-        return PoolingProcess._format_picklist(vol_sample)
+        return "\n".join(self._iter_echo_picklist())
 
     def generate_epmotion_file(self):
         """Generates an EpMotion file to perform the pooling
@@ -2446,14 +3306,61 @@ class PoolingProcess(Process):
         """
         contents = ['Rack,Source,Rack,Destination,Volume,Tool']
         destination = self.destination
-        for comp, vol in self.components:
-            source = comp.container.well_id
+        for row, col, vol in self._component_wells():
+            source = container_module.Well.format_well_id(row, col)
             val = "%.3f" % vol
             # Hard-coded values - never changes according to the wet lab
             contents.append(
                 ",".join(['1', source, '1', destination, val, '1']))
         return "\n".join(contents)
 
+    @metrics.timed_artifact('pool_file')
+    def iter_pool_file(self):
+        """Generates the lines of the correct pool file based on the pool
+        contents
+
+        Yields
+        ------
+        str
+            The lines of the pool file, without the line terminator
+
+        Raises
+        ------
+        ValueError
+            If the pool contents don't have an associated pool file
+        """
+        with sql_connection.TRN as TRN:
+            # The file depends on the type of the first component of the
+            # pool, which is retrieved without loading all the components
+            sql = """SELECT ct.description
+                     FROM labman.pool_composition_components pcc
+                        JOIN labman.pool_composition pc
+                            ON pcc.output_pool_composition_id =
+                                pc.pool_composition_id
+                        JOIN labman.composition poolc
+                            ON poolc.composition_id = pc.composition_id
+                        JOIN labman.composition c
+                            ON c.composition_id = pcc.input_composition_id
+                        JOIN labman.composition_type ct
+                            ON ct.composition_type_id = c.composition_type_id
+                     WHERE poolc.upstream_process_id = %s
+                     ORDER BY pcc.pool_composition_components_id
+                     LIMIT 1"""
+            TRN.add(sql, [self.process_id])
+            comp_type = TRN.execute_fetchlast()
+
+        amplicon = composition_module.LibraryPrep16SComposition
+        shotgun = composition_module.LibraryPrepShotgunComposition
+        if comp_type == amplicon._composition_type:
+            yield from self.generate_epmotion_file().splitlines()
+        elif comp_type == shotgun._composition_type:
+            yield from self._iter_echo_picklist()
+        else:
+            # This error should only be shown to programmers
+            raise ValueError(
+                "Can't generate a pooling file for a pool containing "
+                "compositions of type: %s" % comp_type)
+
     def generate_pool_file(self):
         """Generates the correct pool file based on the pool contents
 
@@ -2462,18 +3369,7 @@ class PoolingProcess(Process):
         str
             The contents of the pool file
         """
-        component_compositions = [x[0] for x in self.components]
-        comp_class = composition_module.PoolComposition\
-            .get_components_type(component_compositions)
-        if comp_class == composition_module.LibraryPrep16SComposition:
-            return self.generate_epmotion_file()
-        elif comp_class == composition_module.LibraryPrepShotgunComposition:
-            return self.generate_echo_picklist()
-        else:
-            # This error should only be shown to programmers
-            raise ValueError(
-                "Can't generate a pooling file for a pool containing "
-                "compositions of type: %s" % comp_class)
+        return "\n".join(self.iter_pool_file())
 
 
 class SequencingProcess(Process):
@@ -2565,23 +3461,16 @@ class SequencingProcess(Process):
         with sql_connection.TRN as TRN:
             # Add the row to the process table
             process_id = cls._common_creation_steps(user)
-            assay = None
-            pool = pools[0]
-            CM = composition_module
-            while assay is None:
-                comp = pool.components[0]['composition']
-                if isinstance(comp, CM.LibraryPrep16SComposition):
-                    assay = SequencingProcess._amplicon_assay_type
-                elif isinstance(comp, CM.LibraryPrepShotgunComposition):
-                    assay = SequencingProcess._metagenomics_assay_type
-                elif isinstance(comp, CM.PoolComposition):
-                    pool = comp
-                else:
-                    # This should never happen - i.e. there is no way
-                    # of creating a pool like that
-                    raise ValueError(
-                        'Pool with unexpected composition type: %s'
-                        % comp.__class__.__name__)
+            leaf_type = pools[0].leaf_composition_type
+            if leaf_type == '16S library prep':
+                assay = SequencingProcess._amplicon_assay_type
+            elif leaf_type == 'shotgun library prep':
+                assay = SequencingProcess._metagenomics_assay_type
+            else:
+                # This should never happen - i.e. there is no way
+                # of creating a pool like that
+                raise ValueError(
+                    'Pool with unexpected composition type: %s' % leaf_type)
 
             # Add the row to the sequencing table
             sql = """INSERT INTO labman.sequencing_process
@@ -2913,6 +3802,123 @@ class SequencingProcess(Process):
         sample_sheet = template.format(**sample_sheet_dict, **{'sep': sep})
         return sample_sheet
 
+    def _get_shotgun_sample_sheet_rows(self):
+        """Retrieves the per-sample information of the run's shotgun pools
+
+        Returns
+        -------
+        list of (int, list of dict)
+            The lane number and the per-sample information of the pool
+            sequenced in that lane, ordered by lane number. The samples of
+            the pools nested in a lane's pool are included
+
+        Raises
+        ------
+        ValueError
+            If a sample is associated with more than one study
+            If the pool of a lane doesn't contain shotgun libraries
+        """
+        with sql_connection.TRN as TRN:
+            # A single query pulls the whole lineage of every sample in the
+            # run: library prep well and plate, i5/i7 primers and plated
+            # sample. The pool tree of each lane is walked down to its leaves,
+            # the path of component ids keeps the order in which the
+            # components were added to their pools
+            sql = """WITH RECURSIVE tree AS (
+                        SELECT spl.lane_number, pcc.input_composition_id,
+                               ARRAY[pcc.pool_composition_components_id]
+                                AS path
+                        FROM labman.sequencing_process_lanes spl
+                            JOIN labman.pool_composition_components pcc
+                                ON pcc.output_pool_composition_id =
+                                    spl.pool_composition_id
+                        WHERE spl.sequencing_process_id = %s
+                        UNION ALL
+                        SELECT t.lane_number, pcc.input_composition_id,
+                               t.path || pcc.pool_composition_components_id
+                        FROM tree t
+                            JOIN labman.pool_composition pc
+                                ON pc.composition_id = t.input_composition_id
+                            JOIN labman.pool_composition_components pcc
+                                ON pcc.output_pool_composition_id =
+                                    pc.pool_composition_id)
+                     SELECT t.lane_number, w.row_num, w.col_num,
+                            p.external_id AS plate_external_id,
+                            i7.external_id AS i7_name,
+                            i7.barcode_seq AS i7_seq,
+                            i5.external_id AS i5_name,
+                            i5.barcode_seq AS i5_seq,
+                            sc.content, sc.sample_id
+                     FROM tree t
+                        JOIN labman.composition c
+                            ON c.composition_id = t.input_composition_id
+                        JOIN labman.well w ON w.container_id = c.container_id
+                        JOIN labman.plate p ON p.plate_id = w.plate_id
+                        JOIN labman.library_prep_shotgun_composition lpc
+                            ON lpc.composition_id = c.composition_id
+                        JOIN labman.primer_composition i7pc
+                            ON i7pc.primer_composition_id =
+                                lpc.i7_primer_composition_id
+                        JOIN labman.primer_set_composition i7
+                            ON i7.primer_set_composition_id =
+                                i7pc.primer_set_composition_id
+                        JOIN labman.primer_composition i5pc
+                            ON i5pc.primer_composition_id =
+                                lpc.i5_primer_composition_id
+                        JOIN labman.primer_set_composition i5
+                            ON i5.primer_set_composition_id =
+                                i5pc.primer_set_composition_id
+                        JOIN labman.normalized_gdna_composition ngc
+                            ON ngc.normalized_gdna_composition_id =
+                                lpc.normalized_gdna_composition_id
+                        JOIN labman.compressed_gdna_composition cgc
+                            ON cgc.compressed_gdna_composition_id =
+                                ngc.compressed_gdna_composition_id
+                        JOIN labman.gdna_composition gc
+                            ON gc.gdna_composition_id = cgc.gdna_composition_id
+                        JOIN labman.sample_composition sc
+                            ON sc.sample_composition_id =
+                                gc.sample_composition_id
+                     ORDER BY t.lane_number, t.path"""
+            TRN.add(sql, [self.id])
+            res = TRN.execute_fetchindex()
+
+            sql = """SELECT lane_number
+                     FROM labman.sequencing_process_lanes
+                     WHERE sequencing_process_id = %s
+                     ORDER BY lane_number"""
+            TRN.add(sql, [self.id])
+            empty_lanes = sorted(
+                set(TRN.execute_fetchflatten()).difference(
+                    row['lane_number'] for row in res))
+        if empty_lanes:
+            raise ValueError(
+                'No shotgun libraries found in the pool of lane(s) %s'
+                % ', '.join(map(str, empty_lanes)))
+
+        sample_projs = SequencingProcess._generate_sample_proj_values(
+            row['sample_id'] for row in res)
+
+        lanes = []
+        for row in res:
+            if not lanes or lanes[-1][0] != row['lane_number']:
+                lanes.append((row['lane_number'], []))
+
+            lanes[-1][1].append({
+                'well': container_module.Well.format_well_id(
+                    row['row_num'], row['col_num']),
+                'plate': row['plate_external_id'],
+                'i7_name': row['i7_name'], 'i7_seq': row['i7_seq'],
+                'i5_name': row['i5_name'], 'i5_seq': row['i5_seq'],
+                # content is the labman.sample_composition.content value,
+                # which is the "true" sample_id plus a "." plus the plate id
+                # of the plate on which the sample was plated, plus another
+                # "." and the well (e.g., "A1") into which the sample was
+                # plated on that plate.
+                'content': row['content'],
+                'sample_proj': sample_projs[row['sample_id']]})
+        return lanes
+
     def _generate_shotgun_sample_sheet(self):
         """Generates Illumina compatible shotgun sample sheets
 
@@ -2921,74 +3927,38 @@ class SequencingProcess(Process):
         str
             The illumina-formatted sample sheet
         """
-        bcl2fastq_sample_ids = []
-        i7_names = []
-        i7_sequences = []
-        i5_names = []
-        i5_sequences = []
-        wells = []
-        samples_contents = []
-        sample_proj_values = []
-        sample_plates = []
         sequencer_type = self.sequencer.equipment_type
+        include_lane = self.include_lane
 
         data = []
         include_header = True
-        for pool, lane in self.pools:
-            for component in pool.components:
-                lp_composition = component['composition']
-                # Get the well information
-                well = lp_composition.container
-                wells.append(well.well_id)
-                # Get the plate information
-                sample_plates.append(well.plate.external_id)
-                # Get the i7 index information
-                i7_comp = lp_composition.i7_composition.primer_set_composition
-                i7_names.append(i7_comp.external_id)
-                i7_sequences.append(i7_comp.barcode)
-                # Get the i5 index information
-                i5_comp = lp_composition.i5_composition.primer_set_composition
-                i5_names.append(i5_comp.external_id)
-                i5_sequences.append(i5_comp.barcode)
-
-                # Get the sample content (used as description)
-                sample_content = lp_composition.normalized_gdna_composition.\
-                    compressed_gdna_composition.gdna_composition.\
-                    sample_composition.content
-                # sample_content is the labman.sample_composition.content
-                # value, which is the "true" sample_id plus a "." plus the
-                # plate id of the plate on which the sample was plated, plus
-                # another "." and the well (e.g., "A1") into which the sample
-                # was plated on that plate.
-                samples_contents.append(sample_content)
-
-                true_sample_id = lp_composition.normalized_gdna_composition.\
-                    compressed_gdna_composition.gdna_composition.\
-                    sample_composition.sample_id
-                sample_proj_values.append(self._generate_sample_proj_value(
-                    true_sample_id))
+        for lane, samples in self._get_shotgun_sample_sheet_rows():
+            samples_contents = [s['content'] for s in samples]
             # Transform the sample ids to be bcl2fastq-compatible
             bcl2fastq_sample_ids = [
                 SequencingProcess._bcl_scrub_name(sid) for sid in
                 samples_contents]
             # Reverse the i5 sequences if needed based on the sequencer
             i5_sequences = SequencingProcess._sequencer_i5_index(
-                sequencer_type, i5_sequences)
+                sequencer_type, [s['i5_seq'] for s in samples])
             # add the data of the current pool
             data.append(SequencingProcess._format_sample_sheet_data(
-                bcl2fastq_sample_ids, i7_names, i7_sequences, i5_names,
-                i5_sequences, sample_proj_values, wells=wells,
-                sample_plates=sample_plates, description=samples_contents,
-                lanes=[lane], sep=',', include_header=include_header,
-                include_lane=self.include_lane))
+                bcl2fastq_sample_ids, [s['i7_name'] for s in samples],
+                [s['i7_seq'] for s in samples],
+                [s['i5_name'] for s in samples], i5_sequences,
+                [s['sample_proj'] for s in samples],
+                wells=[s['well'] for s in samples],
+                sample_plates=[s['plate'] for s in samples],
+                description=samples_contents, lanes=[lane], sep=',',
+                include_header=include_header, include_lane=include_lane))
             include_header = False
 
         data = '\n'.join(data)
         return self._format_sample_sheet(data)
 
     @staticmethod
-    def _generate_sample_proj_value(sample_id):
-        """Generate a short name for the project from which the sample came.
+    def _generate_sample_proj_values(sample_ids):
+        """Generate the short names for the projects the samples came from.
 
         This value is intended to be placed in the sample sheet in the
         sample_proj field as a unique reference allowing demultiplexing to
@@ -2999,65 +3969,73 @@ class SequencingProcess(Process):
 
         Parameters
         ----------
-        sample_id : str
-            The value of the sample_id column from qiita.study_sample for the
-            sample of interest. For samples with no sample_id (e.g., controls,
-            blanks, empties), the value is "Controls".
+        sample_ids : iterable of str
+            The values of the sample_id column from qiita.study_sample for the
+            samples of interest. For samples with no sample_id (e.g.,
+            controls, blanks, empties), the value is "Controls".
 
         Raises
         ------
         ValueError
-            If the sample_id is associated with more than one study--
+            If a sample_id is associated with more than one study--
             this should never happen.
 
-
         Returns
         -------
-        str
-            A short name for the project from which the sample comes.
+        dict of {str: str}
+            A short name for the project from which each sample comes.
         """
+        sample_ids = set(sample_ids)
+        sample_studies = {}
+        qiita_ids = tuple(sid for sid in sample_ids if sid is not None)
+        if qiita_ids:
+            with sql_connection.TRN as TRN:
+                sql = """SELECT sample_id, study_id
+                         FROM qiita.study_sample
+                         WHERE sample_id IN %s"""
+                TRN.add(sql, [qiita_ids])
+                for sample_id, study_id in TRN.execute_fetchindex():
+                    # If we already found a study for the sample, this means
+                    # we have a data integrity problem!
+                    if sample_id in sample_studies:
+                        raise ValueError(
+                            "Sample id {0} is associated with multiple"
+                            "combinations of study id, lab person id, and "
+                            "principal investigator id.".format(sample_id))
+                    sample_studies[sample_id] = study_id
+
+        project_names = Study.get_project_names(
+            set(sample_studies.values()))
+
+        # Samples not found in study_sample are usually not experimental
+        # samples but rather blanks, empties or controls.
+        # TODO: Probably worth checking if the sample IS experimental
+        # because if it IS and we got "Controls", something is profoundly
+        # wrong.
+        return {sid: project_names.get(sample_studies.get(sid), "Controls")
+                for sid in sample_ids}
 
-        result = None
+    @staticmethod
+    def _generate_sample_proj_value(sample_id):
+        """Generate a short name for the project from which the sample came.
 
-        with sql_connection.TRN as TRN:
-            sql = """
-                SELECT study_id, sp1.name as lab_person_name,
-                        sp2.name as principal_investigator_name
-                FROM qiita.study_sample
-                INNER JOIN qiita.study st USING (study_id)
-                -- Self-join qiita.study_person to get both
-                -- lab person id and study person id in one record
-                INNER JOIN qiita.study_person sp1 ON (
-                    st.lab_person_id = sp1.study_person_id)
-                INNER JOIN qiita.study_person sp2 ON (
-                    st.principal_investigator_id = sp2.study_person_id)
-                WHERE sample_id = %s
-                """
-            TRN.add(sql, [sample_id])
-
-            for study_id, lab_person_name, principal_investigator_name in \
-                    TRN.execute_fetchindex():
-                # If we already set the result, then there is more than one
-                # record pulled back by the query, and this means we have a
-                # data integrity problem!
-                if result is not None:
-                    raise ValueError(
-                        "Sample id {0} is associated with multiple"
-                        "combinations of study id, lab person id, and "
-                        "principal investigator id.".format(sample_id))
-
-                result = "{0}_{1}_{2}".format(
-                    lab_person_name, principal_investigator_name, study_id)
-
-        if result is None:
-            # usually this is because the sample_id was not found in
-            # study_sample because it is not an experimental sample but rather
-            # a blank or an empty or a control.
-            # TODO: Probably worth checking if the sample IS experimental
-            # because if it IS and we got None, something is profoundly wrong.
-            result = "Controls"
+        Parameters
+        ----------
+        sample_id : str
+            The value of the sample_id column from qiita.study_sample for the
+            sample of interest.
 
-        return result
+        Returns
+        -------
+        str
+            A short name for the project from which the sample comes.
+
+        See Also
+        --------
+        _generate_sample_proj_values
+        """
+        return SequencingProcess._generate_sample_proj_values(
+            [sample_id])[sample_id]
 
     def _generate_amplicon_sample_sheet(self):
         """Generates Illumina compatible sample sheets
@@ -3080,6 +4058,7 @@ class SequencingProcess(Process):
                            pool.composition_id))
         return self._format_sample_sheet('\n'.join(data))
 
+    @metrics.timed_artifact('sample_sheet')
     def generate_sample_sheet(self):
         """Generates Illumina compatible sample sheets
 
@@ -3096,17 +4075,76 @@ class SequencingProcess(Process):
         else:
             raise ValueError("Unrecognized assay type: {0}".format(assay))
 
-    def generate_prep_information(self):
-        """Generates prep information
+    @staticmethod
+    def _format_prep_information(samples, blanks):
+        """Formats the prep information file of a study
 
-        Returns
-        -------
-        dict labman.db.study.Study: str
-            a dict of the Study and the prep
+        Parameters
+        ----------
+        samples : iterable of (str, dict)
+            The content and prep information of the study samples, sorted by
+            content
+        blanks : list of (str, dict)
+            The content and prep information of the blanks and controls,
+            sorted by content
+
+        Yields
+        ------
+        str
+            The lines of the prep information file, in tab-separated format
+        """
+        # The blanks are included in the prep information of every study.
+        # If a content is repeated, only its last entry is kept, with blanks
+        # taking precedence over samples
+        merged = heapq.merge(
+            ((content, 0, info) for content, info in samples),
+            ((content, 1, info) for content, info in blanks),
+            key=itemgetter(0, 1))
+
+        out = StringIO()
+        writer = csv.writer(out, delimiter='\t', lineterminator='\n')
+
+        def _format_line(values):
+            writer.writerow(values)
+            line = out.getvalue()
+            out.seek(0)
+            out.truncate()
+            return line
+
+        columns = None
+        previous = None
+        for content, _, info in merged:
+            if previous is not None and previous[0] != content:
+                yield _format_line(
+                    [previous[0]] + [previous[1][c] for c in columns])
+            if columns is None:
+                columns = sorted(info)
+                yield _format_line(['sample_name'] + columns)
+            previous = (content, info)
+
+        if previous is not None:
+            yield _format_line(
+                [previous[0]] + [previous[1][c] for c in columns])
+
+    @metrics.timed_artifact('prep_information')
+    def iter_prep_information(self):
+        """Generates the prep information of each study in the run
+
+        The samples are streamed from the database, so the prep information
+        of runs with many samples is never fully loaded in memory.
+
+        Yields
+        ------
+        (labman.db.study.Study, generator of str)
+            The study and the lines of its prep information file. The lines
+            of a study should be consumed before moving to the next study
+
+        Raises
+        ------
+        ValueError
+            If the assay of the run is not recognized
         """
         assay = self.assay
-        data = {}
-        blanks = {}
         if assay == self._amplicon_assay_type:
             extra_fields = [
                 # 'e'/'r': equipment/reagent
@@ -3188,8 +4226,8 @@ class SequencingProcess(Process):
                     pc.primer_set_composition_id =
                     psc.primer_set_composition_id)
                 FULL JOIN qiita.study_sample USING (sample_id)
-                WHERE sequencing_process_id = %s
-                ORDER BY study_id, sample_id, row_num, col_num"""
+                WHERE sequencing_process_id = %s"""
+            order_by = "row_num, col_num"
         elif assay == self._metagenomics_assay_type:
             extra_fields = [
                 ('e', 'gepmotion_robot_id', 'gdata_robot'),
@@ -3267,89 +4305,112 @@ class SequencingProcess(Process):
                 LEFT JOIN labman.plate p1 ON (
                     w1.plate_id = p1.plate_id)
                 FULL JOIN qiita.study_sample USING (sample_id)
-                WHERE sequencing_process_id = %s
-                ORDER BY study_id, sample_id, row_num, col_num, i5.barcode_seq
-                """
-
-        with sql_connection.TRN as TRN:
-            # to simplify the main queries, let's get all the equipment info
-            TRN.add("""SELECT equipment_id, external_id, notes, description
-                       FROM labman.equipment
-                       LEFT JOIN labman.equipment_type
-                       USING (equipment_type_id)""")
-            equipment = {}
-            for row in TRN.execute_fetchindex():
-                row = dict(row)
-                eid = row.pop('equipment_id')
-                equipment[eid] = row
-
-            # and the reagents
-            TRN.add("""SELECT reagent_composition_id, composition_id,
-                           external_lot_id, description
-                       FROM labman.reagent_composition
-                       LEFT JOIN labman.reagent_composition_type
-                       USING (reagent_composition_type_id)""")
-            reagent = {}
-            for row in TRN.execute_fetchindex():
-                row = dict(row)
-                rid = row.pop('reagent_composition_id')
-                reagent[rid] = row
+                WHERE sequencing_process_id = %s"""
+            order_by = "row_num, col_num, i5.barcode_seq"
+        else:
+            raise ValueError("Unrecognized assay type: {0}".format(assay))
 
-            TRN.add(sql, [self.id])
-            for result in TRN.execute_fetchindex():
-                result = dict(result)
-                study_id = result.pop('study_id')
-                sid = result.pop('sample_id')
-                content = result.pop('content')
-
-                # format well
-                col = result.pop('col_num')
-                row = result.pop('row_num')
-                well = []
-                while row:
-                    row, rem = divmod(row-1, 26)
-                    well[:0] = container_module.LETTERS[rem]
-                result['well'] = ''.join(well) + str(col)
-
-                # format extra fields list
-                for t, k, nk in extra_fields:
-                    _id = result.pop(k)
-                    if _id is not None:
-                        if t == 'e':
-                            val = equipment[_id]['external_id']
+        # The content is the sample name in the prep information, which is
+        # sorted by code point
+        order_by = 'content COLLATE "C", %s' % order_by
+
+        # Use a dedicated transaction instead of TRN: the samples are
+        # streamed through a server-side cursor that stays open while the
+        # caller consumes them, and the webserver writes them to the client
+        # in several IOLoop iterations. The requests served in between use
+        # TRN and commit or roll it back, which would close the cursor of a
+        # TRN-based stream. The statements of this transaction are still
+        # counted in the statement accounting of Transaction
+        trn = sql_connection.Transaction()
+        try:
+            with trn:
+                # to simplify the main queries, let's get all the equipment
+                # info
+                trn.add("""SELECT equipment_id, external_id, notes,
+                                  description
+                           FROM labman.equipment
+                           LEFT JOIN labman.equipment_type
+                           USING (equipment_type_id)""")
+                equipment = {}
+                for row in trn.execute_fetchindex():
+                    row = dict(row)
+                    eid = row.pop('equipment_id')
+                    equipment[eid] = row
+
+                # and the reagents
+                trn.add("""SELECT reagent_composition_id, composition_id,
+                               external_lot_id, description
+                           FROM labman.reagent_composition
+                           LEFT JOIN labman.reagent_composition_type
+                           USING (reagent_composition_type_id)""")
+                reagent = {}
+                for row in trn.execute_fetchindex():
+                    row = dict(row)
+                    rid = row.pop('reagent_composition_id')
+                    reagent[rid] = row
+
+                def _format_result(result):
+                    result = dict(result)
+                    study_id = result.pop('study_id')
+                    result.pop('sample_id')
+                    content = result.pop('content')
+
+                    # format well
+                    result['well'] = container_module.Well.format_well_id(
+                        result.pop('row_num'), result.pop('col_num'))
+
+                    # format extra fields list
+                    for t, k, nk in extra_fields:
+                        _id = result.pop(k)
+                        if _id is not None:
+                            if t == 'e':
+                                val = equipment[_id]['external_id']
+                            else:
+                                val = reagent[_id]['external_lot_id']
                         else:
-                            val = reagent[_id]['external_lot_id']
-                    else:
-                        val = ''
-                    result[nk] = val
-
-                # format some final fields
-                result['platform'] = equipment[
-                    result.pop('platform_id')]['description']
+                            val = ''
+                        result[nk] = val
 
-                if sid is not None and study_id is not None:
-                    study = Study(study_id)
-                    if study not in data:
-                        data[study] = {}
-                    data[study][content] = result
+                    # format some final fields
+                    result['platform'] = equipment[
+                        result.pop('platform_id')]['description']
 
                     if assay == self._metagenomics_assay_type:
                         result['run_prefix'] = \
                             SequencingProcess._bcl_scrub_name(content)
-                else:
-                    if assay == self._metagenomics_assay_type:
-                        result['run_prefix'] = \
-                            SequencingProcess._bcl_scrub_name(content)
+
+                    return study_id, content, result
+
+                # The blanks and controls are included in every study, so
+                # retrieve them first. There is a bounded number of them per
+                # plate.
+                trn.add(sql + """ AND (study_id IS NULL OR sample_id IS NULL)
+                                 ORDER BY """ + order_by, [self.id])
+                blanks = {}
+                for row in trn.execute_fetchindex():
+                    _, content, result = _format_result(row)
                     blanks[content] = result
+                blanks = sorted(blanks.items(), key=itemgetter(0))
+
+                samples = map(_format_result, trn.execute_fetchstream(
+                    sql + """ AND study_id IS NOT NULL
+                              AND sample_id IS NOT NULL
+                              ORDER BY study_id, """ + order_by, [self.id]))
+                for study_id, rows in groupby(samples, key=itemgetter(0)):
+                    yield (Study(study_id),
+                           SequencingProcess._format_prep_information(
+                               ((content, result)
+                                for _, content, result in rows), blanks))
+        finally:
+            trn.close()
+
+    def generate_prep_information(self):
+        """Generates prep information
 
-        # converting from dict to pandas and then to tsv
-        for study, vals in data.items():
-            merged = {**vals, **blanks}
-            df = pd.DataFrame.from_dict(merged, orient='index')
-            df.sort_index(inplace=True)
-            cols = sorted(list(df.columns))
-            sio = StringIO()
-            df[cols].to_csv(sio, sep='\t', index_label='sample_name')
-            data[study] = sio.getvalue()
-
-        return data
+        Returns
+        -------
+        dict labman.db.study.Study: str
+            a dict of the Study and the prep
+        """
+        return {study: ''.join(lines)
+                for study, lines in self.iter_prep_information()}
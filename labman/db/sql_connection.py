@@ -14,6 +14,8 @@ from contextlib import contextmanager
 from itertools import chain
 from functools import partial, wraps
 from datetime import date, time, datetime
+from time import monotonic
+from uuid import uuid4
 
 from psycopg2 import (connect, ProgrammingError, Error as PostgresError,
                       OperationalError)
@@ -21,6 +23,7 @@ from psycopg2.extras import DictCursor
 from psycopg2.extensions import TRANSACTION_STATUS_IDLE
 
 from . import settings
+from . import metrics
 
 
 class SQLConnectionHandler(object):
@@ -392,6 +395,25 @@ def _checker(func):
     return wrapper
 
 
+class StatementRecorder(object):
+    """Accumulates the SQL statements executed while it is active
+
+    A recorder is made active by assigning it to `Transaction.recorder`. The
+    webserver activates the recorder of a request while running its code, so
+    the statements of the requests served concurrently are not mixed
+
+    Attributes
+    ----------
+    count : int
+        The number of statements executed
+    seconds : float
+        The time spent executing them
+    """
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
 class Transaction(object):
     """A context manager that encapsulates a DB transaction
 
@@ -408,6 +430,18 @@ class Transaction(object):
     When the execution leaves the context manager, any remaining queries in
     the transaction will be executed and committed.
     """
+    # The statement accounting is shared by all the transactions of the
+    # process, including the dedicated ones used to stream query results.
+    # Number of statements executed and time spent executing them since the
+    # process started
+    statement_count = 0
+    statement_seconds = 0.0
+    # If a list, the (sql, sql_args, seconds) of the statements executed are
+    # appended to it. Used to profile requests
+    captured_statements = None
+    # The active StatementRecorder, if any
+    recorder = None
+
     def __init__(self):
         self._queries = []
         self._results = []
@@ -462,6 +496,37 @@ class Transaction(object):
         if self._connection is not None:
             self._connection.close()
 
+    @property
+    def connection_open(self):
+        """Whether the transaction holds an open connection to the database"""
+        return self._connection is not None and self._connection.closed == 0
+
+    def _execute_statement(self, func, sql, sql_args=None):
+        """Executes a statement through `func`, recording its duration
+
+        Parameters
+        ----------
+        func : callable
+            The cursor method executing the statement, e.g. cursor.execute
+        sql : str
+            The statement
+        sql_args : list, tuple or dict of objects, optional
+            The arguments of the statement
+        """
+        start = monotonic()
+        try:
+            func(sql, sql_args)
+        finally:
+            elapsed = monotonic() - start
+            Transaction.statement_count += 1
+            Transaction.statement_seconds += elapsed
+            if Transaction.recorder is not None:
+                Transaction.recorder.count += 1
+                Transaction.recorder.seconds += elapsed
+            if Transaction.captured_statements is not None:
+                Transaction.captured_statements.append(
+                    (sql, sql_args, elapsed))
+
     @contextmanager
     def _get_cursor(self):
         """Returns a postgres cursor
@@ -583,7 +648,7 @@ class Transaction(object):
             for sql, sql_args in self._queries:
                 # Execute the current SQL command
                 try:
-                    cur.execute(sql, sql_args)
+                    self._execute_statement(cur.execute, sql, sql_args)
                 except Exception as e:
                     # We catch any exception as we want to make sure that we
                     # rollback every time that something went wrong
@@ -734,6 +799,85 @@ class Transaction(object):
         """
         return list(chain.from_iterable(self.execute()[idx]))
 
+    @_checker
+    def execute_fetchstream(self, sql, sql_args=None, itersize=2000):
+        """Executes the given query and lazily yields its results
+
+        Parameters
+        ----------
+        sql : str
+            The sql query
+        sql_args : list, tuple or dict of objects, optional
+            The arguments to the sql query
+        itersize : int, optional
+            The number of rows to fetch from the server at a time.
+            Default: 2000
+
+        Yields
+        ------
+        DictRow
+            The rows returned by the query
+
+        Raises
+        ------
+        RuntimeError
+            If invoked outside a context
+
+        Notes
+        -----
+        The rows are fetched through a server-side cursor, so the results are
+        never fully loaded in memory. Any query already added to the
+        transaction is executed before `sql`. The generator should be fully
+        consumed before leaving the transaction context.
+
+        See Also
+        --------
+        execute_fetchindex
+        """
+        if self._queries:
+            self.execute()
+
+        cursor_name = 'labman_stream_%s' % uuid4().hex
+        with self._connection.cursor(
+                name=cursor_name, cursor_factory=DictCursor) as cur:
+            cur.itersize = itersize
+            try:
+                self._execute_statement(cur.execute, sql, sql_args)
+            except Exception as e:
+                self._raise_execution_error(sql, sql_args, e)
+            for row in cur:
+                yield row
+
+    @_checker
+    def copy_expert(self, sql, file):
+        """Executes the given COPY statement within the transaction
+
+        Parameters
+        ----------
+        sql : str
+            The COPY statement, e.g. "COPY table (columns) FROM STDIN"
+        file : file-like object
+            The file to read the data from (COPY ... FROM STDIN) or to write
+            the data to (COPY ... TO STDOUT)
+
+        Raises
+        ------
+        RuntimeError
+            If invoked outside a context
+
+        Notes
+        -----
+        Any query already added to the transaction is executed before `sql`.
+        """
+        if self._queries:
+            self.execute()
+
+        with self._get_cursor() as cur:
+            try:
+                self._execute_statement(cur.copy_expert, sql, file)
+            except Exception as e:
+                self._raise_execution_error(sql, None, e)
+
     def _funcs_executor(self, funcs, func_str):
         error_msg = []
         for f, args, kwargs in funcs:
@@ -837,3 +981,25 @@ class Transaction(object):
 
 # Singleton pattern, create the transaction for the entire system
 TRN = Transaction()
+
+metrics.CallbackCounter(
+    'labman_db_statements_total', 'Number of SQL statements executed',
+    lambda: Transaction.statement_count)
+metrics.CallbackCounter(
+    'labman_db_statements_seconds_total',
+    'Time spent executing SQL statements',
+    lambda: Transaction.statement_seconds)
+# labman doesn't use a connection pool, each process holds one connection in
+# its transaction. These report its usage and the queries waiting in it
+metrics.CallbackGauge(
+    'labman_db_connection_open',
+    'Whether the process holds an open database connection',
+    lambda: int(TRN.connection_open))
+metrics.CallbackGauge(
+    'labman_db_transaction_depth',
+    'Number of nested transaction contexts in use, 0 if idle',
+    lambda: TRN._contexts_entered)
+metrics.CallbackGauge(
+    'labman_db_queued_queries',
+    'Number of queries added to the transaction and not executed yet',
+    lambda: len(TRN._queries))
@@ -6,11 +6,26 @@
 # The full license is in the file LICENSE, distributed with this software.
 # ----------------------------------------------------------------------------
 
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+
 from . import base
 from . import sql_connection
 from . import user
 
 
+# The project names only depend on the lab person and principal investigator
+# of the study, which rarely change, so they are kept in a small LRU cache
+# keyed by study id. These are edited in Qiita, so labman can't tell when a
+# name changes: the entries expire after _PROJECT_NAMES_CACHE_TTL seconds, and
+# Study.invalidate_project_names drops them right away.
+_PROJECT_NAMES_CACHE = OrderedDict()
+_PROJECT_NAMES_CACHE_SIZE = 256
+_PROJECT_NAMES_CACHE_TTL = 300
+_PROJECT_NAMES_LOCK = Lock()
+
+
 class Study(base.LabmanObject):
     """Study object
 
@@ -20,10 +35,13 @@ class Study(base.LabmanObject):
     title
     creator
     num_samples
+    project_name
 
     Methods
     -------
     list_studies
+    get_project_names
+    invalidate_project_names
     samples
 
     See Also
@@ -54,6 +72,87 @@ class Study(base.LabmanObject):
             TRN.add(sql)
             return [dict(r) for r in TRN.execute_fetchindex()]
 
+    @staticmethod
+    def get_project_names(study_ids):
+        """Returns the short project names of the given studies
+
+        The project name has the form "{lab person}_{PI}_{study id}" and is
+        used to group the demultiplexed samples of a study.
+
+        Parameters
+        ----------
+        study_ids : iterable of int
+            The study ids
+
+        Returns
+        -------
+        dict of {int: str}
+            The project name of each study. Studies that don't exist are not
+            included
+        """
+        study_ids = set(study_ids)
+        result = {}
+        now = monotonic()
+        with _PROJECT_NAMES_LOCK:
+            for study_id in study_ids:
+                if study_id not in _PROJECT_NAMES_CACHE:
+                    continue
+                name, expires = _PROJECT_NAMES_CACHE[study_id]
+                if expires <= now:
+                    del _PROJECT_NAMES_CACHE[study_id]
+                else:
+                    _PROJECT_NAMES_CACHE.move_to_end(study_id)
+                    result[study_id] = name
+        missing = study_ids.difference(result)
+
+        if missing:
+            with sql_connection.TRN as TRN:
+                sql = """SELECT study_id, sp1.name AS lab_person_name,
+                                sp2.name AS principal_investigator_name
+                         FROM qiita.study st
+                            -- Self-join qiita.study_person to get both
+                            -- lab person and principal investigator names
+                            JOIN qiita.study_person sp1
+                                ON st.lab_person_id = sp1.study_person_id
+                            JOIN qiita.study_person sp2
+                                ON st.principal_investigator_id =
+                                    sp2.study_person_id
+                         WHERE study_id IN %s"""
+                TRN.add(sql, [tuple(missing)])
+                fetched = {
+                    sid: "{0}_{1}_{2}".format(lab_person, pi, sid)
+                    for sid, lab_person, pi in TRN.execute_fetchindex()}
+
+            expires = monotonic() + _PROJECT_NAMES_CACHE_TTL
+            with _PROJECT_NAMES_LOCK:
+                for study_id, name in fetched.items():
+                    _PROJECT_NAMES_CACHE[study_id] = (name, expires)
+                    _PROJECT_NAMES_CACHE.move_to_end(study_id)
+                while len(_PROJECT_NAMES_CACHE) > _PROJECT_NAMES_CACHE_SIZE:
+                    _PROJECT_NAMES_CACHE.popitem(last=False)
+            result.update(fetched)
+
+        return result
+
+    @staticmethod
+    def invalidate_project_names(study_ids=None):
+        """Drops cached project names
+
+        The cached names expire on their own, this makes a change of the lab
+        person or principal investigator of a study visible right away.
+
+        Parameters
+        ----------
+        study_ids : iterable of int, optional
+            The studies whose project names should be dropped. Default: all
+        """
+        with _PROJECT_NAMES_LOCK:
+            if study_ids is None:
+                _PROJECT_NAMES_CACHE.clear()
+            else:
+                for study_id in study_ids:
+                    _PROJECT_NAMES_CACHE.pop(study_id, None)
+
     @property
     def title(self):
         """The study title"""
@@ -64,6 +163,11 @@ class Study(base.LabmanObject):
         """The user that created the study"""
         return user.User(self._get_attr('email'))
 
+    @property
+    def project_name(self):
+        """The short project name used in the sample sheets"""
+        return self.get_project_names([self.id]).get(self.id)
+
     def samples(self, term=None, limit=None):
         """The study samples
 
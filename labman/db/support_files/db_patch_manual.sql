@@ -1,6 +1,29 @@
--- Create indexes for fast free text searches
-CREATE INDEX composition_notes_idx ON labman.composition USING gin(to_tsvector('english', notes));
-CREATE INDEX plate_notes_idx ON labman.composition USING gin(to_tsvector('english', notes));
+-- Create indexes for fast free text searches. Plate.search matches on
+-- to_tsvector('english', notes) so these expression indexes are used.
+-- The statements can be re-run to update existing installations, which had
+-- plate_notes_idx on the wrong table. CREATE INDEX IF NOT EXISTS needs
+-- PostgreSQL 9.5, so the existing indexes are looked up in pg_indexes
+DROP INDEX IF EXISTS labman.plate_notes_idx;
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_indexes
+                   WHERE schemaname = 'labman'
+                       AND indexname = 'composition_notes_idx') THEN
+        CREATE INDEX composition_notes_idx ON labman.composition USING gin(to_tsvector('english', notes));
+    END IF;
+    CREATE INDEX plate_notes_idx ON labman.plate USING gin(to_tsvector('english', notes));
+    -- Plates are searched by the samples they hold
+    IF NOT EXISTS (SELECT 1 FROM pg_indexes
+                   WHERE schemaname = 'labman'
+                       AND indexname = 'idx_sample_composition_sample_id') THEN
+        CREATE INDEX idx_sample_composition_sample_id ON labman.sample_composition ( sample_id );
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_indexes
+                   WHERE schemaname = 'labman'
+                       AND indexname = 'idx_well_plate_id') THEN
+        CREATE INDEX idx_well_plate_id ON labman.well ( plate_id );
+    END IF;
+END $$;
 
 -- Add the FK to the qiita_user table
 ALTER TABLE labman.labmanager_access ADD CONSTRAINT fk_email FOREIGN KEY ( email ) REFERENCES qiita.qiita_user( email );
@@ -3614,3 +3637,299 @@ BEGIN
     END IF;
 END
 $$ LANGUAGE plpgsql;
+
+-- Maps the composition id of any composition derived from a sample (gDNA,
+-- compressed/normalized gDNA and library preps) to the sample composition it
+-- comes from
+CREATE OR REPLACE VIEW labman.composition_sample_lineage AS
+    SELECT composition_id, sample_composition_id
+    FROM labman.sample_composition
+    UNION ALL
+    SELECT composition_id, sample_composition_id
+    FROM labman.gdna_composition
+    UNION ALL
+    SELECT lp.composition_id, g.sample_composition_id
+    FROM labman.library_prep_16s_composition lp
+        JOIN labman.gdna_composition g USING (gdna_composition_id)
+    UNION ALL
+    SELECT cg.composition_id, g.sample_composition_id
+    FROM labman.compressed_gdna_composition cg
+        JOIN labman.gdna_composition g USING (gdna_composition_id)
+    UNION ALL
+    SELECT ng.composition_id, g.sample_composition_id
+    FROM labman.normalized_gdna_composition ng
+        JOIN labman.compressed_gdna_composition cg
+            USING (compressed_gdna_composition_id)
+        JOIN labman.gdna_composition g USING (gdna_composition_id)
+    UNION ALL
+    SELECT lp.composition_id, g.sample_composition_id
+    FROM labman.library_prep_shotgun_composition lp
+        JOIN labman.normalized_gdna_composition ng
+            USING (normalized_gdna_composition_id)
+        JOIN labman.compressed_gdna_composition cg
+            USING (compressed_gdna_composition_id)
+        JOIN labman.gdna_composition g USING (gdna_composition_id);
+
+-- Summary of each plate used to list plates. The discarded and quantified
+-- flags are kept up to date by the triggers below. Writing wells or changing
+-- the samples they hold flags the affected plates as stale, and the stale
+-- plates are recomputed once when the transaction that flagged them commits,
+-- so listing the plates never writes. A plate holding compositions of
+-- several types is listed under each of them. The study ids are stored
+-- instead of the study titles, which are looked up when listing the plates
+-- so the titles changed in Qiita are always current
+CREATE TABLE labman.plate_summary (
+    plate_id             bigint  NOT NULL,
+    plate_types          varchar[] DEFAULT '{}' NOT NULL,
+    discarded            bool DEFAULT 'False' NOT NULL,
+    quantified           bool DEFAULT 'False' NOT NULL,
+    study_ids            bigint[] DEFAULT '{}' NOT NULL,
+    stale                bool DEFAULT 'True' NOT NULL,
+    CONSTRAINT pk_plate_summary PRIMARY KEY ( plate_id ),
+    CONSTRAINT fk_plate_summary_plate FOREIGN KEY ( plate_id ) REFERENCES labman.plate( plate_id ) ON DELETE CASCADE
+ );
+CREATE INDEX idx_plate_summary_types ON labman.plate_summary USING gin ( plate_types );
+
+CREATE OR REPLACE FUNCTION labman.plate_summary_plate_inserted() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO labman.plate_summary (plate_id, discarded)
+        VALUES (NEW.plate_id, NEW.discarded);
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION labman.plate_summary_plate_discarded() RETURNS trigger AS $$
+BEGIN
+    UPDATE labman.plate_summary
+        SET discarded = NEW.discarded
+        WHERE plate_id = NEW.plate_id;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION labman.plate_summary_composition_inserted() RETURNS trigger AS $$
+BEGIN
+    UPDATE labman.plate_summary
+        SET stale = TRUE
+        WHERE NOT stale AND plate_id = (SELECT plate_id
+                                        FROM labman.well
+                                        WHERE container_id = NEW.container_id);
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION labman.plate_summary_sample_changed() RETURNS trigger AS $$
+BEGIN
+    -- The sample is also present in the plates derived from this one
+    UPDATE labman.plate_summary
+        SET stale = TRUE
+        WHERE NOT stale AND plate_id IN (
+            SELECT plate_id
+            FROM labman.well
+                JOIN labman.composition USING (container_id)
+                JOIN labman.composition_sample_lineage USING (composition_id)
+            WHERE sample_composition_id = NEW.sample_composition_id);
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION labman.plate_summary_quantified() RETURNS trigger AS $$
+BEGIN
+    UPDATE labman.plate_summary
+        SET quantified = TRUE
+        WHERE NOT quantified AND plate_id = (
+            SELECT plate_id
+            FROM labman.well
+                JOIN labman.composition USING (container_id)
+            WHERE composition_id = NEW.quantitated_composition_id);
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+-- Recomputes a stale plate. It runs when the transaction commits, once all
+-- the wells of the transaction and their composition subtype rows exist
+CREATE OR REPLACE FUNCTION labman.plate_summary_refresh() RETURNS trigger AS $$
+BEGIN
+    UPDATE labman.plate_summary
+        SET plate_types = ARRAY(
+                SELECT DISTINCT description
+                FROM labman.well
+                    JOIN labman.composition USING (container_id)
+                    JOIN labman.composition_type USING (composition_type_id)
+                WHERE plate_id = NEW.plate_id
+                ORDER BY description),
+            quantified = EXISTS (
+                SELECT 1
+                FROM labman.well
+                    JOIN labman.composition USING (container_id)
+                    JOIN labman.concentration_calculation
+                        ON quantitated_composition_id = composition_id
+                WHERE plate_id = NEW.plate_id),
+            study_ids = ARRAY(
+                SELECT DISTINCT study_id
+                FROM labman.well
+                    JOIN labman.composition USING (container_id)
+                    JOIN labman.composition_sample_lineage lineage
+                        USING (composition_id)
+                    JOIN labman.sample_composition sc
+                        ON sc.sample_composition_id =
+                            lineage.sample_composition_id
+                    JOIN qiita.study_sample ss ON ss.sample_id = sc.sample_id
+                WHERE plate_id = NEW.plate_id
+                ORDER BY study_id),
+            stale = FALSE
+        WHERE plate_id = NEW.plate_id AND stale;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS plate_summary_plate_inserted ON labman.plate;
+CREATE TRIGGER plate_summary_plate_inserted AFTER INSERT ON labman.plate
+    FOR EACH ROW EXECUTE PROCEDURE labman.plate_summary_plate_inserted();
+DROP TRIGGER IF EXISTS plate_summary_plate_discarded ON labman.plate;
+CREATE TRIGGER plate_summary_plate_discarded AFTER UPDATE OF discarded ON labman.plate
+    FOR EACH ROW WHEN ( OLD.discarded IS DISTINCT FROM NEW.discarded )
+    EXECUTE PROCEDURE labman.plate_summary_plate_discarded();
+DROP TRIGGER IF EXISTS plate_summary_composition_inserted ON labman.composition;
+CREATE TRIGGER plate_summary_composition_inserted AFTER INSERT ON labman.composition
+    FOR EACH ROW EXECUTE PROCEDURE labman.plate_summary_composition_inserted();
+DROP TRIGGER IF EXISTS plate_summary_sample_changed ON labman.sample_composition;
+CREATE TRIGGER plate_summary_sample_changed AFTER UPDATE OF sample_id ON labman.sample_composition
+    FOR EACH ROW WHEN ( OLD.sample_id IS DISTINCT FROM NEW.sample_id )
+    EXECUTE PROCEDURE labman.plate_summary_sample_changed();
+DROP TRIGGER IF EXISTS plate_summary_quantified ON labman.concentration_calculation;
+CREATE TRIGGER plate_summary_quantified AFTER INSERT ON labman.concentration_calculation
+    FOR EACH ROW EXECUTE PROCEDURE labman.plate_summary_quantified();
+-- A plate is flagged as stale at most once per transaction, so each stale
+-- plate is recomputed once at commit time
+DROP TRIGGER IF EXISTS plate_summary_refresh ON labman.plate_summary;
+CREATE CONSTRAINT TRIGGER plate_summary_refresh AFTER INSERT OR UPDATE OF stale ON labman.plate_summary
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW WHEN ( NEW.stale )
+    EXECUTE PROCEDURE labman.plate_summary_refresh();
+
+-- Summarize the plates that already exist
+INSERT INTO labman.plate_summary (plate_id, discarded)
+    SELECT plate_id, discarded FROM labman.plate;
+
+-- Position of each combo in the list of combos of its shotgun primer set,
+-- starting at 0. ShotgunPrimerSet.get_next_combos allocates combos by
+-- position, wrapping around at the end of the list. The existing combos are
+-- numbered in the order in which they were inserted
+-- ADD COLUMN IF NOT EXISTS and CREATE INDEX IF NOT EXISTS need PostgreSQL 9.6
+-- and 9.5, so the existing column and index are looked up in the catalog
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM information_schema.columns
+                   WHERE table_schema = 'labman'
+                       AND table_name = 'shotgun_combo_primer_set'
+                       AND column_name = 'combo_index') THEN
+        ALTER TABLE labman.shotgun_combo_primer_set ADD COLUMN combo_index integer;
+    END IF;
+END $$;
+UPDATE labman.shotgun_combo_primer_set c
+    SET combo_index = o.combo_index
+    FROM (SELECT shotgun_combo_primer_set_id,
+                 row_number() OVER (PARTITION BY shotgun_primer_set_id
+                                    ORDER BY shotgun_combo_primer_set_id) - 1 AS combo_index
+          FROM labman.shotgun_combo_primer_set) o
+    WHERE c.shotgun_combo_primer_set_id = o.shotgun_combo_primer_set_id
+        AND c.combo_index IS NULL;
+ALTER TABLE labman.shotgun_combo_primer_set ALTER COLUMN combo_index SET NOT NULL;
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_indexes
+                   WHERE schemaname = 'labman'
+                       AND indexname = 'idx_shotgun_combo_primer_set_index') THEN
+        CREATE UNIQUE INDEX idx_shotgun_combo_primer_set_index ON labman.shotgun_combo_primer_set ( shotgun_primer_set_id, combo_index );
+    END IF;
+END $$;
+
+-- Composition type of the compositions at the leaves of each pool tree, e.g.
+-- 'shotgun library prep' both for a plate pool and for a pool of plate pools.
+-- It is set by the triggers below from the first component added to the pool,
+-- and propagated to the pools containing a pool once its own type is known
+-- ADD COLUMN IF NOT EXISTS needs PostgreSQL 9.6, so the existing column is
+-- looked up in the catalog
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM information_schema.columns
+                   WHERE table_schema = 'labman'
+                       AND table_name = 'pool_composition'
+                       AND column_name = 'leaf_composition_type_id') THEN
+        ALTER TABLE labman.pool_composition ADD COLUMN leaf_composition_type_id bigint;
+    END IF;
+END $$;
+ALTER TABLE labman.pool_composition DROP CONSTRAINT IF EXISTS fk_pool_composition_leaf_type;
+ALTER TABLE labman.pool_composition ADD CONSTRAINT fk_pool_composition_leaf_type FOREIGN KEY ( leaf_composition_type_id ) REFERENCES labman.composition_type( composition_type_id );
+
+CREATE OR REPLACE FUNCTION labman.pool_composition_component_inserted() RETURNS trigger AS $$
+BEGIN
+    -- A pool component without leaf type yet leaves it unset, it is
+    -- propagated once known
+    UPDATE labman.pool_composition
+        SET leaf_composition_type_id = (
+            SELECT CASE WHEN ipc.pool_composition_id IS NULL
+                        THEN c.composition_type_id
+                        ELSE ipc.leaf_composition_type_id END
+            FROM labman.composition c
+                LEFT JOIN labman.pool_composition ipc USING (composition_id)
+            WHERE c.composition_id = NEW.input_composition_id)
+        WHERE pool_composition_id = NEW.output_pool_composition_id
+            AND leaf_composition_type_id IS NULL;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION labman.pool_composition_leaf_type_set() RETURNS trigger AS $$
+BEGIN
+    UPDATE labman.pool_composition
+        SET leaf_composition_type_id = NEW.leaf_composition_type_id
+        WHERE leaf_composition_type_id IS NULL AND pool_composition_id IN (
+            SELECT output_pool_composition_id
+            FROM labman.pool_composition_components
+            WHERE input_composition_id = NEW.composition_id);
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS pool_composition_component_inserted ON labman.pool_composition_components;
+CREATE TRIGGER pool_composition_component_inserted AFTER INSERT ON labman.pool_composition_components
+    FOR EACH ROW EXECUTE PROCEDURE labman.pool_composition_component_inserted();
+DROP TRIGGER IF EXISTS pool_composition_leaf_type_set ON labman.pool_composition;
+CREATE TRIGGER pool_composition_leaf_type_set AFTER UPDATE OF leaf_composition_type_id ON labman.pool_composition
+    FOR EACH ROW WHEN ( OLD.leaf_composition_type_id IS NULL AND NEW.leaf_composition_type_id IS NOT NULL )
+    EXECUTE PROCEDURE labman.pool_composition_leaf_type_set();
+
+-- Set the leaf type of the existing pools, walking down their first
+-- component until reaching a composition that is not a pool
+WITH RECURSIVE descent AS (
+    SELECT pool_composition_id AS root_id, pool_composition_id
+    FROM labman.pool_composition
+    WHERE leaf_composition_type_id IS NULL
+    UNION ALL
+    SELECT d.root_id, ipc.pool_composition_id
+    FROM descent d
+        JOIN LATERAL (SELECT input_composition_id
+                      FROM labman.pool_composition_components
+                      WHERE output_pool_composition_id = d.pool_composition_id
+                      ORDER BY pool_composition_components_id
+                      LIMIT 1) pcc ON TRUE
+        JOIN labman.pool_composition ipc
+            ON ipc.composition_id = pcc.input_composition_id
+), leaf AS (
+    SELECT d.root_id, c.composition_type_id
+    FROM descent d
+        JOIN LATERAL (SELECT input_composition_id
+                      FROM labman.pool_composition_components
+                      WHERE output_pool_composition_id = d.pool_composition_id
+                      ORDER BY pool_composition_components_id
+                      LIMIT 1) pcc ON TRUE
+        JOIN labman.composition c ON c.composition_id = pcc.input_composition_id
+        JOIN labman.composition_type ct USING (composition_type_id)
+    WHERE ct.description != 'pool'
+)
+UPDATE labman.pool_composition pc
+    SET leaf_composition_type_id = leaf.composition_type_id
+    FROM leaf
+    WHERE pc.pool_composition_id = leaf.root_id;
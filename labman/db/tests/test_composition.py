@@ -8,11 +8,11 @@
 
 from unittest import main
 
-from labman.db.exceptions import LabmanUnknownIdError
+from labman.db.exceptions import LabmanUnknownIdError, LabmanError
 from labman.db.testing import LabmanTestCase
 from labman.db.container import Tube, Well
 from labman.db.study import Study
-from labman.db.plate import Plate
+from labman.db.plate import Plate, PlateConfiguration
 from labman.db.process import (
     ReagentCreationProcess, GDNAExtractionProcess, SamplePlatingProcess)
 from labman.db.composition import (
@@ -326,6 +326,55 @@ class TestsComposition(LabmanTestCase):
         obs3 = PoolComposition(3)  # of shotgun
         self.assertTrue(obs3.is_plate_pool)
 
+    def test_pool_composition_leaf_composition_type(self):
+        self.assertEqual(PoolComposition(1).leaf_composition_type,
+                         '16S library prep')
+        # Pool of pools
+        self.assertEqual(PoolComposition(2).leaf_composition_type,
+                         '16S library prep')
+        self.assertEqual(PoolComposition(3).leaf_composition_type,
+                         'shotgun library prep')
+
+    def test_pool_composition_get_tree(self):
+        obs = PoolComposition(1).get_tree()
+        self.assertEqual(len(obs), 95)
+        exp = {'depth': 1, 'output_pool_composition_id': 1,
+               'composition_id': LibraryPrep16SComposition(1).composition_id,
+               'composition_type': '16S library prep', 'input_volume': 1.0,
+               'percentage_of_output': 0, 'is_leaf': True}
+        self.assertEqual(obs[0], exp)
+
+        obs = PoolComposition(2).get_tree()
+        obs_pools = [c for c in obs if c['depth'] == 1]
+        self.assertEqual(
+            [c['composition_id'] for c in obs_pools],
+            [PoolComposition(i).composition_id for i in (1, 4, 5, 6)])
+        for c in obs_pools:
+            self.assertEqual(c['composition_type'], 'pool')
+            self.assertFalse(c['is_leaf'])
+        obs_leaves = [c for c in obs if c['depth'] == 2]
+        self.assertEqual(len(obs_leaves), len(obs) - 4)
+        for c in obs_leaves:
+            self.assertEqual(c['composition_type'], '16S library prep')
+            self.assertTrue(c['is_leaf'])
+        self.assertEqual(obs_leaves[0], dict(exp, depth=2))
+
+    def test_pool_composition_list_pools(self):
+        obs = PoolComposition.list_pools()
+        self.assertEqual(len(obs), 6)
+        self.assertEqual(obs[0], {
+            'pool_composition_id': 1,
+            'external_id': 'Test Pool from Plate 1', 'is_plate_pool': True,
+            'upstream_process_id': PoolComposition(1).upstream_process.id,
+            'leaf_composition_type': '16S library prep'})
+        self.assertEqual(
+            [(p['pool_composition_id'], p['is_plate_pool'],
+              p['leaf_composition_type']) for p in obs],
+            [(1, True, '16S library prep'), (2, False, '16S library prep'),
+             (3, True, 'shotgun library prep'),
+             (4, True, '16S library prep'), (5, True, '16S library prep'),
+             (6, True, '16S library prep')])
+
     def test_primer_set_attributes(self):
         obs = PrimerSet(1)
         self.assertEqual(obs.external_id, 'EMP 16S V4 primer set')
@@ -346,6 +395,82 @@ class TestsComposition(LabmanTestCase):
                 'target_name': 'Shotgun'}]
         self.assertEqual(obs, exp)
 
+    def test_primer_set_parse_barcodes(self):
+        obs = PrimerSet.parse_barcodes(
+            'BarcodeSequence\tLinkerPrimerSequence\tPrimer_Plate\tWell_ID\n'
+            'ACGAGACTGATT\tGTGTGCCAGCMGCCGCGGTAA\t1\tA1\n'
+            '\n'
+            'GCTGTACGGATT\tGTGTGCCAGCMGCCGCGGTAA\t2\tH12\n')
+        exp = [{'line': 2, 'barcode': 'ACGAGACTGATT', 'plate': '1',
+                'well': 'A1', 'row': 1, 'column': 1, 'external_id': None},
+               {'line': 4, 'barcode': 'GCTGTACGGATT', 'plate': '2',
+                'well': 'H12', 'row': 8, 'column': 12, 'external_id': None}]
+        self.assertEqual(obs, exp)
+
+        obs = PrimerSet.parse_barcodes(
+            'barcode,plate,well,external_id\nACCGACAA,1,A1,iTru5_01_A\n')
+        self.assertEqual(obs[0]['external_id'], 'iTru5_01_A')
+
+        with self.assertRaisesRegex(ValueError, 'missing the required '
+                                                'columns: well'):
+            PrimerSet.parse_barcodes('barcode,plate\nACGT,1\n')
+        with self.assertRaisesRegex(ValueError, 'Line 3: "Z0" is not a valid '
+                                                'well id\nLine 4: well A1 of '
+                                                'plate 1 is already listed '
+                                                'in line 2'):
+            PrimerSet.parse_barcodes('barcode,plate,well\nACGT,1,A1\n'
+                                     'ACGT,1,Z0\nACGT,1,A1\n')
+
+
+# This tests do modify the database in a way that can't be easily reverted,
+# hence allowing this to live in its own class so the DB gets reseted
+class TestPrimerSetLoad(LabmanTestCase):
+    def test_load(self):
+        records = PrimerSet.parse_barcodes(
+            'barcode\tprimer_plate\twell_id\n'
+            'ACGAGACTGATT\t1\tA1\n'
+            'GCTGTACGGATT\t1\tA2\n'
+            'ATCACCAGGTGT\t2\tA1\n')
+        obs, changes = PrimerSet.load(
+            'Test load primer set', 'Amplicon', records,
+            'Test load primer plate', PlateConfiguration(4))
+        self.assertEqual(changes, {'primer_sets': 1, 'plates': 2, 'wells': 3})
+        self.assertEqual(obs.external_id, 'Test load primer set')
+        self.assertEqual(obs.target_name, 'Amplicon')
+        plates = obs.plates
+        self.assertEqual([p.external_id for p in plates],
+                         ['Test load primer plate 1',
+                          'Test load primer plate 2'])
+        comp = plates[0].get_well(1, 2).composition
+        self.assertIsInstance(comp, PrimerSetComposition)
+        self.assertEqual(comp.barcode, 'GCTGTACGGATT')
+        self.assertEqual(comp.total_volume, 0)
+
+        # Loading again doesn't change anything, and new wells are added
+        records.extend(PrimerSet.parse_barcodes(
+            'barcode,primer_plate,well_id\nTGGTCAACGATA,2,A2\n'))
+        obs2, changes = PrimerSet.load(
+            'Test load primer set', 'Amplicon', records,
+            'Test load primer plate', PlateConfiguration(4))
+        self.assertEqual(obs2, obs)
+        self.assertEqual(changes, {'primer_sets': 0, 'plates': 0, 'wells': 1})
+        self.assertEqual(
+            plates[1].get_well(1, 2).composition.barcode, 'TGGTCAACGATA')
+
+        # Changing the barcode of an existing well is not allowed
+        records = PrimerSet.parse_barcodes(
+            'barcode,primer_plate,well_id\nAAAAAAAAAAAA,1,A1\n')
+        with self.assertRaisesRegex(LabmanError, 'Test load primer plate 1'):
+            PrimerSet.load('Test load primer set', 'Amplicon', records,
+                           'Test load primer plate', PlateConfiguration(4))
+
+        # Wells outside of the plate
+        records = PrimerSet.parse_barcodes(
+            'barcode,primer_plate,well_id\nAAAAAAAAAAAA,1,I1\n')
+        with self.assertRaisesRegex(LabmanError, 'outside of the plate'):
+            PrimerSet.load('Test load primer set', 'Amplicon', records,
+                           'Test load primer plate', PlateConfiguration(4))
+
 
 # This tests do modify the database in a way that can't be easily reverted,
 # hence allowing this to live in its own class so the DB gets reseted
@@ -376,6 +501,14 @@ class TestShotgunPrimerSet(LabmanTestCase):
                (PrimerSetComposition(769), PrimerSetComposition(1155))]
         self.assertEqual(obs, exp)
 
+        # Reaching the end of the list wraps around to its beginning
+        total = 384 * 384
+        obs = tester.get_next_combo_ids(total - 385 + 2)
+        self.assertEqual(tester.current_combo_index, 2)
+        self.assertEqual(len(obs), total - 385 + 2)
+        self.assertEqual(len(set(obs)), len(obs))
+        self.assertEqual(obs[-2:], [(769, 1153), (771, 1155)])
+
 
 class TestCreateControlSample(LabmanTestCase):
     def test_create_control_sample_type(self):
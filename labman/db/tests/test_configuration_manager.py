@@ -37,7 +37,7 @@ class TestConfigurationManager(TestCase):
                 tmp_f.name, True, '/path/to/server.cert',
                 '/path/to/server.key', 'db_host', 'db_port', 'db_name',
                 'db_user', 'db_password', 'db_admin_user', 'db_admin_password',
-                '/path/to/logdir', 'server_cert')
+                '/path/to/logdir', 'server_cert', cookie_secret='secret')
 
             with open(tmp_f.name) as obs_f:
                 obs = obs_f.read()
@@ -57,6 +57,7 @@ TEST_ENVIRONMENT=True
 LOG_DIR=/path/to/logdir
 CERTIFICATE_FILEPATH=/path/to/server.cert
 KEY_FILEPATH=/path/to/server.key
+COOKIE_SECRET=
 
 # ----------------------- POSTGRES SETTINGS --------------------------------
 [postgres]
@@ -80,6 +81,7 @@ TEST_ENVIRONMENT=True
 LOG_DIR=/path/to/logdir
 CERTIFICATE_FILEPATH=/path/to/server.cert
 KEY_FILEPATH=/path/to/server.key
+COOKIE_SECRET=secret
 
 # ----------------------- POSTGRES SETTINGS --------------------------------
 [postgres]
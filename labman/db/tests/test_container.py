@@ -65,6 +65,20 @@ class TestWell(LabmanTestCase):
         self.assertEqual(Well(54).well_id, 'E6')
         self.assertEqual(Well(96).well_id, 'H12')
 
+    def test_format_well_id(self):
+        self.assertEqual(Well.format_well_id(1, 1), 'A1')
+        self.assertEqual(Well.format_well_id(16, 24), 'P24')
+        self.assertEqual(Well.format_well_id(27, 3), 'AA3')
+
+    def test_parse_well_id(self):
+        self.assertEqual(Well.parse_well_id('A1'), (1, 1))
+        self.assertEqual(Well.parse_well_id('p24'), (16, 24))
+        self.assertEqual(Well.parse_well_id(' H01 '), (8, 1))
+        self.assertEqual(Well.parse_well_id('AA3'), (27, 3))
+        for well_id in ('', 'A', '1', 'A0', 'A1B', '1A'):
+            with self.assertRaisesRegex(ValueError, 'is not a valid well id'):
+                Well.parse_well_id(well_id)
+
 
 if __name__ == '__main__':
     main()
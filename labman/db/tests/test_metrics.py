@@ -0,0 +1,89 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2017-, labman development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from unittest import main, TestCase
+
+from labman.db import metrics
+
+
+class TestMetrics(TestCase):
+    def setUp(self):
+        # The test metrics are kept out of the registry of the process
+        self.registry = []
+        self._artifact_duration = metrics.ARTIFACT_DURATION
+        metrics.ARTIFACT_DURATION = metrics.Histogram(
+            'labman_artifact_generation_seconds', 'Test artifacts',
+            labels=('artifact', ), registry=self.registry)
+
+    def tearDown(self):
+        metrics.ARTIFACT_DURATION = self._artifact_duration
+
+    def test_counter(self):
+        obs = metrics.Counter('test_counter_total', 'A test counter',
+                              labels=('handler', 'status'),
+                              registry=self.registry)
+        obs.inc(handler='PlateHandler', status='200')
+        obs.inc(2, handler='PlateHandler', status='200')
+        obs.inc(handler='Pool"Handler', status='500')
+        exp = ('# HELP test_counter_total A test counter\n'
+               '# TYPE test_counter_total counter\n'
+               'test_counter_total{handler="PlateHandler",status="200"} 3\n'
+               'test_counter_total{handler="Pool\\"Handler",status="500"} 1')
+        self.assertEqual(obs.render(), exp)
+
+        with self.assertRaises(ValueError):
+            obs.inc(handler='PlateHandler')
+
+    def test_histogram(self):
+        obs = metrics.Histogram('test_seconds', 'A test histogram',
+                                labels=('artifact', ), buckets=(0.5, 1),
+                                registry=self.registry)
+        obs.observe(0.25, artifact='picklist')
+        obs.observe(1, artifact='picklist')
+        obs.observe(3.5, artifact='picklist')
+        exp = ('# HELP test_seconds A test histogram\n'
+               '# TYPE test_seconds histogram\n'
+               'test_seconds_bucket{artifact="picklist",le="0.5"} 1\n'
+               'test_seconds_bucket{artifact="picklist",le="1"} 2\n'
+               'test_seconds_bucket{artifact="picklist",le="+Inf"} 3\n'
+               'test_seconds_sum{artifact="picklist"} 4.75\n'
+               'test_seconds_count{artifact="picklist"} 3')
+        self.assertEqual(obs.render(), exp)
+
+    def test_callback_gauge(self):
+        obs = metrics.CallbackGauge('test_gauge', 'A test gauge', lambda: 7,
+                                    registry=self.registry)
+        self.assertEqual(obs.render(), '# HELP test_gauge A test gauge\n'
+                                       '# TYPE test_gauge gauge\n'
+                                       'test_gauge 7')
+        self.assertIn(obs.render(), metrics.render(self.registry))
+        self.assertNotIn('test_gauge', metrics.render())
+
+    def test_timed_artifact(self):
+        @metrics.timed_artifact('test_function')
+        def function():
+            return 'contents'
+
+        @metrics.timed_artifact('test_generator')
+        def generator():
+            yield 'line 1'
+            yield 'line 2'
+
+        self.assertEqual(function(), 'contents')
+        self.assertEqual(list(generator()), ['line 1', 'line 2'])
+        obs = metrics.ARTIFACT_DURATION.render()
+        self.assertIn(
+            'labman_artifact_generation_seconds_count'
+            '{artifact="test_function"} 1', obs)
+        self.assertIn(
+            'labman_artifact_generation_seconds_count'
+            '{artifact="test_generator"} 1', obs)
+
+
+if __name__ == '__main__':
+    main()
@@ -10,6 +10,7 @@ from unittest import main
 from datetime import datetime
 from types import GeneratorType
 
+from labman.db import sql_connection
 from labman.db.testing import LabmanTestCase
 from labman.db.plate import PlateConfiguration, Plate
 from labman.db.container import Well
@@ -93,6 +94,24 @@ class TestPlate(LabmanTestCase):
             Plate.search(plate_notes='interesting', well_notes='write',
                          query_type='UNION'), [plate22, plate23])
 
+        # Ranked search
+        with self.assertRaises(ValueError):
+            Plate.ranked_search(samples=['1.SKB1.640202'], limit=-1)
+        obs = Plate.ranked_search(samples=['1.SKB1.640202', 'Not a sample'],
+                                  plate_notes='interesting',
+                                  query_type='UNION')
+        self.assertEqual([r['plate_id'] for r in obs], [21, 27, 30, 33, 22])
+        self.assertEqual(obs[0]['external_id'], 'Test plate 1')
+        self.assertAlmostEqual(obs[0]['rank'], 0.5)
+        self.assertGreater(obs[4]['rank'], 0)
+        self.assertLess(obs[4]['rank'], 0.5)
+        obs = Plate.ranked_search(samples=['1.SKB1.640202'],
+                                  plate_notes='interesting',
+                                  query_type='UNION', limit=2, offset=3)
+        self.assertEqual([r['plate_id'] for r in obs], [33, 22])
+        self.assertEqual(
+            Plate.ranked_search(plate_notes='interesting', limit=0), [])
+
     def test_list_plates(self):
         # Test returning all plates
         obs = Plate.list_plates()
@@ -185,6 +204,48 @@ class TestPlate(LabmanTestCase):
                    'studies': ['Identification of the Microbiomes '
                                'for Cannabis Soils']}])
 
+    def test_list_plates_study_title_changed(self):
+        def _set_title(title):
+            with sql_connection.TRN as TRN:
+                TRN.add("UPDATE qiita.study SET study_title = %s "
+                        "WHERE study_id = 1", [title])
+                TRN.execute()
+
+        old_title = 'Identification of the Microbiomes for Cannabis Soils'
+        _set_title('Renamed study')
+        try:
+            obs = {r['plate_id']: r['studies'] for r in Plate.list_plates(
+                ['sample'], include_study_titles=True)}
+            self.assertEqual(obs[21], ['Renamed study'])
+        finally:
+            _set_title(old_title)
+
+    def test_list_plates_summary_refresh(self):
+        spp = SamplePlatingProcess.create(
+            User('test@foo.bar'), PlateConfiguration(1), 'Summary Test', 10)
+        plate_id = spp.plate.id
+        obs = {r['plate_id']: r for r in Plate.list_plates(
+            ['sample'], include_study_titles=True)}
+        self.assertEqual(obs[plate_id], {'plate_id': plate_id,
+                                         'external_id': 'Summary Test',
+                                         'studies': None})
+
+        # Plating a sample flags the plate, which is recomputed on listing
+        spp.update_well(1, 1, '1.SKM1.640184')
+        obs = {r['plate_id']: r for r in Plate.list_plates(
+            ['sample'], include_study_titles=True)}
+        self.assertEqual(obs[plate_id]['studies'],
+                         ['Identification of the Microbiomes '
+                          'for Cannabis Soils'])
+        self.assertNotIn(plate_id, [r['plate_id'] for r in Plate.list_plates(
+            ['sample'], only_quantified=True)])
+
+        spp.plate.discarded = True
+        self.assertNotIn(plate_id, [r['plate_id'] for r in Plate.list_plates(
+            ['sample'])])
+        self.assertIn(plate_id, [r['plate_id'] for r in Plate.list_plates(
+            ['sample'], include_discarded=True)])
+
     def test_plate_list_discarded_functionality(self):
         # test case based on the test_list_plates
         obs = Plate.list_plates()
@@ -404,6 +465,14 @@ class TestPlate(LabmanTestCase):
         self.assertEqual(tester.get_wells_by_sample('1.SKB1.640202'), exp)
         self.assertEqual(tester.get_wells_by_sample('1.SKM1.640183'), [])
 
+    def test_get_plates_by_samples(self):
+        self.assertEqual(Plate.get_plates_by_samples([]), {})
+        obs = Plate.get_plates_by_samples(
+            ['1.SKB1.640202', '1.SKB1.640202', 'Not a sample'])
+        self.assertEqual(
+            obs, {'1.SKB1.640202': [Plate(21), Plate(27), Plate(30),
+                                    Plate(33)]})
+
     def test_get_previously_plated_wells(self):
         tester = Plate(21)
         three_plates_list = [Plate(27), Plate(30), Plate(33)]
@@ -453,6 +522,52 @@ class TestPlate(LabmanTestCase):
         obs = spp.plate.get_previously_plated_wells()
         self.assertEqual(obs, {})
 
+    def test_studies(self):
+        # The studies are resolved for every kind of plate
+        for plate_id in (21, 22, 23, 24, 25, 26):
+            self.assertEqual(Plate(plate_id).studies, {Study(1)})
+        # Primer plates don't have samples
+        self.assertEqual(Plate(11).studies, set())
+
+        title = 'Identification of the Microbiomes for Cannabis Soils'
+        self.assertEqual(Plate._get_plate_studies([11, 21, 26]),
+                         {11: [], 21: [(1, title)], 26: [(1, title)]})
+        self.assertEqual(Plate._get_plate_studies([]), {})
+
+    def test_get_summary(self):
+        obs = Plate(21).get_summary()
+        self.assertEqual(obs['plate_id'], 21)
+        self.assertEqual(obs['external_id'], 'Test plate 1')
+        self.assertFalse(obs['discarded'])
+        self.assertIsNone(obs['notes'])
+        self.assertEqual(obs['process_notes'], SamplePlatingProcess(10).notes)
+        self.assertEqual(obs['plate_configuration'],
+                         [1, '96-well deep-well plate', 8, 12])
+        self.assertEqual(obs['duplicates'][:2],
+                         [[1, 1, '1.SKB1.640202.21.A1'],
+                          [1, 2, '1.SKB1.640202.21.A2']])
+        self.assertEqual(
+            len(obs['duplicates']),
+            sum(len(v) for v in Plate(21).duplicates.values()))
+        self.assertEqual(len(obs['previous_plates']), 72)
+        exp = [{'plate_id': 27, 'plate_name': 'Test plate 2'},
+               {'plate_id': 30, 'plate_name': 'Test plate 3'},
+               {'plate_id': 33, 'plate_name': 'Test plate 4'}]
+        self.assertEqual(obs['previous_plates'][0], [[1, 1], exp])
+        self.assertEqual(obs['unknowns'], [])
+        self.assertEqual(obs['studies'], [1])
+        self.assertEqual(obs['quantification_processes'], [])
+
+        obs = Plate(26).get_summary()
+        self.assertEqual(
+            [q[0] for q in obs['quantification_processes']],
+            [q.id for q in Plate(26).quantification_processes])
+        q = Plate(26).quantification_processes[0]
+        self.assertEqual(obs['quantification_processes'][0],
+                         [q.id, q.personnel.name, q.date, q.notes])
+        self.assertEqual(obs['duplicates'], [])
+        self.assertEqual(obs['previous_plates'], [])
+
 
 if __name__ == '__main__':
     main()
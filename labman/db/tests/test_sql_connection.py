@@ -18,7 +18,8 @@ from psycopg2.extensions import TRANSACTION_STATUS_IDLE
 
 
 from labman.db.settings import labman_settings
-from labman.db.sql_connection import SQLConnectionHandler, Transaction, TRN
+from labman.db.sql_connection import (
+    SQLConnectionHandler, StatementRecorder, Transaction, TRN)
 
 
 DB_CREATE_TEST_TABLE = """CREATE TABLE labman.test_table (
@@ -286,6 +287,25 @@ class TestTransaction(TestBase):
 
         self._assert_sql_equal([("test_insert", False, 20)])
 
+    def test_execute_statement_recorder(self):
+        recorder = StatementRecorder()
+        Transaction.recorder = recorder
+        try:
+            with TRN:
+                TRN.add("SELECT 42")
+                TRN.add("SELECT 43")
+                TRN.execute()
+        finally:
+            Transaction.recorder = None
+        self.assertEqual(recorder.count, 2)
+        self.assertGreater(recorder.seconds, 0)
+
+        # Statements executed while the recorder is not active are not counted
+        with TRN:
+            TRN.add("SELECT 42")
+            TRN.execute()
+        self.assertEqual(recorder.count, 2)
+
     def test_execute_many(self):
         with TRN:
             sql = """INSERT INTO labman.test_table (str_column, int_column)
@@ -475,6 +495,23 @@ class TestTransaction(TestBase):
             obs = TRN.execute_fetchflatten(idx=3)
             self.assertEqual(obs, ['insert1', 1, 'insert2', 2, 'insert3', 3])
 
+    def test_execute_fetchstream(self):
+        with TRN:
+            sql = """INSERT INTO labman.test_table (str_column, int_column)
+                     VALUES (%s, %s)"""
+            args = [['insert1', 1], ['insert2', 2], ['insert3', 3]]
+            TRN.add(sql, args, many=True)
+
+            sql = """SELECT str_column, int_column FROM labman.test_table
+                     WHERE int_column > %s ORDER BY int_column"""
+            obs = TRN.execute_fetchstream(sql, [1], itersize=1)
+            self.assertEqual([list(r) for r in obs],
+                             [['insert2', 2], ['insert3', 3]])
+            self.assertEqual(TRN._queries, [])
+
+        with self.assertRaises(RuntimeError):
+            next(TRN.execute_fetchstream("SELECT 42"))
+
     def test_context_manager_rollback(self):
         try:
             with TRN:
@@ -10,11 +10,23 @@ from unittest import main
 
 from labman.db.testing import LabmanTestCase
 from labman.db.exceptions import LabmanUnknownIdError
+from labman.db.sql_connection import StatementRecorder, Transaction
+from labman.db import study
 from labman.db.study import Study
 from labman.db.user import User
 
 
 class TestStudy(LabmanTestCase):
+    def _get_project_names(self, study_ids):
+        # Returns the project names and the number of statements executed
+        recorder = StatementRecorder()
+        Transaction.recorder = recorder
+        try:
+            names = Study.get_project_names(study_ids)
+        finally:
+            Transaction.recorder = None
+        return names, recorder.count
+
     def test_list_studies(self):
         obs = Study.list_studies()
         exp = [{'study_id': 1,
@@ -25,6 +37,42 @@ class TestStudy(LabmanTestCase):
                 'num_samples': 27}]
         self.assertEqual(obs, exp)
 
+    def test_get_project_names(self):
+        Study.invalidate_project_names()
+        self.assertEqual(Study.get_project_names([1, 1000000]),
+                         {1: 'LabDude_PIDude_1'})
+        # Served from the cache
+        self.assertEqual(Study.get_project_names([1]),
+                         {1: 'LabDude_PIDude_1'})
+        self.assertEqual(Study.get_project_names([]), {})
+        self.assertEqual(Study(1).project_name, 'LabDude_PIDude_1')
+
+    def test_get_project_names_cached(self):
+        Study.invalidate_project_names()
+        exp = {1: 'LabDude_PIDude_1'}
+        self.assertEqual(self._get_project_names([1]), (exp, 1))
+        self.assertEqual(self._get_project_names([1]), (exp, 0))
+
+    def test_get_project_names_expired(self):
+        Study.invalidate_project_names()
+        exp = {1: 'LabDude_PIDude_1'}
+        ttl = study._PROJECT_NAMES_CACHE_TTL
+        study._PROJECT_NAMES_CACHE_TTL = 0
+        try:
+            self.assertEqual(self._get_project_names([1]), (exp, 1))
+            self.assertEqual(self._get_project_names([1]), (exp, 1))
+        finally:
+            study._PROJECT_NAMES_CACHE_TTL = ttl
+
+    def test_invalidate_project_names(self):
+        exp = {1: 'LabDude_PIDude_1'}
+        Study.get_project_names([1])
+        Study.invalidate_project_names([1, 1000000])
+        self.assertEqual(self._get_project_names([1]), (exp, 1))
+        self.assertEqual(self._get_project_names([1]), (exp, 0))
+        Study.invalidate_project_names()
+        self.assertEqual(self._get_project_names([1]), (exp, 1))
+
     def test_init(self):
         with self.assertRaises(LabmanUnknownIdError):
             Study(1000000)
@@ -62,6 +62,8 @@ class TestUser(LabmanTestCase):
         tester = User('test@foo.bar')
         self.assertEqual(tester.name, 'Dude')
         self.assertEqual(tester.email, 'test@foo.bar')
+        self.assertFalse(tester.is_admin)
+        self.assertTrue(User('admin@foo.bar').is_admin)
 
     def test_grant_revoke_access(self):
         tester = User('shared@foo.bar')
@@ -76,6 +78,32 @@ class TestUser(LabmanTestCase):
         with self.assertRaises(LabmanLoginDisabledError):
             User.login('shared@foo.bar', 'password')
 
+    def test_get_password_hash_check_password(self):
+        obs = User.get_password_hash('test@foo.bar')
+        self.assertTrue(User.check_password('password', obs))
+        self.assertFalse(User.check_password('wrongpassword', obs))
+
+        with self.assertRaises(LabmanUnknownIdError):
+            User.get_password_hash('does@not.exist')
+
+        with self.assertRaises(LabmanLoginDisabledError):
+            User.get_password_hash('shared@foo.bar')
+
+    def test_from_session(self):
+        self.assertEqual(User.from_session('test@foo.bar'),
+                         User('test@foo.bar'))
+        self.assertIn('test@foo.bar', User._session_cache)
+        self.assertIsNone(User.from_session('does@not.exist'))
+        # The user doesn't have access to labman
+        self.assertIsNone(User.from_session('shared@foo.bar'))
+
+        tester = User('shared@foo.bar')
+        tester.grant_access()
+        self.assertEqual(User.from_session('shared@foo.bar'), tester)
+        tester.revoke_access()
+        self.assertNotIn('shared@foo.bar', User._session_cache)
+        self.assertIsNone(User.from_session('shared@foo.bar'))
+
 
 if __name__ == '__main__':
     main()
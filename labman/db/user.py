@@ -6,6 +6,8 @@
 # The full license is in the file LICENSE, distributed with this software.
 # ----------------------------------------------------------------------------
 
+from time import monotonic
+
 from bcrypt import hashpw, gensalt, checkpw
 
 from . import base
@@ -30,6 +32,12 @@ class User(base.LabmanObject):
     _table = "qiita.qiita_user"
     _id_column = "email"
 
+    # The users of the validated sessions, see User.from_session. Each
+    # process keeps its own cache, so changes made through other processes
+    # are seen once the entry expires
+    _session_cache = {}
+    _session_ttl = 60
+
     @staticmethod
     def list_users(access_only=False):
         """Return a list of user information
@@ -106,6 +114,34 @@ class User(base.LabmanObject):
         LabmanLoginDisabledError
             If the user doesn't have access to login into labman
         """
+        if cls.check_password(password, cls.get_password_hash(email)):
+            # Password matches, return the new user object
+            return cls(email)
+        else:
+            # Password didn't match, raise a Login error
+            raise exceptions.LabmanLoginError()
+
+    @staticmethod
+    def get_password_hash(email):
+        """Returns the password hash of a user allowed to log into labman
+
+        Parameters
+        ----------
+        email : str
+            The user email
+
+        Returns
+        -------
+        bytes
+            The hashed password of the user
+
+        Raises
+        ------
+        LabmanUnknownIdError
+            Email is not recognized
+        LabmanLoginDisabledError
+            If the user doesn't have access to login into labman
+        """
         with sql_connection.TRN as TRN:
             sql = """SELECT password::bytea
                      FROM qiita.qiita_user
@@ -125,18 +161,66 @@ class User(base.LabmanObject):
                 # The user doesn't have access to login into labman
                 raise exceptions.LabmanLoginDisabledError()
 
-            db_pwd = res[0][0]
-            # Check that the given password matches the one in the DB
-            password = cls._encode_password(password)
             # The stored password is returned as a memory view, we simply need
             # to cast it to bytes so we can use it in the checkpw call
-            db_pwd = bytes(db_pwd)
-            if checkpw(password, db_pwd):
-                # Password matches, return the new user object
-                return cls(email)
-            else:
-                # Password didn't match, raise a Login error
-                raise exceptions.LabmanLoginError()
+            return bytes(res[0][0])
+
+    @staticmethod
+    def check_password(password, password_hash):
+        """Checks a password against its stored hash
+
+        This is slow by design and doesn't access the database, so it can be
+        run outside of the thread serving the requests
+
+        Parameters
+        ----------
+        password : str
+            The password to check
+        password_hash : bytes
+            The hashed password, as returned by `get_password_hash`
+
+        Returns
+        -------
+        bool
+            Whether the password matches
+        """
+        return checkpw(User._encode_password(password), password_hash)
+
+    @classmethod
+    def from_session(cls, email):
+        """Returns the user of a session if they can still use labman
+
+        The validated users are cached for `_session_ttl` seconds, so the
+        database is only checked once in a while for each user
+
+        Parameters
+        ----------
+        email : str
+            The user email stored in the session
+
+        Returns
+        -------
+        User or None
+            The user, or None if the user doesn't exist or doesn't have
+            access to labman
+        """
+        now = monotonic()
+        cached = cls._session_cache.get(email)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+        with sql_connection.TRN as TRN:
+            sql = """SELECT EXISTS(SELECT *
+                                   FROM labman.labmanager_access
+                                   WHERE email = %s)"""
+            TRN.add(sql, [email])
+            if not TRN.execute_fetchlast():
+                cls._session_cache.pop(email, None)
+                return None
+            user = cls(email)
+
+        cls._session_cache[email] = (user, now + cls._session_ttl)
+        return user
 
     @property
     def name(self):
@@ -153,6 +237,17 @@ class User(base.LabmanObject):
         """The email of the user"""
         return self._get_attr('email')
 
+    @property
+    def is_admin(self):
+        """Whether the user is a Qiita administrator"""
+        with sql_connection.TRN as TRN:
+            sql = """SELECT name = 'admin'
+                     FROM qiita.qiita_user
+                        JOIN qiita.user_level USING (user_level_id)
+                     WHERE email = %s"""
+            TRN.add(sql, [self.id])
+            return TRN.execute_fetchlast()
+
     def grant_access(self):
         """Grants labmanager access to the user"""
         with sql_connection.TRN as TRN:
@@ -171,3 +266,5 @@ class User(base.LabmanObject):
                      WHERE email = %s"""
             TRN.add(sql, [self.id])
             TRN.execute()
+        # Close the cached sessions of the user
+        User._session_cache.pop(self.id, None)
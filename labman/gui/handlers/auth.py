@@ -6,19 +6,32 @@
 # The full license is in the file LICENSE, distributed with this software.
 # ----------------------------------------------------------------------------
 
+from concurrent.futures import ThreadPoolExecutor
+
+from tornado import gen
+from tornado.concurrent import run_on_executor
 from tornado.web import HTTPError, authenticated
 from tornado.escape import json_encode
 
 from labman.gui.handlers.base import BaseHandler
 from labman.db.user import User
 from labman.db.exceptions import (
-    LabmanUnknownIdError, LabmanLoginError, LabmanLoginDisabledError)
+    LabmanUnknownIdError, LabmanLoginDisabledError)
 
 
 class LoginHandler(BaseHandler):
+    # bcrypt is slow by design, so the passwords are checked in these threads
+    # to not block the requests of the other users while someone logs in
+    executor = ThreadPoolExecutor(max_workers=4)
+
     def get(self):
         self.redirect('/')
 
+    @run_on_executor
+    def _check_password(self, passwd, password_hash):
+        return User.check_password(passwd, password_hash)
+
+    @gen.coroutine
     def post(self):
         username = self.get_argument('username', '').strip().lower()
         passwd = self.get_argument('password', '')
@@ -26,13 +39,19 @@ class LoginHandler(BaseHandler):
         error_msg = ""
         user = None
         try:
-            user = User.login(username, passwd)
+            # The database is only accessed from the IOLoop thread
+            password_hash = User.get_password_hash(username)
         except LabmanUnknownIdError:
             error_msg = "Unknown user name"
-        except LabmanLoginError:
-            error_msg = "Incorrect password"
         except LabmanLoginDisabledError:
             error_msg = "User not allowed on this portal"
+        else:
+            password_ok = yield self._check_password(passwd, password_hash)
+            self.resume_statements()
+            if password_ok:
+                user = User(username)
+            else:
+                error_msg = "Incorrect password"
 
         if user:
             self.set_current_user(username)
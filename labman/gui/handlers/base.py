@@ -6,15 +6,104 @@
 # The full license is in the file LICENSE, distributed with this software.
 # ----------------------------------------------------------------------------
 
+from time import monotonic
 from traceback import format_exception
 
 from tornado.web import RequestHandler
+from tornado import gen
+from tornado.escape import json_encode, utf8
+from tornado.log import app_log
 
+from labman.db import metrics
+from labman.db.sql_connection import StatementRecorder, Transaction
 from labman.db.user import User
+from labman.gui.profiling import RequestProfiler
+
+
+REQUEST_DURATION = metrics.Histogram(
+    'labman_http_request_duration_seconds', 'Time spent serving the requests',
+    labels=('handler', 'method'))
+REQUESTS = metrics.Counter(
+    'labman_http_requests_total', 'Number of requests served',
+    labels=('handler', 'method', 'status'))
+RESPONSE_SIZE = metrics.Histogram(
+    'labman_http_response_size_bytes', 'Size of the response bodies',
+    labels=('handler', ), buckets=metrics.SIZE_BUCKETS)
+REQUEST_DB_STATEMENTS = metrics.Histogram(
+    'labman_http_request_db_statements',
+    'Number of SQL statements executed while serving a request',
+    labels=('handler', ), buckets=metrics.COUNT_BUCKETS)
+REQUEST_DB_DURATION = metrics.Histogram(
+    'labman_http_request_db_seconds',
+    'Time spent executing SQL statements while serving a request',
+    labels=('handler', ))
 
 
 class BaseHandler(RequestHandler):
-    """Base class for all labman's handlers"""
+    """Base class for all labman's handlers
+
+    The SQL statements executed while serving a request are recorded in its
+    metrics. Coroutine handlers must call `resume_statements` after each
+    yield, as the requests served in the meantime record their own statements
+    """
+    _start = None
+    _statements = None
+    _response_size = 0
+    _profiler = None
+
+    def prepare(self):
+        self._start = monotonic()
+        self._statements = StatementRecorder()
+        self.resume_statements()
+        # Administrators can profile a request adding ?__profile=1 or the
+        # X-Labman-Profile: 1 header, see labman.gui.profiling
+        if (self.get_query_argument('__profile', None) == '1' or
+                self.request.headers.get('X-Labman-Profile') == '1'):
+            user = self.current_user
+            if user is not None and user.is_admin:
+                self._profiler = RequestProfiler.start()
+
+    def resume_statements(self):
+        """Records the SQL statements executed from now on in this request"""
+        Transaction.recorder = self._statements
+
+    def clear(self):
+        super(BaseHandler, self).clear()
+        self._response_size = 0
+
+    def write(self, chunk):
+        super(BaseHandler, self).write(chunk)
+        # Count the bytes as the response would encode them
+        if isinstance(chunk, dict):
+            chunk = json_encode(chunk)
+        self._response_size += len(utf8(chunk))
+
+    def on_finish(self):
+        if Transaction.recorder is self._statements:
+            Transaction.recorder = None
+        if self._profiler is not None:
+            try:
+                self._profiler.stop(
+                    self.__class__.__name__, self.request.method,
+                    self.request.uri, self.current_user.id,
+                    self.get_status())
+            except Exception:
+                app_log.exception('Error storing the profile of %s',
+                                  self.request.uri)
+        if self._start is None:
+            # The request was rejected before reaching the handler
+            return
+        handler = self.__class__.__name__
+        method = self.request.method
+        REQUEST_DURATION.observe(monotonic() - self._start, handler=handler,
+                                 method=method)
+        REQUESTS.inc(handler=handler, method=method,
+                     status=str(self.get_status()))
+        RESPONSE_SIZE.observe(self._response_size, handler=handler)
+        REQUEST_DB_STATEMENTS.observe(self._statements.count,
+                                      handler=handler)
+        REQUEST_DB_DURATION.observe(self._statements.seconds,
+                                    handler=handler)
 
     def get_current_user(self):
         """Get the current connected user"""
@@ -22,10 +111,11 @@ class BaseHandler(RequestHandler):
         if username is not None:
             # strip off quotes added by get_secure_cookie and decode
             # becuase it is stored as character varying in the DB
-            return User(username.strip(b"\"' ").decode())
-        else:
-            self.clear_cookie("user")
-            return None
+            user = User.from_session(username.strip(b"\"' ").decode())
+            if user is not None:
+                return user
+        self.clear_cookie("user")
+        return None
 
     def write_error(self, status_code, **kwargs):
         """Tornado's error handling callback"""
@@ -57,12 +147,41 @@ class BaseHandler(RequestHandler):
         """Adds proper response for head requests"""
         self.finish()
 
+    @gen.coroutine
+    def write_lines(self, lines, lines_per_chunk=500):
+        """Streams the given lines to the client and finishes the request
+
+        Parameters
+        ----------
+        lines : iterable of str
+            The lines to write, without the line terminator
+        lines_per_chunk : int, optional
+            The number of lines to buffer before flushing them to the client.
+            Default: 500
+        """
+        buffered = 0
+        for i, line in enumerate(lines):
+            self.write(line if i == 0 else '\n' + line)
+            buffered += 1
+            if buffered == lines_per_chunk:
+                yield self.flush()
+                self.resume_statements()
+                buffered = 0
+        self.finish()
+
 
 class IndexHandler(BaseHandler):
     def get(self):
         self.render("index.html")
 
 
+class MetricsHandler(BaseHandler):
+    """Exposes the metrics of the process in the Prometheus text format"""
+    def get(self):
+        self.set_header('Content-Type', 'text/plain; version=0.0.4')
+        self.write(metrics.render())
+
+
 class NotFoundHandler(BaseHandler):
     """Handler for 404 errors"""
     def get(self):
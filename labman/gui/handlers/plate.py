@@ -6,8 +6,6 @@
 # The full license is in the file LICENSE, distributed with this software.
 # ----------------------------------------------------------------------------
 
-from itertools import chain
-
 from tornado.web import authenticated, HTTPError
 from tornado.escape import json_encode, json_decode
 
@@ -15,10 +13,9 @@ from labman.gui.handlers.base import BaseHandler
 from labman.db.exceptions import LabmanUnknownIdError
 from labman.db.plate import PlateConfiguration, Plate
 from labman.db.composition import SampleComposition
-from labman.db.container import Well
 from labman.db.process import (
-    SamplePlatingProcess, GDNAExtractionProcess, LibraryPrep16SProcess,
-    LibraryPrepShotgunProcess, NormalizationProcess,
+    Process, SamplePlatingProcess, GDNAExtractionProcess,
+    LibraryPrep16SProcess, LibraryPrepShotgunProcess, NormalizationProcess,
     GDNAPlateCompressionProcess)
 
 
@@ -56,12 +53,20 @@ class PlateSearchHandler(BaseHandler):
         well_comment_keywords = self.get_argument("well_comment_keywords")
         operation = self.get_argument("operation")
         sample_names = json_decode(self.get_argument('sample_names'))
+        limit = self.get_argument('limit', None)
+        offset = self.get_argument('offset', 0)
+
+        try:
+            limit = int(limit) if limit is not None else None
+            res = Plate.ranked_search(samples=sample_names,
+                                      plate_notes=plate_comment_keywords,
+                                      well_notes=well_comment_keywords,
+                                      query_type=operation, limit=limit,
+                                      offset=int(offset))
+        except ValueError as e:
+            raise HTTPError(400, str(e))
 
-        res = {"data": [[p.id, p.external_id]
-               for p in Plate.search(samples=sample_names,
-                                     plate_notes=plate_comment_keywords,
-                                     well_notes=well_comment_keywords,
-                                     query_type=operation)]}
+        res = {"data": [[p['plate_id'], p['external_id']] for p in res]}
 
         self.write(res)
 
@@ -174,46 +179,23 @@ class PlateHandler(BaseHandler):
     @authenticated
     def get(self, plate_id):
         plate = _get_plate(plate_id)
-        # sorting is done in plate.duplicates
-        duplicates = [
-            [sample_info[0].row, sample_info[0].column, sample_info[1]]
-            for sample_info in chain.from_iterable(plate.duplicates.values())]
-
-        # sorting of wells has to be done here as they are in a dictionary
-        previous_plates = []
-        prev_plated = plate.get_previously_plated_wells()
-        well_ids = sorted([w.id for w in prev_plated.keys()])
-        for curr_well_id in well_ids:
-            curr_well = Well(curr_well_id)
-            curr_plates = prev_plated[curr_well]
-            # plates are sorted in plate id order in
-            # get_previously_plated_wells
-            previous_plates.append([
-                [curr_well.row, curr_well.column],
-                [{'plate_id': p.id, 'plate_name': p.external_id} for p in
-                 curr_plates]])
-
-        # sorting is done in plate.unknown_samples
-        unknowns = [[well.row, well.column] for well in plate.unknown_samples]
-
-        # sorting is done in plate.quantification processes
-        quantitation_processes = [[q.id, q.personnel.name, q.date.strftime(
-            q.get_date_format()), q.notes] for q in
-                                  plate.quantification_processes]
-
-        plate_config = plate.plate_configuration
-        result = {'plate_id': plate.id,
-                  'plate_name': plate.external_id,
-                  'discarded': plate.discarded,
-                  'plate_configuration': [
-                        plate_config.id, plate_config.description,
-                        plate_config.num_rows, plate_config.num_columns],
-                  'notes': plate.notes,
-                  'process_notes': plate.process.notes,
-                  'studies': sorted(s.id for s in plate.studies),
-                  'duplicates': duplicates,
-                  'previous_plates': previous_plates,
-                  'unknowns': unknowns,
+        # All the sorting is done in plate.get_summary
+        summary = plate.get_summary()
+        quantitation_processes = [
+            [q_id, personnel, date.strftime(Process.get_date_format()), notes]
+            for q_id, personnel, date, notes
+            in summary['quantification_processes']]
+
+        result = {'plate_id': summary['plate_id'],
+                  'plate_name': summary['external_id'],
+                  'discarded': summary['discarded'],
+                  'plate_configuration': summary['plate_configuration'],
+                  'notes': summary['notes'],
+                  'process_notes': summary['process_notes'],
+                  'studies': summary['studies'],
+                  'duplicates': summary['duplicates'],
+                  'previous_plates': summary['previous_plates'],
+                  'unknowns': summary['unknowns'],
                   'quantitation_processes': quantitation_processes}
 
         self.write(result)
@@ -23,9 +23,9 @@ class PoolListHandler(BaseHandler):
     @authenticated
     def get(self):
         res = {"data": [
-            [p.id, p.container.external_id, p.is_plate_pool,
-             p.upstream_process.id, ]
-            for p in PoolComposition.get_pools()
+            [p['pool_composition_id'], p['external_id'], p['is_plate_pool'],
+             p['upstream_process_id']]
+            for p in PoolComposition.list_pools()
         ]}
         self.write(res)
 
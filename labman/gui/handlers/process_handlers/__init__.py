@@ -8,7 +8,9 @@
 
 from .sample_plating_process import (SamplePlatingProcessNotes,
                                      SamplePlatingProcessListHandler,
-                                     SamplePlatingProcessHandler)
+                                     SamplePlatingProcessHandler,
+                                     SamplePlatingProcessWellsHandler,
+                                     SamplePlatingProcessPlateMapHandler)
 from .gdna_extraction_process import GDNAExtractionProcessHandler
 from .gdna_compression_process import GDNAPlateCompressionProcessHandler
 from .library_prep_16s_process import LibraryPrep16SProcessHandler
@@ -19,7 +21,8 @@ from .quantification_process import (
     QuantificationViewHandler)
 from .pooling_process import (
     PoolPoolProcessHandler, LibraryPoolProcessHandler,
-    ComputeLibraryPoolValuesHandler, DownloadPoolFileHandler)
+    ComputeLibraryPoolValuesHandler, ComputeLibraryPoolSweepHandler,
+    DownloadPoolFileHandler)
 from .sequencing_process import (
     SequencingProcessHandler, DownloadSampleSheetHandler,
     DownloadPreparationSheetsHandler)
@@ -30,7 +33,8 @@ from .primer_working_plate_creation_process import (
 from .equipment_creation_process import EquipmentCreationProcessHandler
 
 __all__ = ['SamplePlatingProcessListHandler', 'SamplePlatingProcessHandler',
-           'SamplePlatingProcessNotes',
+           'SamplePlatingProcessNotes', 'SamplePlatingProcessWellsHandler',
+           'SamplePlatingProcessPlateMapHandler',
            'GDNAExtractionProcessHandler', 'LibraryPrep16SProcessHandler',
            'QuantificationProcessParseHandler', 'QuantificationProcessHandler',
            'QuantificationViewHandler',
@@ -40,11 +44,16 @@ __all__ = ['SamplePlatingProcessListHandler', 'SamplePlatingProcessHandler',
            'GDNAPlateCompressionProcessHandler',
            'PrimerWorkingPlateCreationProcessHandler',
            'EquipmentCreationProcessHandler',
-           'ComputeLibraryPoolValuesHandler', 'DownloadPoolFileHandler']
+           'ComputeLibraryPoolValuesHandler', 'ComputeLibraryPoolSweepHandler',
+           'DownloadPoolFileHandler']
 
 
 PROCESS_ENDPOINTS = [
     (r"/process/sample_plating/([0-9]+)$", SamplePlatingProcessHandler),
+    (r"/process/sample_plating/([0-9]+)/wells$",
+     SamplePlatingProcessWellsHandler),
+    (r"/process/sample_plating/([0-9]+)/plate_map$",
+     SamplePlatingProcessPlateMapHandler),
     (r"/process/sample_plating$", SamplePlatingProcessListHandler),
     (r"/process/sample_plating/notes$", SamplePlatingProcessNotes),
     (r"/process/gdna_extraction$", GDNAExtractionProcessHandler),
@@ -54,6 +63,7 @@ PROCESS_ENDPOINTS = [
     (r"/process/quantify$", QuantificationProcessHandler),
     (r"/process/view_quants/([0-9]+)$", QuantificationViewHandler),
     (r"/process/compute_pool$", ComputeLibraryPoolValuesHandler),
+    (r"/process/compute_pool/sweep$", ComputeLibraryPoolSweepHandler),
     (r"/process/poolpools$", PoolPoolProcessHandler),
     (r"/process/poollibraries$", LibraryPoolProcessHandler),
     (r"/process/poollibraries/([0-9]+)/pool_file$", DownloadPoolFileHandler),
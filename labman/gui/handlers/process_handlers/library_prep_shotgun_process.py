@@ -6,6 +6,9 @@
 # The full license is in the file LICENSE, distributed with this software.
 # ----------------------------------------------------------------------------
 
+from itertools import chain
+
+from tornado import gen
 from tornado.web import authenticated, HTTPError
 from tornado.escape import json_decode
 
@@ -67,14 +70,21 @@ class LibraryPrepShotgunProcessHandler(BaseHandler):
 
 class DownloadLibraryPrepShotgunProcessHandler(BaseHandler):
     @authenticated
+    @gen.coroutine
     def get(self, process_id):
-        process = LibraryPrepShotgunProcess(int(process_id))
-        text = process.generate_echo_picklist()
+        try:
+            process = LibraryPrepShotgunProcess(int(process_id))
+        except LabmanUnknownIdError:
+            raise HTTPError(404, reason='Shotgun library prep process %s '
+                                        'does not exist' % process_id)
+        lines = process.iter_echo_picklist()
+        # Retrieve the header before sending any response header so errors
+        # generating the pick list are still reported to the user
+        first_line = next(lines)
 
         self.set_header('Content-Type', 'text/csv')
         self.set_header('Expires', '0')
         self.set_header('Cache-Control', 'no-cache')
         self.set_header('Content-Disposition', 'attachment; filename='
                         'LibraryPrepShotgunSheet_%s.csv' % process_id)
-        self.write(text)
-        self.finish()
+        yield self.write_lines(chain([first_line], lines))
@@ -8,10 +8,11 @@
 
 import re
 from datetime import datetime
+from itertools import chain
 
 from tornado.web import authenticated, HTTPError
+from tornado import gen
 from tornado.escape import json_decode, json_encode
-import numpy as np
 
 from labman.gui.handlers.base import BaseHandler
 from labman.db.process import PoolingProcess, QuantificationProcess
@@ -22,6 +23,8 @@ from labman.db.composition import (PoolComposition, LibraryPrep16SComposition,
 from labman.db.exceptions import LabmanUnknownIdError
 
 
+# 'sweep' lists the parameters that can be compared in the pooling preview,
+# see ComputeLibraryPoolSweepHandler
 POOL_FUNCS = {
     'equal': {'function': PoolingProcess.compute_pooling_values_eqvol,
               'parameters': [('total_vol', 'volume-'),
@@ -29,7 +32,8 @@ POOL_FUNCS = {
                              ('robot', 'robot-'),
                              ('destination', 'dest-tube-'),
                              ('blank_vol', 'blank-vol-'),
-                             ('blank_num', 'blank-number-')]},
+                             ('blank_num', 'blank-number-')],
+              'sweep': ['total_vol']},
     'min': {'function': PoolingProcess.compute_pooling_values_minvol,
             'parameters': [('floor_vol', 'floor-vol-'),
                            ('floor_conc', 'floor-conc-'),
@@ -38,7 +42,8 @@ POOL_FUNCS = {
                            ('robot', 'robot-'),
                            ('destination', 'dest-tube-'),
                            ('blank_vol', 'blank-vol-'),
-                           ('blank_num', 'blank-number-')]}}
+                           ('blank_num', 'blank-number-')],
+            'sweep': ['floor_vol', 'floor_conc', 'total']}}
 
 HTML_POOL_PARAMS_SHOTGUN = {
     'min': [{'prefix': 'floor-vol-', 'value': '100',
@@ -132,6 +137,8 @@ def make_2D_arrays(plate, quant_process):
         each well is a blank, and an array of str with the name of the sample
         in each well.
     """
+    import numpy as np
+
     layout = plate.layout
     raw_concs = np.zeros_like(layout, dtype=float)
     comp_concs = np.zeros_like(layout, dtype=float)
@@ -183,7 +190,26 @@ def calc_pool_pcts(conc_vals, pool_vols):
 
 
 class BasePoolHandler(BaseHandler):
-    def _compute_pools(self, plate_info):
+    def _compute_pools(self, plate_info, sweep=None):
+        """Computes the pooling values of a plate
+
+        Parameters
+        ----------
+        plate_info : dict
+            The pooling parameters of the plate, as sent by the interface
+        sweep : (str, list of float), optional
+            The name of a pooling parameter and the values to compute the
+            pools with, instead of the single value in `plate_info`
+
+        Returns
+        -------
+        dict
+            The pooling values. When sweeping a parameter, 'pool_vals',
+            'total_conc' and 'total_vol' have a leading axis with one entry
+            per swept value
+        """
+        import numpy as np
+
         plate_id = plate_info['plate-id']
         func_name = plate_info['pool-func']
         plate_type = plate_info['plate-type']
@@ -221,26 +247,39 @@ class BasePoolHandler(BaseHandler):
             # constant accounts for both concentrations (ng/uL) and volumes
             # (uL) in the same unit
             params['vol_constant'] = 1
-            pool_vals = function(raw_concs, **params)
+            concs = raw_concs
         if plate_type == 'shotgun library prep':
             # for shotgun, we calculate to a target total pool size
             params['total_each'] = False
             # constant handles volumes in nanoliters and concentrations in
             # molarity (mol / L)
             params['vol_constant'] = 10**9
-            pool_vals = function(comp_concs, **params)
+            concs = comp_concs
+
+        if sweep is None:
+            pool_vals = function(concs, **params)
+            blanks, blank_concs = comp_blanks, raw_concs
+        else:
+            # The swept values are stacked on a leading axis, the blanks are
+            # selected for each value as if it was a separate plate
+            parameter, values = sweep
+            kwargs = {k: v for k, v in params.items() if k != parameter}
+            pool_vals, _, _ = PoolingProcess.compute_pooling_values_sweep(
+                function, concs, parameter, values, **kwargs)
+            blanks = np.broadcast_to(comp_blanks, pool_vals.shape)
+            blank_concs = np.broadcast_to(raw_concs, pool_vals.shape)
 
         # if adjust blank volume, do that
         if params['blank_vol'] != '':
             pool_vals = PoolingProcess.adjust_blank_vols(pool_vals,
-                                                         comp_blanks,
+                                                         blanks,
                                                          params['blank_vol'])
 
         # if only pool some blanks, do that
         if params['blank_num'] != '':
             pool_vals = PoolingProcess.select_blanks(pool_vals,
-                                                     raw_concs,
-                                                     comp_blanks,
+                                                     blank_concs,
+                                                     blanks,
                                                      int(params['blank_num']))
 
         # estimate pool volume and concentration
@@ -354,8 +393,15 @@ class LibraryPoolProcessHandler(BasePoolHandler):
         robots = (Equipment.list_equipment('EpMotion') +
                   Equipment.list_equipment('echo'))
 
+        # The prefixes of the parameters that can be compared per function
+        pool_sweep_params = {
+            name: [pfx for arg, pfx in info['parameters']
+                   if arg in info['sweep']]
+            for name, info in POOL_FUNCS.items()}
+
         self.render('library_pooling.html', plate_ids=plate_ids,
                     robots=robots, pool_params=HTML_POOL_PARAMS,
+                    pool_sweep_params=json_encode(pool_sweep_params),
                     input_plate=input_plate, pool_func_data=pool_func_data,
                     process_id=process_id, pool_values=pool_values,
                     plate_type=plate_type, pool_blanks=pool_blanks,
@@ -415,15 +461,53 @@ class ComputeLibraryPoolValuesHandler(BasePoolHandler):
         self.write(output)
 
 
+# The ComputeLibraryPoolSweepHandler computes the pool of a plate for several
+# values of one pooling parameter, so the user can compare them before
+# choosing the value to pool with.
+class ComputeLibraryPoolSweepHandler(BasePoolHandler):
+    @authenticated
+    def post(self):
+        plate_info = json_decode(self.get_argument('plate-info'))
+        prefix = self.get_argument('parameter')
+        try:
+            values = [float(v) for v in
+                      json_decode(self.get_argument('values'))]
+        except (TypeError, ValueError):
+            raise HTTPError(400, reason='The values to compare must be a '
+                                        'list of numbers')
+        if not values:
+            raise HTTPError(400, reason='No values to compare')
+
+        func_info = POOL_FUNCS.get(plate_info.get('pool-func'))
+        if func_info is None:
+            raise HTTPError(400, reason='Unknown pooling function %s'
+                                        % plate_info.get('pool-func'))
+        parameter = {pfx: arg for arg, pfx in func_info['parameters']}.get(
+            prefix)
+        if parameter not in func_info['sweep']:
+            raise HTTPError(400, reason="Parameter %s can't be compared"
+                                        % prefix)
+
+        output = self._compute_pools(plate_info, sweep=(parameter, values))
+        self.write({'plate_id': output['plate_id'], 'parameter': prefix,
+                    'values': values,
+                    'total_conc': output['total_conc'].tolist(),
+                    'total_vol': output['total_vol'].tolist()})
+
+
 class DownloadPoolFileHandler(BaseHandler):
     @authenticated
+    @gen.coroutine
     def get(self, process_id):
         try:
             process = PoolingProcess(int(process_id))
         except LabmanUnknownIdError:
             raise HTTPError(404, reason='PoolingProcess %s does not exist'
                             % process_id)
-        text = process.generate_pool_file()
+        lines = process.iter_pool_file()
+        # Retrieve the header before sending any response header so errors
+        # generating the file are still reported to the user
+        first_line = next(lines)
 
         filename = 'PoolFile_%s_%s.csv' % (
             re.sub('[^0-9a-zA-Z\-\_]+', '_',
@@ -434,5 +518,4 @@ class DownloadPoolFileHandler(BaseHandler):
         self.set_header('Cache-Control', 'no-cache')
         self.set_header('Content-Disposition', 'attachment; filename='
                         '%s' % filename)
-        self.write(text)
-        self.finish()
+        yield self.write_lines(chain([first_line], lines))
@@ -9,8 +9,6 @@
 from tornado.web import authenticated
 from tornado.escape import json_decode
 
-import numpy as np
-
 from labman.gui.handlers.base import BaseHandler
 from labman.db.plate import Plate
 from labman.db.process import QuantificationProcess
@@ -31,6 +29,8 @@ class QuantificationProcessParseHandler(BaseHandler):
         # The key of the self.request.files dictionary is of the form
         # plate-file-<PLATE_ID> so use the keys to know the plates
         # that we need to quantify
+        import numpy as np
+
         plates = []
         for key in self.request.files:
             plate_id = key.rsplit('-', 1)[1]
@@ -86,6 +86,8 @@ class QuantificationProcessParseHandler(BaseHandler):
 class QuantificationProcessHandler(BaseHandler):
     @authenticated
     def post(self):
+        import numpy as np
+
         plates_info = json_decode(self.get_argument('plates-info'))
         processes = []
         for pinfo in plates_info:
@@ -101,6 +103,7 @@ class QuantificationProcessHandler(BaseHandler):
 class QuantificationViewHandler(BaseHandler):
     @authenticated
     def get(self, plate_id):
+        import numpy as np
 
         plate = Plate(plate_id)
         quant_processes = plate.quantification_processes
@@ -6,10 +6,15 @@
 # The full license is in the file LICENSE, distributed with this software.
 # ----------------------------------------------------------------------------
 
+from itertools import chain
+
 from tornado.web import authenticated, HTTPError
+from tornado.escape import json_decode, json_encode
+from tornado import gen
 
 from labman.gui.handlers.base import BaseHandler
 from labman.db.process import SamplePlatingProcess
+from labman.db.exceptions import LabmanError
 from labman.db.plate import PlateConfiguration, Plate
 
 
@@ -64,46 +69,154 @@ def sample_plating_process_handler_patch_request(
         400: If req_op is not a supported operation
         400: If req_path is incorrect
     """
-    if req_op == 'replace':
-        req_path = [v for v in req_path.split('/') if v]
-        if len(req_path) != 4:
-            raise HTTPError(400, 'Incorrect path parameter')
-        attribute = req_path[0]
-
-        if attribute == 'well':
-            row = req_path[1]
-            col = req_path[2]
-            well_attribute = req_path[3]
-            if well_attribute == 'sample':
-                if req_value is None or not req_value.strip():
-                    raise HTTPError(
-                        400, 'A new value for the well should be provided')
-                plates = Plate.search(samples=[req_value])
-                process = SamplePlatingProcess(process_id)
-                plates = set(plates) - {process.plate}
-                prev_plates = [{'plate_id': p.id, 'plate_name': p.external_id}
-                               for p in plates]
-                content, sample_ok = process.update_well(row, col, req_value)
-                return {'sample_id': content, 'previous_plates': prev_plates,
-                        'sample_ok': sample_ok}
-            elif well_attribute == 'notes':
-                if req_value is not None:
-                    # If the user provides an empty string, just store None
-                    # in the database
-                    req_value = (req_value.strip()
-                                 if req_value.strip() else None)
-                SamplePlatingProcess(process_id).comment_well(
-                    row, col, req_value)
-                return {'comment': req_value}
-            else:
-                raise HTTPError(
-                    404, 'Well attribute %s not found' % well_attribute)
-        else:
-            raise HTTPError(404, 'Attribute %s not found' % attribute)
-
+    row, col, well_attribute, req_value = _parse_well_operation(
+        req_op, req_path, req_value)
+    process = SamplePlatingProcess(process_id)
+    if well_attribute == 'sample':
+        plates = Plate.search(samples=[req_value])
+        plates = set(plates) - {process.plate}
+        prev_plates = [{'plate_id': p.id, 'plate_name': p.external_id}
+                       for p in plates]
+        content, sample_ok = process.update_well(row, col, req_value)
+        return {'sample_id': content, 'previous_plates': prev_plates,
+                'sample_ok': sample_ok}
     else:
+        process.comment_well(row, col, req_value)
+        return {'comment': req_value}
+
+
+def _parse_well_operation(req_op, req_path, req_value):
+    """Validates a JSON PATCH operation over a well of the plate
+
+    Parameters
+    ----------
+    req_op: string
+        JSON PATCH op parameter
+    req_path: string
+        JSON PATCH path parameter
+    req_value: string
+        JSON PATCH value parameter
+
+    Returns
+    -------
+    (str, str, str, str)
+        The row, column and attribute of the well and the new value
+
+    Raises
+    ------
+    HTTPError
+        400: If req_op is not a supported operation
+        400: If req_path is incorrect
+        400: If no sample is provided
+        404: If the attribute is not found
+    """
+    if req_op != 'replace':
         raise HTTPError(400, 'Operation %s not supported. Current supported '
                              'operations: replace' % req_op)
+    req_path = [v for v in (req_path or '').split('/') if v]
+    if len(req_path) != 4:
+        raise HTTPError(400, 'Incorrect path parameter')
+    attribute, row, col, well_attribute = req_path
+    if attribute != 'well':
+        raise HTTPError(404, 'Attribute %s not found' % attribute)
+
+    if well_attribute == 'sample':
+        if req_value is None or not req_value.strip():
+            raise HTTPError(
+                400, 'A new value for the well should be provided')
+    elif well_attribute == 'notes':
+        if req_value is not None:
+            # If the user provides an empty string, just store None
+            # in the database
+            req_value = req_value.strip() if req_value.strip() else None
+    else:
+        raise HTTPError(404, 'Well attribute %s not found' % well_attribute)
+
+    return row, col, well_attribute, req_value
+
+
+def sample_plating_process_handler_bulk_patch_request(
+        user, process_id, operations):
+    """Performs multiple patch operations on the sample plating process
+
+    Each operation is validated on its own: the invalid operations are
+    reported in their result and the valid ones are applied in a single
+    transaction.
+
+    Parameters
+    ----------
+    user: labman.db.user.User
+        User performing the request
+    process_id: int
+        The SamplePlatingProcess to apply the patch operations
+    operations: list of dict
+        The JSON PATCH operations, each with 'op', 'path' and 'value' keys
+
+    Returns
+    -------
+    list of dict
+        The result of each patch operation, in the same order. The result of
+        an invalid operation is {'error': str}
+
+    Raises
+    ------
+    HTTPError
+        400: If operations is not a list of JSON PATCH operations
+    """
+    if not isinstance(operations, list) or not all(
+            isinstance(op, dict) for op in operations):
+        raise HTTPError(400, 'A list of JSON PATCH operations is required')
+
+    process = SamplePlatingProcess(process_id)
+    plate = process.plate
+    plate_config = plate.plate_configuration
+    num_rows, num_cols = plate_config.num_rows, plate_config.num_columns
+
+    results = [None] * len(operations)
+    parsed = []
+    for idx, op in enumerate(operations):
+        try:
+            row, col, attr, value = _parse_well_operation(
+                op.get('op'), op.get('path'), op.get('value'))
+        except HTTPError as e:
+            results[idx] = {'error': e.log_message}
+            continue
+        try:
+            row, col = int(row), int(col)
+        except ValueError:
+            results[idx] = {'error': 'Incorrect path parameter'}
+            continue
+        if not (1 <= row <= num_rows and 1 <= col <= num_cols):
+            results[idx] = {'error': "Well (%s, %s) doesn't exist in plate "
+                                     "%s" % (row, col, plate.id)}
+            continue
+        parsed.append((idx, row, col, attr, value))
+
+    assignments = [(row, col, value) for _, row, col, attr, value in parsed
+                   if attr == 'sample']
+    comments = [(row, col, value) for _, row, col, attr, value in parsed
+                if attr == 'notes']
+
+    # Retrieve the previous plates before updating the wells, so the
+    # samples plated by this request are not reported
+    plates = Plate.get_plates_by_samples(v for _, _, v in assignments)
+    prev_plates = {
+        sample: [{'plate_id': p.id, 'plate_name': p.external_id}
+                 for p in sample_plates if p != plate]
+        for sample, sample_plates in plates.items()}
+
+    updated = iter(process.update_wells(assignments, comments)
+                   if parsed else [])
+
+    for idx, _, _, attr, value in parsed:
+        if attr == 'sample':
+            content, sample_ok = next(updated)
+            results[idx] = {'sample_id': content,
+                            'previous_plates': prev_plates.get(value, []),
+                            'sample_ok': sample_ok}
+        else:
+            results[idx] = {'comment': value}
+    return results
 
 
 class SamplePlatingProcessHandler(BaseHandler):
@@ -119,3 +232,54 @@ class SamplePlatingProcessHandler(BaseHandler):
             req_value, req_from)
         self.write(res)
         self.finish()
+
+
+class SamplePlatingProcessWellsHandler(BaseHandler):
+    @authenticated
+    def patch(self, process_id):
+        try:
+            operations = json_decode(self.request.body)
+        except ValueError:
+            raise HTTPError(400, 'The body should be a JSON PATCH document')
+
+        res = sample_plating_process_handler_bulk_patch_request(
+            self.current_user, process_id, operations)
+        self.set_header('Content-Type', 'application/json')
+        self.write(json_encode(res))
+        self.finish()
+
+
+class SamplePlatingProcessPlateMapHandler(BaseHandler):
+    @authenticated
+    @gen.coroutine
+    def post(self, process_id):
+        # The plate map can be uploaded as a file or sent as the request body
+        if self.request.files:
+            contents = list(self.request.files.values())[0][0]['body']
+        else:
+            contents = self.request.body
+        try:
+            plate_map = SamplePlatingProcess.parse_plate_map(
+                contents.decode('utf-8-sig'))
+        except (UnicodeDecodeError, ValueError) as e:
+            raise HTTPError(400, str(e))
+
+        process = SamplePlatingProcess(process_id)
+        errors = process.iter_plate_map_errors(plate_map)
+        first_error = next(errors, None)
+        if first_error is not None:
+            # Stream all the validation errors back, one per line
+            self.set_status(400)
+            self.set_header('Content-Type', 'text/plain')
+            yield self.write_lines(chain([first_error], errors))
+            return
+
+        try:
+            res = process.import_plate_map(plate_map)
+        except LabmanError as e:
+            raise HTTPError(400, str(e))
+        self.set_header('Content-Type', 'application/json')
+        self.write(json_encode([{'well': well, 'sample_id': content,
+                                 'sample_ok': sample_ok}
+                                for well, content, sample_ok in res]))
+        self.finish()
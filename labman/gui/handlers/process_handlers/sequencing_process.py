@@ -9,10 +9,9 @@
 import re
 import zipfile
 
-from io import BytesIO
-
 from tornado.web import authenticated
 from tornado.escape import json_decode
+from tornado import gen
 
 from labman.gui.handlers.base import BaseHandler
 from labman.db.user import User
@@ -71,29 +70,51 @@ class DownloadSampleSheetHandler(BaseHandler):
         self.finish()
 
 
+class _ResponseWriter(object):
+    """Write-only file object that sends the data written to the response
+
+    Parameters
+    ----------
+    handler : tornado.web.RequestHandler
+        The handler whose response receives the data
+    """
+    def __init__(self, handler):
+        self._handler = handler
+
+    def write(self, data):
+        self._handler.write(bytes(data))
+        return len(data)
+
+    def flush(self):
+        # The data is flushed to the client by the handler
+        pass
+
+
 class DownloadPreparationSheetsHandler(BaseHandler):
     @authenticated
+    @gen.coroutine
     def get(self, process_id):
         process = SequencingProcess(int(process_id))
 
-        with BytesIO() as content:
+        zip_name = (re.sub('[^0-9a-zA-Z\-\_]+', '_', process.run_name) +
+                    '_PrepSheets.zip')
 
-            with zipfile.ZipFile(content, mode='w',
-                                 compression=zipfile.ZIP_DEFLATED) as zf:
-                for study, prep in process.generate_prep_information().items():
-                    name = 'PrepSheet_process_%s_study_%s.csv' % (process.id,
-                                                                  study.id)
-                    zf.writestr(name, prep)
-
-            zip_name = (re.sub('[^0-9a-zA-Z\-\_]+', '_', process.run_name) +
-                        '_PrepSheets.zip')
-
-            self.set_header('Content-Type', 'application/zip')
-            self.set_header('Expires', '0')
-            self.set_header('Cache-Control', 'no-cache')
-            self.set_header("Content-Disposition", "attachment; filename=%s" %
-                            zip_name)
-
-            self.write(content.getvalue())
+        self.set_header('Content-Type', 'application/zip')
+        self.set_header('Expires', '0')
+        self.set_header('Cache-Control', 'no-cache')
+        self.set_header("Content-Disposition", "attachment; filename=%s" %
+                        zip_name)
+
+        # The zip file is written straight to the response as the prep
+        # information of each study is streamed from the database, so only
+        # the prep information of one study is kept in memory at a time
+        with zipfile.ZipFile(_ResponseWriter(self), mode='w',
+                             compression=zipfile.ZIP_DEFLATED) as zf:
+            for study, lines in process.iter_prep_information():
+                name = 'PrepSheet_process_%s_study_%s.csv' % (process.id,
+                                                              study.id)
+                zf.writestr(name, ''.join(lines))
+                yield self.flush()
+                self.resume_statements()
 
         self.finish()
@@ -159,6 +159,43 @@ class TestPoolingProcessHandlers(TestHandlerBase):
         response = self.post('/process/compute_pool', data)
         self.assertEqual(response.code, 400)
 
+    def test_post_compute_library_pool_sweep_handler(self):
+        plate_info = {
+            'plate-id': 23, 'pool-func': 'min',
+            'plate-type': '16S library prep',
+            'total-23': 240, 'floor-vol-23': 2, 'floor-conc-23': 16,
+            'lib-size-23': 500, 'robot-23': 10, 'dest-tube-23': 1,
+            'blank-vol-23': 5, 'blank-number-23': 2,
+            'quant-process-id': 1}
+        data = {'plate-info': json_encode(plate_info),
+                'parameter': 'floor-conc-', 'values': json_encode([10, 16])}
+        response = self.post('/process/compute_pool/sweep', data)
+        self.assertEqual(response.code, 200)
+        obs = json_decode(response.body)
+        self.assertEqual(obs['plate_id'], 23)
+        self.assertEqual(obs['parameter'], 'floor-conc-')
+        self.assertEqual(obs['values'], [10, 16])
+        self.assertEqual(len(obs['total_conc']), 2)
+        self.assertEqual(len(obs['total_vol']), 2)
+
+        # The swept value gives the same pool as computing it on its own
+        response = self.post('/process/compute_pool',
+                             {'plate-info': json_encode(plate_info)})
+        exp = json_decode(response.body)
+        self.assertAlmostEqual(obs['total_conc'][1], exp['total_conc'])
+        self.assertAlmostEqual(obs['total_vol'][1], exp['total_vol'])
+
+        # Parameter that can't be compared
+        data['parameter'] = 'lib-size-'
+        response = self.post('/process/compute_pool/sweep', data)
+        self.assertEqual(response.code, 400)
+
+        # No values
+        data['parameter'] = 'floor-conc-'
+        data['values'] = json_encode([])
+        response = self.post('/process/compute_pool/sweep', data)
+        self.assertEqual(response.code, 400)
+
     def test_get_download_pool_file_handler(self):
         response = self.get("/process/poollibraries/1/pool_file")
         self.assertNotEqual(response.body, '')
@@ -9,13 +9,15 @@
 from unittest import main
 
 from tornado.web import HTTPError
-from tornado.escape import json_decode
+from tornado.escape import json_decode, json_encode
 
 from labman.db.user import User
 from labman.db.composition import SampleComposition
+from labman.db.plate import Plate
 from labman.gui.testing import TestHandlerBase
 from labman.gui.handlers.process_handlers.sample_plating_process import (
-    sample_plating_process_handler_patch_request)
+    sample_plating_process_handler_patch_request,
+    sample_plating_process_handler_bulk_patch_request)
 
 
 class TestUtils(TestHandlerBase):
@@ -106,6 +108,80 @@ class TestUtils(TestHandlerBase):
             user, 10, 'replace', '/well/8/1/notes', '  ', None)
         self.assertIsNone(tester.notes)
 
+    def test_sample_plating_process_handler_bulk_patch_request(self):
+        user = User('test@foo.bar')
+        tester = SampleComposition(8)
+
+        regex = 'A list of JSON PATCH operations is required'
+        with self.assertRaisesRegex(HTTPError, regex):
+            sample_plating_process_handler_bulk_patch_request(
+                user, 10, {'op': 'replace'})
+
+        # Each operation is validated on its own
+        obs = sample_plating_process_handler_bulk_patch_request(
+            user, 10, [{'op': 'add', 'path': '/well/8/1/sample',
+                        'value': '1.SKM8.640201'},
+                       {'op': 'replace', 'path': '/well/9/1/sample',
+                        'value': '1.SKM8.640201'},
+                       {'op': 'replace', 'path': '/well/a/1/sample',
+                        'value': '1.SKM8.640201'}])
+        self.assertEqual(len(obs), 3)
+        self.assertRegex(obs[0]['error'], 'Operation add not supported')
+        self.assertEqual(obs[1], {'error': "Well (9, 1) doesn't exist in "
+                                           "plate 21"})
+        self.assertEqual(obs[2], {'error': 'Incorrect path parameter'})
+        self.assertEqual(tester.content, 'blank.21.H1')
+
+        # The valid operations are applied even if others are invalid, e.g.
+        # when undoing a paste into empty wells
+        plate = Plate(21)
+        tester2 = plate.get_well(8, 2).composition
+        tester3 = plate.get_well(8, 3).composition
+        exp_content2 = tester2.content
+        obs = sample_plating_process_handler_bulk_patch_request(
+            user, 10, [{'op': 'replace', 'path': '/well/8/1/sample',
+                        'value': '1.SKM8.640201'},
+                       {'op': 'replace', 'path': '/well/8/2/sample',
+                        'value': ''},
+                       {'op': 'replace', 'path': '/well/8/3/sample',
+                        'value': '1.SKB1.640202'},
+                       {'op': 'replace', 'path': '/well/9/1/notes',
+                        'value': 'Outside'}])
+        self.assertEqual(obs[0], {'sample_id': '1.SKM8.640201',
+                                  'previous_plates': [],
+                                  'sample_ok': True})
+        self.assertEqual(
+            obs[1], {'error': 'A new value for the well should be provided'})
+        self.assertEqual(obs[2]['sample_id'], tester3.content)
+        self.assertTrue(obs[2]['sample_ok'])
+        self.assertEqual(tester3.sample_id, '1.SKB1.640202')
+        self.assertEqual(obs[3], {'error': "Well (9, 1) doesn't exist in "
+                                           "plate 21"})
+        self.assertEqual(tester.content, '1.SKM8.640201')
+        self.assertEqual(tester2.content, exp_content2)
+
+        # Test success
+        obs = sample_plating_process_handler_bulk_patch_request(
+            user, 10, [{'op': 'replace', 'path': '/well/8/1/sample',
+                        'value': '1.SKB1.640202'},
+                       {'op': 'replace', 'path': '/well/8/1/notes',
+                        'value': '  New Notes '},
+                       {'op': 'replace', 'path': '/well/8/1/sample',
+                        'value': '1.SKM8.640201'}])
+        self.assertEqual(tester.sample_id, '1.SKM8.640201')
+        self.assertEqual(tester.content, '1.SKM8.640201')
+        self.assertEqual(tester.notes, 'New Notes')
+        exp_prev = [{'plate_id': 27, 'plate_name': 'Test plate 2'},
+                    {'plate_id': 30, 'plate_name': 'Test plate 3'},
+                    {'plate_id': 33, 'plate_name': 'Test plate 4'}]
+        self.assertEqual(obs, [{'sample_id': '1.SKB1.640202.21.H1',
+                                'previous_plates': exp_prev,
+                                'sample_ok': True},
+                               {'comment': 'New Notes'},
+                               {'sample_id': '1.SKM8.640201',
+                                'previous_plates': [],
+                                'sample_ok': True}])
+
 
 class TestSamplePlatingProcessHandlers(TestHandlerBase):
     def test_post_sample_plating_process_notes(self):
@@ -145,6 +221,53 @@ class TestSamplePlatingProcessHandlers(TestHandlerBase):
                           'previous_plates': [],
                           'sample_ok': True})
 
+    def test_patch_sample_plating_process_wells_handler(self):
+        obs = SampleComposition(8)
+        data = [{'op': 'replace', 'path': '/well/8/1/sample',
+                 'value': '1.SKM8.640201'},
+                {'op': 'replace', 'path': '/well/8/1/notes',
+                 'value': 'Pasted'}]
+        headers = {'Content-Type': 'application/json-patch+json'}
+        response = self._fetch('/process/sample_plating/10/wells', 'PATCH',
+                               data=json_encode(data), headers=headers)
+        self.assertEqual(response.code, 200)
+        self.assertEqual(obs.sample_id, '1.SKM8.640201')
+        self.assertEqual(obs.notes, 'Pasted')
+        self.assertEqual(json_decode(response.body),
+                         [{'sample_id': '1.SKM8.640201',
+                           'previous_plates': [],
+                           'sample_ok': True},
+                          {'comment': 'Pasted'}])
+
+        response = self._fetch('/process/sample_plating/10/wells', 'PATCH',
+                               data='not json', headers=headers)
+        self.assertEqual(response.code, 400)
+
+    def test_post_sample_plating_process_plate_map_handler(self):
+        obs = SampleComposition(8)
+        url = '/process/sample_plating/10/plate_map'
+
+        # Validation errors are returned one per line
+        response = self._fetch(url, 'POST',
+                               data='well,sample\nI1,blank\nH1,Unknown\n')
+        self.assertEqual(response.code, 400)
+        self.assertEqual(
+            response.body.decode('utf-8').split('\n'),
+            ['Line 2: well I1 is outside of the plate',
+             'Line 3: sample Unknown is not a known sample or control'])
+        self.assertEqual(obs.content, 'blank.21.H1')
+
+        response = self._fetch(url, 'POST', data='sample\nblank\n')
+        self.assertEqual(response.code, 400)
+
+        response = self._fetch(url, 'POST',
+                               data='well\tsample\nH1\t1.SKM8.640201\n')
+        self.assertEqual(response.code, 200)
+        self.assertEqual(json_decode(response.body),
+                         [{'well': 'H1', 'sample_id': '1.SKM8.640201',
+                           'sample_ok': True}])
+        self.assertEqual(obs.sample_id, '1.SKM8.640201')
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,37 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2017-, labman development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from tornado.web import authenticated, HTTPError
+
+from labman.gui.handlers.base import BaseHandler
+from labman.gui.profiling import list_profiles, load_profile
+
+
+def _check_admin(handler):
+    if not handler.current_user.is_admin:
+        raise HTTPError(403, reason='Only administrators can see the '
+                                    'request profiles')
+
+
+class ProfileListHandler(BaseHandler):
+    @authenticated
+    def get(self):
+        _check_admin(self)
+        self.render('profile_list.html', profiles=list_profiles())
+
+
+class ProfileHandler(BaseHandler):
+    @authenticated
+    def get(self, profile_id):
+        _check_admin(self)
+        try:
+            info, report = load_profile(profile_id)
+        except ValueError:
+            raise HTTPError(404, reason='Profile %s does not exist'
+                                        % profile_id)
+        self.render('profile.html', profile=info, report=report)
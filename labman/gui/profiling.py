@@ -0,0 +1,196 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2017-, labman development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+# ----------------------------------------------------------------------------
+
+"""On-demand profiling of single requests
+
+The profiles are stored in the `profiles` folder of the log directory. Each
+profile has a `<profile_id>.prof` file with the cProfile statistics and a
+`<profile_id>.json` file with the request information and the SQL statements
+executed while serving it.
+"""
+
+import re
+import json
+from cProfile import Profile
+from datetime import datetime
+from io import StringIO
+from os import getpid, listdir, makedirs, remove
+from os.path import join, exists
+from pstats import Stats
+from time import monotonic
+
+from labman.db.settings import labman_settings
+from labman.db.sql_connection import Transaction
+
+
+# Number of profiles kept, the oldest ones are removed
+MAX_PROFILES = 50
+
+_PROFILE_ID_RE = re.compile(r'^[0-9]+_[A-Za-z0-9_]+$')
+
+
+def get_profiles_dir():
+    """Returns the folder where the profiles are stored"""
+    return join(labman_settings.log_dir, 'profiles')
+
+
+class RequestProfiler(object):
+    """Profiles a request, including the SQL statements it executes
+
+    Only one request is profiled at a time. Requests served concurrently in
+    the IOLoop while profiling are included in the profile
+    """
+    _active = False
+
+    def __init__(self):
+        self._profiler = Profile()
+        self._statements = []
+        self._start = None
+
+    @classmethod
+    def start(cls):
+        """Starts profiling
+
+        Returns
+        -------
+        RequestProfiler or None
+            The profiler, or None if another request is being profiled
+        """
+        if cls._active:
+            return None
+        cls._active = True
+        profiler = cls()
+        Transaction.captured_statements = profiler._statements
+        profiler._start = monotonic()
+        profiler._profiler.enable()
+        return profiler
+
+    def stop(self, handler, method, uri, user, status):
+        """Stops profiling and stores the profile
+
+        Parameters
+        ----------
+        handler : str
+            The name of the handler class
+        method : str
+            The HTTP method of the request
+        uri : str
+            The URI of the request
+        user : str
+            The email of the user that made the request
+        status : int
+            The HTTP status of the response
+
+        Returns
+        -------
+        str
+            The id of the stored profile
+        """
+        self._profiler.disable()
+        duration = monotonic() - self._start
+        Transaction.captured_statements = None
+        RequestProfiler._active = False
+
+        now = datetime.now()
+        profile_id = '%s_%s_%d' % (now.strftime('%Y%m%d%H%M%S%f'), handler,
+                                   getpid())
+        profiles_dir = get_profiles_dir()
+        if not exists(profiles_dir):
+            makedirs(profiles_dir)
+
+        self._profiler.dump_stats(join(profiles_dir, '%s.prof' % profile_id))
+        info = {'profile_id': profile_id, 'handler': handler,
+                'method': method, 'uri': uri, 'user': user, 'status': status,
+                'date': now.strftime('%Y-%m-%d %H:%M:%S'),
+                'duration': duration,
+                'statements': [
+                    {'sql': sql, 'sql_args': repr(sql_args),
+                     'duration': seconds}
+                    for sql, sql_args, seconds in self._statements]}
+        with open(join(profiles_dir, '%s.json' % profile_id), 'w') as f:
+            json.dump(info, f)
+
+        # Remove the oldest profiles
+        for old_id in _list_profile_ids()[MAX_PROFILES:]:
+            for ext in ('prof', 'json'):
+                fp = join(profiles_dir, '%s.%s' % (old_id, ext))
+                if exists(fp):
+                    remove(fp)
+
+        return profile_id
+
+
+def _list_profile_ids():
+    """Returns the ids of the stored profiles, the most recent first"""
+    profiles_dir = get_profiles_dir()
+    if not exists(profiles_dir):
+        return []
+    return sorted((f[:-5] for f in listdir(profiles_dir)
+                   if f.endswith('.json')), reverse=True)
+
+
+def list_profiles():
+    """Returns the information of the stored profiles
+
+    Returns
+    -------
+    list of dict
+        The profiles with the structure:
+        [{'profile_id': str, 'handler': str, 'method': str, 'uri': str,
+          'user': str, 'status': int, 'date': str, 'duration': float,
+          'num_statements': int, 'statements_duration': float}]
+        The most recent profiles first
+    """
+    result = []
+    for profile_id in _list_profile_ids():
+        info = _load_info(profile_id)
+        statements = info.pop('statements')
+        info['num_statements'] = len(statements)
+        info['statements_duration'] = sum(s['duration'] for s in statements)
+        result.append(info)
+    return result
+
+
+def _load_info(profile_id):
+    with open(join(get_profiles_dir(), '%s.json' % profile_id)) as f:
+        return json.load(f)
+
+
+def load_profile(profile_id, sort_by='cumulative', num_functions=50):
+    """Returns a stored profile
+
+    Parameters
+    ----------
+    profile_id : str
+        The id of the profile
+    sort_by : str, optional
+        The pstats key to sort the functions by. Default: cumulative
+    num_functions : int, optional
+        The number of functions to report. Default: 50
+
+    Returns
+    -------
+    (dict, str)
+        The information of the profile, including its SQL statements, and
+        the report of its statistics
+
+    Raises
+    ------
+    ValueError
+        If the profile doesn't exist
+    """
+    if (not _PROFILE_ID_RE.match(profile_id) or
+            profile_id not in _list_profile_ids()):
+        raise ValueError('Profile %s does not exist' % profile_id)
+
+    info = _load_info(profile_id)
+    report = StringIO()
+    stats = Stats(join(get_profiles_dir(), '%s.prof' % profile_id),
+                  stream=report)
+    stats.sort_stats(sort_by).print_stats(num_functions)
+    return info, report.getvalue()
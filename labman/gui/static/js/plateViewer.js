@@ -32,6 +32,8 @@ function PlateViewer(target, plateId, processId, rows, cols) {
   this.plateId = null;
   this.processId = null;
   this._undoRedoBuffer = null;
+  // Cells changed while batching changes, see batchCellChanges
+  this._pendingCells = null;
   this.notes = null;
 
   var that = this;
@@ -94,6 +96,9 @@ PlateViewer.prototype.initialize = function (rows, cols) {
   this.rows = rows;
   this.cols = cols;
   this.data = [];
+  // The contents of the wells as stored in the server, used to revert the
+  // cells whose changes were rejected
+  this.serverData = [];
   this.frozenData = [];
   this.wellComments = [];
   this.wellPreviousPlates = [];
@@ -164,6 +169,7 @@ PlateViewer.prototype.initialize = function (rows, cols) {
 
   for (var i = 0; i < this.rows; i++) {
     var d = (this.data[i] = {});
+    var s = (this.serverData[i] = {});
     var c = (this.wellComments[i] = {});
     var cl = (this.wellClasses[i] = {});
     var pp = (this.wellPreviousPlates[i] = {});
@@ -172,6 +178,7 @@ PlateViewer.prototype.initialize = function (rows, cols) {
 
     for (var j = 0; j < this.cols; j++) {
       d[j] = null;
+      s[j] = null;
       c[j] = null;
       cl[j] = [];
       pp[j] = null;
@@ -227,11 +234,13 @@ PlateViewer.prototype.initialize = function (rows, cols) {
   $(document).keydown(function(e)
   {
     if (e.which == 90 && (e.ctrlKey || e.metaKey)) {    // CTRL + (shift) + Z
-      if (e.shiftKey){
-        that._undoRedoBuffer.redo();
-      } else {
-        that._undoRedoBuffer.undo();
-      }
+      that.batchCellChanges(function () {
+        if (e.shiftKey){
+          that._undoRedoBuffer.redo();
+        } else {
+          that._undoRedoBuffer.undo();
+        }
+      });
     }
     // ESC enters selection mode, so autoEdit should be turned off to allow
     // users to navigate between cells with the arrow keys
@@ -242,7 +251,11 @@ PlateViewer.prototype.initialize = function (rows, cols) {
 
   var pluginOptions = {
     clipboardCommandHandler: function(editCommand){
-      that._undoRedoBuffer.queueAndExecuteCommand.call(that._undoRedoBuffer,editCommand);
+      // A paste can change many cells at once, send them to the server in a
+      // single request
+      that.batchCellChanges(function () {
+        that._undoRedoBuffer.queueAndExecuteCommand.call(that._undoRedoBuffer,editCommand);
+      });
     },
     readOnlyMode : false,
     includeHeaderWhenCopying : false
@@ -262,8 +275,14 @@ PlateViewer.prototype.initialize = function (rows, cols) {
     var col = args.cell;
     var content = args.item[col];
 
-    // The plate already exists, simply plate the sample
-    that.modifyWell(row, col, content);
+    if (that._pendingCells !== null) {
+      // We are in the middle of a multi-cell change, the wells are modified
+      // once all the cells have changed
+      that._pendingCells.push({'row': row, 'col': col, 'content': content});
+    } else {
+      // The plate already exists, simply plate the sample
+      that.modifyWell(row, col, content);
+    }
   });
 
   // When the user right-clicks on a cell
@@ -338,6 +357,7 @@ PlateViewer.prototype.loadPlateLayout = function () {
     for (var i = 0; i < that.rows; i++) {
       for (var j = 0; j < that.cols; j++) {
         that.data[i][j] = data[i][j]['sample'];
+        that.serverData[i][j] = data[i][j]['sample'];
         that.wellComments[i][j] = data[i][j]['notes'];
         if (that.wellComments[i][j] !== null) {
           that.wellClasses[i][j].push('well-commented');
@@ -368,17 +388,9 @@ PlateViewer.prototype.modifyWell = function (row, col, content) {
          data: {'op': 'replace', 'path': '/well/' + (row + 1) + '/' + (col + 1) + '/sample', 'value': content},
          success: function (data) {
 
-           that.data[row][that.grid.getColumns()[col].field] = data['sample_id'];
+           that._applyWellResult(row, col, data);
            that.updateDuplicates();
            that.updateUnknown();
-           var classIdx = that.wellClasses[row][col].indexOf('well-prev-plated');
-           if (data['previous_plates'].length > 0) {
-             that.wellPreviousPlates[row][col] = data['previous_plates'];
-             addIfNotPresent(that.wellClasses[row][col], 'well-prev-plated');
-           } else {
-             safeArrayDelete(that.wellClasses[row][col], 'well-prev-plated');
-             that.wellPreviousPlates[row][col] = null;
-           }
 
            // here and in the rest of the source we use updateRow instead of
            // invalidateRow(s) and render so that we don't lose any active
@@ -386,11 +398,117 @@ PlateViewer.prototype.modifyWell = function (row, col, content) {
            that.grid.updateRow(row);
          },
          error: function (jqXHR, textStatus, errorThrown) {
+           that._revertWell(row, col);
+           that.grid.updateRow(row);
+           bootstrapAlert(jqXHR.responseText, 'danger');
+         }
+  });
+}
+
+/**
+ *
+ * Put back in a well the contents stored in the server
+ *
+ * @param {int} row The row of the well being reverted
+ * @param {int} col The column of the well being reverted
+ *
+ **/
+PlateViewer.prototype._revertWell = function (row, col) {
+  this.data[row][this.grid.getColumns()[col].field] = this.serverData[row][col];
+}
+
+/**
+ *
+ * Apply the sample returned by the server to a well
+ *
+ * @param {int} row The row of the well being modified
+ * @param {int} col The column of the well being modified
+ * @param {Object} data The result of the patch operation over the well
+ *
+ **/
+PlateViewer.prototype._applyWellResult = function (row, col, data) {
+  this.data[row][this.grid.getColumns()[col].field] = data['sample_id'];
+  this.serverData[row][col] = data['sample_id'];
+  if (data['previous_plates'].length > 0) {
+    this.wellPreviousPlates[row][col] = data['previous_plates'];
+    addIfNotPresent(this.wellClasses[row][col], 'well-prev-plated');
+  } else {
+    safeArrayDelete(this.wellClasses[row][col], 'well-prev-plated');
+    this.wellPreviousPlates[row][col] = null;
+  }
+}
+
+/**
+ *
+ * Modify the contents of multiple wells in a single request
+ *
+ * @param {Array} cells The cells being modified, as objects with row, col and
+ * content keys
+ *
+ **/
+PlateViewer.prototype.modifyWells = function (cells) {
+  var that = this;
+  if (cells.length === 0) {
+    return;
+  }
+  var operations = $.map(cells, function (cell) {
+    return {'op': 'replace',
+            'path': '/well/' + (cell.row + 1) + '/' + (cell.col + 1) + '/sample',
+            'value': cell.content};
+  });
+  $.ajax({url: '/process/sample_plating/' + this.processId + '/wells',
+         type: 'PATCH',
+         contentType: 'application/json-patch+json',
+         data: JSON.stringify(operations),
+         dataType: 'json',
+         success: function (data) {
+           // Each cell is accepted or rejected on its own
+           var errors = [];
+           $.each(cells, function (idx, cell) {
+             if (data[idx]['error'] !== undefined) {
+               that._revertWell(cell.row, cell.col);
+               errors.push(that.frozenData[cell.row]['header'] + (cell.col + 1) + ': ' + data[idx]['error']);
+             } else {
+               that._applyWellResult(cell.row, cell.col, data[idx]);
+             }
+           });
+           that.updateDuplicates();
+           that.updateUnknown();
+           that.updateAllRows();
+           if (errors.length > 0) {
+             bootstrapAlert(errors.join('<br>'), 'danger');
+           }
+         },
+         error: function (jqXHR, textStatus, errorThrown) {
+           $.each(cells, function (idx, cell) {
+             that._revertWell(cell.row, cell.col);
+           });
+           that.updateAllRows();
            bootstrapAlert(jqXHR.responseText, 'danger');
          }
   });
 }
 
+/**
+ *
+ * Execute a function that changes multiple cells, sending all the changes to
+ * the server in a single request once the function finishes
+ *
+ * @param {Function} func The function changing the cells
+ *
+ **/
+PlateViewer.prototype.batchCellChanges = function (func) {
+  var cells;
+  this._pendingCells = [];
+  try {
+    func();
+  } finally {
+    cells = this._pendingCells;
+    this._pendingCells = null;
+  }
+  this.modifyWells(cells);
+}
+
 /**
 **/
 PlateViewer.prototype.commentWell = function (row, col, comment) {
@@ -18,6 +18,22 @@ class TestIndexHandler(TestHandlerBase):
         self.assertNotEqual(response.body, '')
 
 
+class TestMetricsHandler(TestHandlerBase):
+    def test_get(self):
+        self.get('/')
+        response = self.get('/metrics')
+        self.assertEqual(response.code, 200)
+        self.assertTrue(
+            response.headers['Content-Type'].startswith('text/plain'))
+        obs = response.body.decode('utf-8')
+        self.assertIn('# TYPE labman_http_request_duration_seconds histogram',
+                      obs)
+        self.assertIn('labman_http_requests_total{handler="IndexHandler",'
+                      'method="GET",status="200"}', obs)
+        self.assertIn('labman_db_statements_total ', obs)
+        self.assertIn('labman_artifact_generation_seconds', obs)
+
+
 class TestNotFoundHandler(TestHandlerBase):
     def test_get(self):
         response = self.get('/TRIGGER404/')
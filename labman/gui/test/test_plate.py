@@ -617,6 +617,18 @@ class TestPlateHandlers(TestHandlerBase):
         self.assertEqual(len(obs_data), 4)
         self.assertEqual(obs_data[0], [21, 'Test plate 1'])
 
+        # Test paging the results
+        post_data['limit'] = 2
+        post_data['offset'] = 1
+        response = self.post('/plate_search', post_data)
+        self.assertEqual(response.code, 200)
+        obs = json_decode(response.body)
+        self.assertEqual(obs['data'], [[27, 'Test plate 2'],
+                                       [30, 'Test plate 3']])
+        post_data['limit'] = -1
+        response = self.post('/plate_search', post_data)
+        self.assertEqual(response.code, 400)
+
         # Test search by plate comment keywords:
         # It looks like none of the plates in the test database have
         # any notes, so it is necessary to add some to be able to
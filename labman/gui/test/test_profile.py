@@ -0,0 +1,66 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2017-, labman development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file LICENSE, distributed with this software.
+# ----------------------------------------------------------------------------
+
+from unittest import main
+from shutil import rmtree
+from tempfile import mkdtemp
+
+from mock import Mock, patch
+
+from labman.gui.testing import TestHandlerBase
+from labman.gui.handlers.base import BaseHandler
+from labman.gui.profiling import list_profiles
+from labman.db.settings import labman_settings
+from labman.db.user import User
+
+
+class TestProfileHandlers(TestHandlerBase):
+    def setUp(self):
+        super(TestProfileHandlers, self).setUp()
+        self.log_dir = mkdtemp()
+        patcher = patch.object(labman_settings, 'log_dir', self.log_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(rmtree, self.log_dir)
+
+    def test_profile_request(self):
+        # Only administrators can profile requests
+        response = self.get('/', {'__profile': '1'})
+        self.assertEqual(response.code, 200)
+        self.assertEqual(list_profiles(), [])
+
+        BaseHandler.get_current_user = Mock(
+            return_value=User('admin@foo.bar'))
+        response = self.get('/plates', {'__profile': '1'})
+        self.assertEqual(response.code, 200)
+        obs = list_profiles()
+        self.assertEqual(len(obs), 1)
+        self.assertEqual(obs[0]['handler'], 'PlateListingHandler')
+        self.assertEqual(obs[0]['method'], 'GET')
+        self.assertEqual(obs[0]['uri'], '/plates?__profile=1')
+        self.assertEqual(obs[0]['user'], 'admin@foo.bar')
+        self.assertEqual(obs[0]['status'], 200)
+
+        response = self.get('/admin/profiles')
+        self.assertEqual(response.code, 200)
+        self.assertIn(obs[0]['profile_id'].encode(), response.body)
+
+        response = self.get('/admin/profiles/%s' % obs[0]['profile_id'])
+        self.assertEqual(response.code, 200)
+        self.assertIn(b'PlateListingHandler', response.body)
+
+        response = self.get('/admin/profiles/20170101_Unknown_1')
+        self.assertEqual(response.code, 404)
+
+    def test_profile_list_handler_not_admin(self):
+        response = self.get('/admin/profiles')
+        self.assertEqual(response.code, 403)
+
+
+if __name__ == '__main__':
+    main()
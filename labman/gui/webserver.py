@@ -12,12 +12,15 @@ from uuid import uuid4
 
 import tornado
 
-from labman.gui.handlers.base import IndexHandler, NotFoundHandler
+from labman.db.settings import labman_settings
+from labman.gui.handlers.base import (
+    IndexHandler, MetricsHandler, NotFoundHandler)
 from labman.gui.handlers.auth import LoginHandler, LogoutHandler, AccessHandler
 from labman.gui.handlers.plate import (
     PlateMapHandler, PlateNameHandler, PlateHandler, PlateLayoutHandler,
     PlateSearchHandler, PlateListHandler, PlateListingHandler,
     PlateProcessHandler)
+from labman.gui.handlers.profile import ProfileListHandler, ProfileHandler
 from labman.gui.handlers.pool import (
     PoolListHandler, PoolHandler, PoolListingHandler)
 from labman.gui.handlers.study import (
@@ -32,7 +35,16 @@ from labman.gui.handlers.composition_handlers import COMPOSITION_ENDPOINTS
 
 
 class Application(tornado.web.Application):
-    def __init__(self):
+    """The labman web application
+
+    Parameters
+    ----------
+    debug : bool, optional
+        Whether to run in debug mode, which reloads the server when the code
+        changes and recompiles the templates on every request. It must be
+        False in production and when running several processes. Default: True
+    """
+    def __init__(self, debug=True):
         # Get the path to the folder that contain the templates and the static
         # files (such as images, css and js)
         dirpath = dirname(__file__)
@@ -42,6 +54,9 @@ class Application(tornado.web.Application):
         handlers = [(r"/", IndexHandler),
                     (r"/static/(.*)", tornado.web.StaticFileHandler,
                     {"path": static_path}),
+                    (r"/metrics", MetricsHandler),
+                    (r"/admin/profiles$", ProfileListHandler),
+                    (r"/admin/profiles/(.*)", ProfileHandler),
                     # Authorization handlers
                     (r"/auth/login/", LoginHandler),
                     (r"/auth/logout/", LogoutHandler),
@@ -83,13 +98,12 @@ class Application(tornado.web.Application):
 
         settings = {
             "template_path": templates_path,
-            # Currently setting debug to True, this can be changed to be
-            # sourced from a config file
-            "debug": True,
-            # We are generating the cookie_secret every time that the webserver
-            # is being reloaded, this can be sourced from the config file so
-            # webserver reboots doesn't log out the users
-            "cookie_secret": b64encode(uuid4().bytes + uuid4().bytes),
+            "debug": debug,
+            # If the cookie secret is not in the config file we generate it
+            # every time that the webserver is being reloaded, which logs out
+            # the users
+            "cookie_secret": (labman_settings.cookie_secret or
+                              b64encode(uuid4().bytes + uuid4().bytes)),
             "login_url": "/auth/login/"
         }
         tornado.web.Application.__init__(self, handlers, **settings)